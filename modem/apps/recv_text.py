@@ -6,14 +6,19 @@ CLI entry point for receiving text over the audio modem.
 
 from __future__ import annotations
 
+import queue
+import threading
 from pathlib import Path
-from typing import Iterable, Iterator
+from typing import Callable, Iterable, Iterator
 
 import numpy as np
 import typer
 
+from modem import batch
 from modem import config
+from modem import resample
 from modem import rx
+from modem import wav
 from time import monotonic
 
 # Optional rich-based formatting. Falls back to plain output if unavailable.
@@ -30,55 +35,88 @@ except Exception:  # pragma: no cover - graceful fallback
     _RICH_AVAILABLE = False
     _console = None  # type: ignore[assignment]
 
-try:  # pragma: no cover - dependency is expected to be available
-    from scipy.io import wavfile
-except ImportError as exc:  # pragma: no cover - fail with actionable guidance
-    raise RuntimeError(
-        "scipy is required for WAV decoding. Install the 'scipy' dependency."
-    ) from exc
-
 app = typer.Typer(help="Receive text payloads using the audio modem prototype.")
 
 
-def _load_waveform_from_wav(path: Path) -> np.ndarray:
+def _open_wav(path: Path) -> wav.WavReader:
     if not path.exists():
         raise typer.BadParameter(f"WAV file {path} does not exist.")
+    try:
+        return wav.WavReader(path)
+    except ValueError as exc:
+        raise typer.BadParameter(str(exc)) from exc
 
-    sample_rate, data = wavfile.read(path)
-    if sample_rate != config.SAMPLE_RATE:
-        raise typer.BadParameter(
-            f"WAV sample rate {sample_rate} Hz does not match expected {config.SAMPLE_RATE} Hz."
-        )
 
-    array = np.asarray(data)
-    if array.ndim == 2:
-        array = array[:, 0]
+_ChannelFrame = tuple[int, tuple[rx.FrameMetadata, rx.Header, bytes]]
+
+
+def _channel_decoder(
+    channels: int, processing_rate: int | None = None
+) -> Callable[[np.ndarray], Iterator[_ChannelFrame]]:
+    """Return a chunk handler yielding `(channel_index, frame)` for `channels` channels."""
+    if channels > 1:
+        return rx.MultiChannelFrameDecoder(
+            config.channel_plans(channels), processing_rate=processing_rate
+        ).ingest
+    decoder = rx.IncrementalFrameDecoder(processing_rate=processing_rate)
+
+    def ingest(chunk: np.ndarray) -> Iterator[_ChannelFrame]:
+        return ((0, frame) for frame in decoder.ingest(chunk))
+
+    return ingest
+
+
+def _decode_and_report(
+    chunks: Iterable[np.ndarray], *, channels: int = 1, processing_rate: int | None = None
+) -> None:
+    """Decode sample chunks one at a time and report each frame as soon as it decodes."""
+    ingest = _channel_decoder(channels, processing_rate)
+    _report_frames((item for chunk in chunks for item in ingest(chunk)), channels=channels)
 
-    if np.issubdtype(array.dtype, np.integer):
-        info = np.iinfo(array.dtype)
-        scale = max(abs(info.min), abs(info.max))
-        if scale == 0:
-            raise typer.BadParameter("WAV file contains invalid integer amplitude values.")
-        array = array.astype(np.float32) / float(scale)
-    else:
-        array = array.astype(np.float32)
-    return np.asarray(array, dtype=np.float32)
 
+def _report_frames(frames: Iterable[_ChannelFrame], *, channels: int = 1) -> None:
+    reassemblers = [rx.FrameReassembler() for _ in range(channels)]
+    decoded_any = False
+    for index, frame in frames:
+        decoded_any = True
+        _report_frame(frame, channel=index if channels > 1 else None)
+        _report_reassembled(reassemblers[index], frame)
 
-def _decode_and_report(samples: Iterable[float]) -> None:
-    frames = list(rx.decode_stream(samples))
-    if not frames:
+    if not decoded_any:
         if _RICH_AVAILABLE:
             _console.print(Panel(Text("No frames decoded.", style="bold red"), box=box.ROUNDED))
         else:
             typer.echo("No frames decoded.")
-        return
 
-    for frame in frames:
-        _report_frame(frame)
 
+def _report_reassembled(
+    reassembler: rx.FrameReassembler, frame: tuple[rx.FrameMetadata, rx.Header, bytes]
+) -> None:
+    """Feed a frame to the reassembler and report a completed multi-frame message."""
+    _, header, payload = frame
+    single_frame = reassembler.pending_fragments == 0
+    message = reassembler.push(header, payload)
+    # Single-frame messages were already shown in full by `_report_frame`.
+    if message is None or single_frame:
+        return
+    text = message.decode("utf-8", errors="replace")
+    if _RICH_AVAILABLE:
+        _console.print(
+            Panel(
+                Text(text, style="green"),
+                title="Message Reassembled",
+                title_align="left",
+                box=box.ROUNDED,
+                border_style="green",
+            )
+        )
+    else:
+        typer.echo(f"Message: {text}")
 
-def _report_frame(frame: tuple[rx.FrameMetadata, rx.Header, bytes]) -> None:
+
+def _report_frame(
+    frame: tuple[rx.FrameMetadata, rx.Header, bytes], *, channel: int | None = None
+) -> None:
     metadata, header, payload = frame
     try:
         text = payload.decode("utf-8")
@@ -89,6 +127,8 @@ def _report_frame(frame: tuple[rx.FrameMetadata, rx.Header, bytes]) -> None:
         stats = Table.grid(padding=(0, 1))
         stats.add_column(justify="right", style="bold cyan")
         stats.add_column()
+        if channel is not None:
+            stats.add_row("Channel", str(channel))
         stats.add_row("Baud", str(metadata.detected_baud))
         stats.add_row("Version", str(header.version))
         stats.add_row("Flags", f"0x{header.flags:02X}")
@@ -118,9 +158,10 @@ def _report_frame(frame: tuple[rx.FrameMetadata, rx.Header, bytes]) -> None:
             )
         )
     else:
+        prefix = f"channel={channel} " if channel is not None else ""
         typer.echo(
-            "Frame detected: baud=%d version=%d flags=0x%02X length=%d"
-            % (metadata.detected_baud, header.version, header.flags, header.length)
+            "Frame detected: %sbaud=%d version=%d flags=0x%02X length=%d"
+            % (prefix, metadata.detected_baud, header.version, header.flags, header.length)
         )
         typer.echo(f"Payload: {text}")
 
@@ -137,6 +178,30 @@ def main(
         "--open-channel",
         help="Continuously decode frames from the input device without stopping.",
     ),
+    channels: int = typer.Option(
+        1,
+        "--channels",
+        min=1,
+        help="Number of frequency-division channels to decode from the same input.",
+    ),
+    device_rate: int | None = typer.Option(
+        None,
+        "--device-rate",
+        min=1,
+        help="Open the input device at this rate and resample to the modem rate.",
+    ),
+    jobs: int = typer.Option(
+        1,
+        "--jobs",
+        min=1,
+        help="Decode a --wav-in recording on this many processes (overlapping segments).",
+    ),
+    processing_rate: int | None = typer.Option(
+        None,
+        "--processing-rate",
+        min=1,
+        help="Decimate the input to this rate (e.g. 12000 or 8000) before decoding.",
+    ),
 ) -> None:
     """
     Decode frames from a WAV file or live audio capture.
@@ -148,14 +213,42 @@ def main(
 
     if wav_in and open_channel:
         raise typer.BadParameter("--open-channel cannot be used with --wav-in.")
+    if jobs > 1 and (not wav_in or channels > 1):
+        raise typer.BadParameter("--jobs requires --wav-in and a single channel.")
+    try:
+        rx.check_processing_rate(
+            config.SAMPLE_RATE,
+            processing_rate or config.SAMPLE_RATE,
+            config.channel_plans(channels),
+        )
+    except ValueError as exc:
+        raise typer.BadParameter(str(exc)) from exc
+
+    if wav_in and jobs > 1:
+        path = Path(wav_in)
+        _open_wav(path).close()
+        frames = batch.decode_wav_parallel(path, jobs=jobs, processing_rate=processing_rate)
+        _report_frames((0, frame) for frame in frames)
+        return
 
     if wav_in:
-        waveform = _load_waveform_from_wav(Path(wav_in))
-        _decode_and_report(waveform)
+        # The file is memory-mapped and converted block by block, so recordings of any
+        # length decode in bounded memory.
+        with _open_wav(Path(wav_in)) as reader:
+            _decode_and_report(
+                reader.iter_chunks(output_rate=config.SAMPLE_RATE),
+                channels=channels,
+                processing_rate=processing_rate,
+            )
         return
 
     if open_channel:
-        _run_open_channel_listener(device=device)
+        _run_open_channel_listener(
+            device=device,
+            channels=channels,
+            device_rate=device_rate,
+            processing_rate=processing_rate,
+        )
         return
 
     if _RICH_AVAILABLE:
@@ -165,7 +258,7 @@ def main(
         typer.echo("Listening for frames... Press Ctrl+C to stop.")
     captured_chunks: list[np.ndarray] = []
     try:
-        for chunk in rx.read_from_microphone(device=device):
+        for chunk in rx.read_from_microphone(device=device, sample_rate=device_rate):
             captured_chunks.append(chunk)
     except KeyboardInterrupt:
         if _RICH_AVAILABLE:
@@ -180,11 +273,16 @@ def main(
             typer.echo("No audio captured.")
         return
 
-    waveform = np.concatenate(captured_chunks).astype(np.float32, copy=False)
-    _decode_and_report(waveform)
+    _decode_and_report(captured_chunks, channels=channels, processing_rate=processing_rate)
 
 
-def _run_open_channel_listener(*, device: str | None) -> None:
+def _run_open_channel_listener(
+    *,
+    device: str | None,
+    channels: int = 1,
+    device_rate: int | None = None,
+    processing_rate: int | None = None,
+) -> None:
     if _RICH_AVAILABLE:
         from rich.live import Live
         from rich.spinner import Spinner
@@ -209,35 +307,70 @@ def _run_open_channel_listener(*, device: str | None) -> None:
                 "[bold cyan]Last RSSI[/bold cyan]",
                 f"{last_rssi:.1f} dB" if last_rssi is not None else "—",
             )
+            metrics = capture.metrics
+            table.add_row(
+                "[bold cyan]Queue[/bold cyan]",
+                f"{metrics.queue_depth / capture.sample_rate:0.2f}s "
+                f"(max {metrics.max_queue_depth / capture.sample_rate:0.2f}s)",
+            )
+            table.add_row(
+                "[bold cyan]Overflows[/bold cyan]",
+                f"{metrics.input_overflows} (dropped {metrics.dropped_samples})",
+            )
+            table.add_row(
+                "[bold cyan]Callback latency[/bold cyan]",
+                f"{metrics.last_callback_latency * 1000:0.1f} ms "
+                f"(max {metrics.max_callback_latency * 1000:0.1f} ms)",
+            )
             return Panel(table, title="Live", border_style="bright_blue", box=box.ROUNDED)
 
-        # Use an incremental decoder so we can inspect chunks and update live view.
-        decoder = rx.IncrementalFrameDecoder()
-        try:
-            with Live(_render_live(), console=_console, refresh_per_second=10, transient=False) as live:
-                for chunk in rx.read_from_microphone(device=device):
+        # The capture callback only fills a ring; a decode thread drains it and hands frames
+        # to this thread, so a slow panel refresh cannot stall the input stream.
+        capture = rx.CallbackCapture(device=device, sample_rate=device_rate or config.SAMPLE_RATE)
+        decoded: queue.Queue[_ChannelFrame | None] = queue.Queue()
+
+        def _decode_worker() -> None:
+            nonlocal last_activity
+            ingest = _channel_decoder(channels, processing_rate)
+            try:
+                chunks = resample.resample_chunks(
+                    capture.chunks(), capture.sample_rate, config.SAMPLE_RATE
+                )
+                for chunk in chunks:
                     # Hint when a possible start tone is present.
+                    if rx.detect_start_tone(chunk):
+                        last_activity = "Possible frame detected — syncing..."
+                    for item in ingest(chunk):
+                        decoded.put(item)
+            finally:
+                decoded.put(None)
+
+        reassemblers = [rx.FrameReassembler() for _ in range(channels)]
+        worker = threading.Thread(target=_decode_worker, name="modem-decode", daemon=True)
+        try:
+            with capture, Live(
+                _render_live(), console=_console, refresh_per_second=10, transient=False
+            ) as live:
+                worker.start()
+                while True:
                     try:
-                        if rx.detect_start_tone(chunk):
-                            last_activity = "Possible frame detected — syncing..."
-                            live.update(_render_live())
-                    except Exception:
-                        pass
-                    for frame in decoder.ingest(chunk):
-                        decoded_any = True
-                        frame_count += 1
-                        last_activity = "Frame decoded!"
-                        # Update last-baud/RSSI for live panel
-                        try:
-                            meta = frame[0]
-                            last_baud = getattr(meta, "detected_baud", None)
-                            last_rssi = getattr(meta, "rssi", None)
-                        except Exception:
-                            pass
-                        live.update(_render_live())
-                        _report_frame(frame)
-                        last_activity = "Listening for frames..."
+                        item = decoded.get(timeout=0.1)
+                    except queue.Empty:
                         live.update(_render_live())
+                        continue
+                    if item is None:
+                        break
+                    index, frame = item
+                    decoded_any = True
+                    frame_count += 1
+                    last_activity = "Frame decoded!"
+                    last_baud = frame[0].detected_baud
+                    last_rssi = frame[0].rssi
+                    live.update(_render_live())
+                    _report_frame(frame, channel=index if channels > 1 else None)
+                    _report_reassembled(reassemblers[index], frame)
+                    last_activity = "Listening for frames..."
+                    live.update(_render_live())
         except KeyboardInterrupt:
             _console.print("Stopping open-channel listener.", style="yellow")
         finally:
@@ -246,10 +379,18 @@ def _run_open_channel_listener(*, device: str | None) -> None:
     else:
         typer.echo("Open-channel listening... Press Ctrl+C to stop.")
         decoded_any = False
+        reassemblers = [rx.FrameReassembler() for _ in range(channels)]
         try:
-            for frame in _iterate_stream_frames(device=device):
+            frames = _iterate_stream_frames(
+                device=device,
+                channels=channels,
+                device_rate=device_rate,
+                processing_rate=processing_rate,
+            )
+            for index, frame in frames:
                 decoded_any = True
-                _report_frame(frame)
+                _report_frame(frame, channel=index if channels > 1 else None)
+                _report_reassembled(reassemblers[index], frame)
         except KeyboardInterrupt:
             typer.echo("Stopping open-channel listener.")
         finally:
@@ -258,9 +399,16 @@ def _run_open_channel_listener(*, device: str | None) -> None:
 
 
 def _iterate_stream_frames(
-    *, device: str | None
-) -> Iterator[tuple[rx.FrameMetadata, rx.Header, bytes]]:
-    yield from rx.stream_frames_from_microphone(device=device)
+    *,
+    device: str | None,
+    channels: int = 1,
+    device_rate: int | None = None,
+    processing_rate: int | None = None,
+) -> Iterator[_ChannelFrame]:
+    ingest = _channel_decoder(channels, processing_rate)
+    chunks = rx.read_from_microphone(device=device, capture="callback", sample_rate=device_rate)
+    for chunk in chunks:
+        yield from ingest(chunk)
 
 
 if __name__ == "__main__":
@@ -1,5 +1,5 @@
 """
-CLI to decode CSS modem waveforms from WAV files.
+CLI to decode CSS modem frames from WAV files or a live input device.
 """
 
 from __future__ import annotations
@@ -16,72 +16,27 @@ from rich.table import Table
 from modem import config
 from modem import css
 from modem import css_rx
-
-try:  # pragma: no cover - dependency should be available
-    from scipy.io import wavfile
-except ImportError as exc:  # pragma: no cover - fail with actionable guidance
-    raise RuntimeError("scipy is required for WAV decoding. Install the 'scipy' extra.") from exc
+from modem import framing
+from modem import rx
+from modem import wav
 
 _console = Console()
 
-app = typer.Typer(help="Decode CSS acoustic modem frames from WAV files.")
+app = typer.Typer(help="Decode CSS acoustic modem frames from WAV files or a microphone.")
 
 
-def _load_waveform(path: Path) -> np.ndarray:
+def _open_wav(path: Path) -> wav.WavReader:
     if not path.exists():
         raise typer.BadParameter(f"WAV file {path} does not exist.")
-
-    sample_rate, data = wavfile.read(path)
-    if sample_rate != config.SAMPLE_RATE:
-        raise typer.BadParameter(
-            f"WAV sample rate {sample_rate} Hz does not match expected {config.SAMPLE_RATE} Hz."
-        )
-
-    array = np.asarray(data)
-    if array.ndim == 2:
-        array = array[:, 0]
-
-    if np.issubdtype(array.dtype, np.integer):
-        info = np.iinfo(array.dtype)
-        scale = max(abs(info.min), abs(info.max))
-        if scale == 0:
-            raise typer.BadParameter("WAV file contains invalid integer amplitude values.")
-        array = array.astype(np.float32) / float(scale)
-    else:
-        array = array.astype(np.float32)
-    return np.asarray(array, dtype=np.float32)
+    try:
+        return wav.WavReader(path)
+    except ValueError as exc:
+        raise typer.BadParameter(str(exc)) from exc
 
 
-@app.command()
-def main(
-    wav_in: str = typer.Argument(..., help="Path to a WAV file containing a CSS frame."),
-    sf: int = typer.Option(config.CSS_DEFAULT_SF, "--sf", min=1, help="Spreading factor."),
-    bw: float = typer.Option(config.CSS_DEFAULT_BW, "--bw", help="Chirp bandwidth (Hz)."),
-    center: float = typer.Option(
-        config.CSS_DEFAULT_CENTER, "--center", help="Chirp center frequency (Hz)."
-    ),
-    tones: bool = typer.Option(False, "--tones/--no-tones", help="Waveform includes start/end tones."),
+def _report_frame(
+    metadata: css_rx.CSSFrameMetadata, header: framing.Header, payload: bytes
 ) -> None:
-    """
-    Decode a single CSS frame from the provided WAV file.
-    """
-    waveform = _load_waveform(Path(wav_in).expanduser().resolve())
-    params = css.ChirpParams(
-        sf=sf,
-        bw=bw,
-        fc=center,
-        preamble_up=config.CSS_DEFAULT_PREAMBLE_UP,
-        preamble_down=config.CSS_DEFAULT_PREAMBLE_DOWN,
-    )
-
-    metadata, header, payload = css_rx.decode_css_waveform(
-        waveform,
-        params,
-        includes_preamble=True,
-        includes_sync=True,
-        includes_tones=tones,
-    )
-
     try:
         text = payload.decode("utf-8")
         payload_repr = text
@@ -100,12 +55,101 @@ def main(
     info.add_row("Detected BW", f"{metadata.detected_bw:.1f} Hz")
     if metadata.rssi is not None:
         info.add_row("RSSI", f"{metadata.rssi:.1f} dB")
+    if metadata.cfo_hz is not None:
+        info.add_row("Freq. offset", f"{metadata.cfo_hz:+.2f} Hz")
 
     _console.print(Panel(info, title="CSS Frame", border_style="bright_blue", box=box.ROUNDED))
     _console.print(Panel(payload_repr, title="Payload", border_style="green", style=payload_style))
 
 
-if __name__ == "__main__":
-    app()
+@app.command()
+def main(
+    wav_in: str | None = typer.Argument(
+        None,
+        help="Optional WAV file containing CSS frames; listens on the input device if omitted.",
+    ),
+    sf: int = typer.Option(config.CSS_DEFAULT_SF, "--sf", min=1, help="Spreading factor."),
+    bw: float = typer.Option(config.CSS_DEFAULT_BW, "--bw", help="Chirp bandwidth (Hz)."),
+    center: float = typer.Option(
+        config.CSS_DEFAULT_CENTER, "--center", help="Chirp center frequency (Hz)."
+    ),
+    fec: bool = typer.Option(False, "--fec/--no-fec", help="Frames use convolutional FEC."),
+    interleave: int = typer.Option(
+        1, "--interleave", min=1, help="Bit interleave depth used by the sender (FEC modes)."
+    ),
+    device: str | None = typer.Option(None, "--device", help="Audio input device identifier."),
+    device_rate: int | None = typer.Option(
+        None,
+        "--device-rate",
+        min=1,
+        help="Open the input device at this rate and resample to the modem rate.",
+    ),
+    aligned: bool = typer.Option(
+        False,
+        "--aligned/--streaming",
+        help="Decode a single frame that starts exactly at the beginning of the WAV file.",
+    ),
+    tones: bool = typer.Option(
+        False, "--tones/--no-tones", help="Aligned waveform includes start/end tones."
+    ),
+) -> None:
+    """
+    Decode CSS frames from a WAV file or, without one, from the audio input device.
+    """
+    params = css.ChirpParams(
+        sf=sf,
+        bw=bw,
+        fc=center,
+        preamble_up=config.CSS_DEFAULT_PREAMBLE_UP,
+        preamble_down=config.CSS_DEFAULT_PREAMBLE_DOWN,
+    )
+
+    if wav_in is None:
+        if aligned:
+            raise typer.BadParameter("--aligned requires a WAV file.")
+        _console.print("[bold cyan]Listening for CSS frames (Ctrl+C to stop)...[/]")
+        try:
+            for frame in css_rx.stream_css_frames_from_chunks(
+                rx.read_from_microphone(
+                    device=device, capture="callback", sample_rate=device_rate
+                ),
+                params,
+                fec_enabled=fec,
+                interleave_depth=interleave,
+            ):
+                _report_frame(*frame)
+        except KeyboardInterrupt:
+            _console.print("[bold yellow]Stopped listening.[/]")
+        return
+
+    reader = _open_wav(Path(wav_in).expanduser().resolve())
+    if aligned:
+        _report_frame(
+            *css_rx.decode_css_waveform(
+                np.concatenate(list(reader.iter_chunks(output_rate=config.SAMPLE_RATE))),
+                params,
+                includes_preamble=True,
+                includes_sync=True,
+                includes_tones=tones,
+                fec_enabled=fec,
+                interleave_depth=interleave,
+            )
+        )
+        return
 
+    found = False
+    for frame in css_rx.stream_css_frames_from_chunks(
+        reader.iter_chunks(output_rate=config.SAMPLE_RATE),
+        params,
+        fec_enabled=fec,
+        interleave_depth=interleave,
+    ):
+        _report_frame(*frame)
+        found = True
+    if not found:
+        _console.print("[bold red]No CSS frames found in the WAV file.[/]")
+        raise typer.Exit(code=1)
 
+
+if __name__ == "__main__":
+    app()
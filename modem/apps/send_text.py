@@ -6,11 +6,14 @@ from __future__ import annotations
 
 import typer
 
+from collections.abc import Iterator
 from pathlib import Path
 
+import numpy as np
+
 from modem import config
-from modem.framing import Header
-from modem.tx import assemble_transmission, play_audio, write_wav
+from modem.framing import split_payload
+from modem.tx import TransmitQueue, play_audio, write_wav
 
 # Rich is an explicit dependency; use it for friendly terminal output.
 from rich.console import Console
@@ -28,31 +31,58 @@ app = typer.Typer(help="Transmit text payloads using the audio modem prototype."
 def main(
     message: str = typer.Argument(..., help="UTF-8 text message to transmit."),
     baud: int = typer.Option(200, "--baud", help="Symbol rate for the transmission."),
-    repeats: int = typer.Option(1, "--repeats", min=1, help="Number of times to repeat the frame."),
+    repeats: int = typer.Option(
+        1, "--repeats", min=1, help="Number of times to repeat the message."
+    ),
     device: str | None = typer.Option(None, "--device", help="Audio output device identifier."),
     wav_out: str | None = typer.Option(None, "--wav-out", help="Optional WAV file destination."),
+    max_payload: int = typer.Option(
+        config.MAX_FRAME_PAYLOAD,
+        "--max-payload",
+        min=4,
+        max=0xFFFF,
+        help="Maximum payload bytes per frame; longer messages are sent as several frames.",
+    ),
+    channel: int = typer.Option(
+        0,
+        "--channel",
+        min=0,
+        help="Frequency-division channel; tones move up by the channel spacing per index.",
+    ),
 ) -> None:
     """
     Play back an encoded frame containing the provided message.
     """
     if baud not in config.BAUD_TO_RATE_CODE:
         raise typer.BadParameter(f"Unsupported baud: {baud}. Choose from {config.BAUD_RATES}.")
+    try:
+        channel_plan = config.channel_plans(channel + 1)[channel]
+    except ValueError as exc:
+        raise typer.BadParameter(str(exc)) from exc
 
     payload = message.encode("utf-8")
-    header = Header(
-        version=config.DEFAULT_VERSION,
-        rate_code=config.BAUD_TO_RATE_CODE[baud],
-        flags=config.DEFAULT_FLAGS,
-        length=len(payload),
-    )
-
-    waveform = assemble_transmission(message, header=header, repeats=repeats)
+    try:
+        frame_count = len(split_payload(payload, max_payload))
+    except ValueError as exc:
+        raise typer.BadParameter(str(exc)) from exc
+
+    def transmission_blocks() -> Iterator[np.ndarray]:
+        # Frames are queued up front; synthesis of each frame happens lazily while the
+        # previous one is playing or being written.
+        tx_queue = TransmitQueue(baud=baud, max_payload=max_payload, channel=channel_plan)
+        for _ in range(repeats):
+            tx_queue.put_bytes(payload)
+        tx_queue.close()
+        return tx_queue.blocks()
 
     info = Table.grid(padding=(0, 1))
     info.add_column(justify="right", style="bold cyan")
     info.add_column()
     info.add_row("Bytes", str(len(payload)))
+    info.add_row("Frames", str(frame_count))
     info.add_row("Baud", str(baud))
+    if channel:
+        info.add_row("Channel", f"{channel} (mark {channel_plan.mark:.0f} Hz)")
     info.add_row("Repeats", str(repeats))
     if device:
         info.add_row("Device", device)
@@ -63,11 +93,11 @@ def main(
 
     if wav_out is not None:
         destination = Path(wav_out).expanduser().resolve()
-        write_wav(waveform, destination)
+        write_wav(transmission_blocks(), destination)
         _console.print(f"Wrote WAV to {destination}", style="green")
 
     with Status("Playing audio...", console=_console, spinner="dots"):
-        play_audio(waveform, device=device)
+        play_audio(transmission_blocks(), device=device)
 
     _console.print(Panel("Transmission complete.", style="green", box=box.ROUNDED))
 
@@ -77,7 +77,7 @@ def main(
     info.add_row("Bandwidth", f"{bw:.1f} Hz")
     info.add_row("Center", f"{center:.1f} Hz")
     info.add_row("Repeats", str(repeats))
-    info.add_row("FEC", "on" if fec else "off")
+    info.add_row("FEC", f"on (interleave {interleave})" if fec else "off")
     if wav_out:
         info.add_row("WAV Out", str(Path(wav_out).expanduser()))
     if device:
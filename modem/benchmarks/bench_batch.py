@@ -0,0 +1,66 @@
+"""
+Scaling of parallel offline WAV decoding with the number of worker processes.
+
+Writes a synthetic recording with a frame every few seconds to a temporary file and decodes
+it with `batch.decode_wav_parallel` for 1, 2, 4, ... jobs up to the CPU count.
+
+Run with `uv run python benchmarks/bench_batch.py [minutes]`.
+"""
+
+from __future__ import annotations
+
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import numpy as np
+
+from modem import batch
+from modem import config
+from modem.framing import Header
+from modem.tx import iter_transmission_blocks, write_wav
+
+
+def _recording(minutes: float) -> np.ndarray:
+    message = "archived beacon"
+    header = Header(
+        version=config.DEFAULT_VERSION,
+        rate_code=config.BAUD_TO_RATE_CODE[200],
+        flags=config.DEFAULT_FLAGS,
+        length=len(message),
+    )
+    frame = np.concatenate(list(iter_transmission_blocks(message, header=header)))
+    period = 5 * config.SAMPLE_RATE
+    waveform = np.zeros(int(minutes * 60 * config.SAMPLE_RATE), dtype=np.float32)
+    for offset in range(0, waveform.size - frame.size, period):
+        waveform[offset : offset + frame.size] = frame
+    return waveform
+
+
+def main() -> None:
+    minutes = float(sys.argv[1]) if len(sys.argv) > 1 else 10.0
+    waveform = _recording(minutes)
+    expected = (waveform.size - 1) // (5 * config.SAMPLE_RATE) + 1
+    with tempfile.TemporaryDirectory() as directory:
+        path = Path(directory) / "recording.wav"
+        write_wav(waveform, path)
+        del waveform
+        jobs = 1
+        baseline = None
+        while jobs <= (os.cpu_count() or 1):
+            started = time.perf_counter()
+            count = sum(1 for _ in batch.decode_wav_parallel(path, jobs=jobs))
+            elapsed = time.perf_counter() - started
+            baseline = baseline or elapsed
+            print(
+                f"{minutes:5.1f} min  jobs {jobs:3d}  frames {count}/{expected}  "
+                f"{elapsed:7.2f} s  {minutes * 60 / elapsed:7.1f}x real time  "
+                f"speed-up {baseline / elapsed:5.2f}x"
+            )
+            jobs *= 2
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,44 @@
+"""
+Micro-benchmark for the CRC-16-CCITT implementations in `modem.framing`.
+
+Run with `uv run python benchmarks/bench_crc.py`.
+"""
+
+from __future__ import annotations
+
+import timeit
+
+import numpy as np
+
+from modem import framing
+
+
+def main() -> None:
+    rng = np.random.default_rng(0)
+    for size in (16, 128, 519):
+        payload = rng.integers(0, 256, size=size, dtype=np.uint8).tobytes()
+        loops = 2_000
+        bitwise = timeit.timeit(lambda: framing._crc16_ccitt_bitwise(payload), number=loops)
+        table = timeit.timeit(lambda: framing.crc16_ccitt(payload), number=loops)
+        print(
+            f"{size:4d} B  bitwise {1e6 * bitwise / loops:8.1f} us  "
+            f"table {1e6 * table / loops:7.1f} us  speed-up {bitwise / table:5.1f}x"
+        )
+
+    for candidates in (16, 256):
+        rows = rng.integers(0, 256, size=(candidates, 128), dtype=np.uint8)
+        lengths = rng.integers(8, 128, size=candidates)
+        loops = 100
+        scalar = timeit.timeit(
+            lambda: [framing.crc16_ccitt(row[:n].tobytes()) for row, n in zip(rows, lengths)],
+            number=loops,
+        )
+        batch = timeit.timeit(lambda: framing.crc16_ccitt_batch(rows, lengths), number=loops)
+        print(
+            f"{candidates:4d} alignments  table loop {1e6 * scalar / loops:8.1f} us  "
+            f"batch {1e6 * batch / loops:7.1f} us  speed-up {scalar / batch:5.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,81 @@
+"""
+Throughput of the CSS symbol demodulators in `modem.css_rx`, SF7 through SF12.
+
+Reports the per-symbol FFT correlator, the batched `demod_symbols` path and, where it fits in
+memory, the reference template-matrix correlator.
+
+Run with `uv run python benchmarks/bench_css_demod.py`. The template-matrix correlator is
+skipped above SF9, where its `(M, Ns)` float32 matrix grows past 200 MB.
+"""
+
+from __future__ import annotations
+
+import time
+
+import numpy as np
+
+from modem import config
+from modem import css
+from modem import css_rx
+
+_CORRELATOR_MAX_SF = 9
+
+
+def _symbols_per_second(demodulate, symbols: np.ndarray) -> float:
+    demodulate(symbols[0])  # warm caches outside the timed region
+    start = time.perf_counter()
+    for segment in symbols:
+        demodulate(segment)
+    return symbols.shape[0] / (time.perf_counter() - start)
+
+
+def main() -> None:
+    rng = np.random.default_rng(0)
+    for sf in range(7, 13):
+        params = css.ChirpParams(
+            sf=sf, bw=config.CSS_DEFAULT_BW, fc=config.CSS_DEFAULT_CENTER
+        )
+        count = max(4, 64 >> max(0, sf - 7))
+        reference = css.generate_reference_chirp(params)
+        window = css._raised_cosine_window(params)
+        symbols = np.stack(
+            [
+                css._synthesize_symbol_waveform(int(shift), reference, window, params)
+                for shift in rng.integers(0, params.M, size=count)
+            ]
+        )
+
+        fft_rate = _symbols_per_second(
+            lambda segment: css_rx.demod_symbol_fft(segment, params), symbols
+        )
+        css_rx.demod_symbols(symbols[:1], params)
+        start = time.perf_counter()
+        for _ in range(3):
+            css_rx.demod_symbols(symbols, params)
+        batch_rate = 3 * count / (time.perf_counter() - start)
+        line = (
+            f"SF{sf:<2d} Ns={params.Ns:7d}  fft {fft_rate:9.1f} sym/s"
+            f"  batch {batch_rate:9.1f} sym/s"
+        )
+
+        if sf <= _CORRELATOR_MAX_SF:
+            templates = css_rx._build_symbol_templates(reference, window, params)
+            energy = np.linalg.norm(templates, axis=1)
+            correlator_rate = _symbols_per_second(
+                lambda segment: css_rx.demod_symbol(
+                    segment, templates=templates, template_energy=energy
+                ),
+                symbols,
+            )
+            line += (
+                f"  correlator {correlator_rate:9.1f} sym/s"
+                f"  ({templates.nbytes / 1e6:6.1f} MB templates)"
+                f"  speed-up {fft_rate / correlator_rate:5.1f}x"
+            )
+        else:
+            line += "  correlator skipped"
+        print(line)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,66 @@
+"""
+End-to-end throughput of CSS frame assembly and decoding with and without convolutional FEC.
+
+Also compares the table-driven encoder in `modem.fec_conv` with the bit-at-a-time reference.
+
+Run with `uv run python benchmarks/bench_css_fec.py`.
+"""
+
+from __future__ import annotations
+
+import timeit
+
+import numpy as np
+
+from modem import config
+from modem import css
+from modem import css_rx
+from modem import fec_conv
+from modem import framing
+
+
+def main() -> None:
+    rng = np.random.default_rng(0)
+    for size in (64, 512, 4096):
+        bits = rng.integers(0, 2, size=8 * size)
+        loops = max(1, 1024 // size)
+        reference = timeit.timeit(
+            lambda: fec_conv._conv_encode_reference(bits.tolist()), number=loops
+        )
+        table = timeit.timeit(lambda: fec_conv.conv_encode_array(bits), number=loops)
+        print(
+            f"{size:5d} B  encode reference {1e3 * reference / loops:7.2f} ms  "
+            f"table {1e3 * table / loops:6.3f} ms  speed-up {reference / table:6.1f}x"
+        )
+
+    params = css.ChirpParams(
+        sf=config.CSS_DEFAULT_SF, bw=config.CSS_DEFAULT_BW, fc=config.CSS_DEFAULT_CENTER
+    )
+    for size in (16, 128, 512):
+        message = "".join(chr(value) for value in rng.integers(0x41, 0x5B, size=size))
+        header = framing.Header(version=config.DEFAULT_VERSION, rate_code=0, flags=0, length=size)
+        for fec in (False, True):
+            options = {"fec_enabled": fec, "interleave_depth": 16 if fec else 1}
+            waveform = css.assemble_css_transmission(
+                message, header=header, params=params, **options
+            )
+            loops = 3
+            assemble = timeit.timeit(
+                lambda: css.assemble_css_transmission(
+                    message, header=header, params=params, **options
+                ),
+                number=loops,
+            )
+            decode = timeit.timeit(
+                lambda: css_rx.decode_css_waveform(waveform, params, **options), number=loops
+            )
+            print(
+                f"{size:5d} B  FEC {'on ' if fec else 'off'}  "
+                f"airtime {waveform.size / params.fs:6.1f} s  "
+                f"assemble {size * loops / assemble / 1e3:7.1f} kB/s  "
+                f"decode {size * loops / decode / 1e3:7.1f} kB/s"
+            )
+
+
+if __name__ == "__main__":
+    main()
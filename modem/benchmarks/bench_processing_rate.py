@@ -0,0 +1,77 @@
+"""
+CPU cost of frame decoding at the full sample rate and at decimated processing rates.
+
+Builds a noisy recording with frames at every baud rate, decodes it with
+`rx.IncrementalFrameDecoder` at `config.SAMPLE_RATE`, 12 kHz and 8 kHz, and reports the CPU
+time spent per second of audio and the baud candidates searched per decoded frame. The
+decimated runs must decode exactly the same frames.
+
+Run with `uv run python benchmarks/bench_processing_rate.py [seconds]`.
+"""
+
+from __future__ import annotations
+
+import sys
+import time
+
+import numpy as np
+
+from modem import config
+from modem.framing import Header
+from modem.rx import IncrementalFrameDecoder
+from modem.tx import assemble_transmission
+
+_PROCESSING_RATES = (config.SAMPLE_RATE, 12_000, 8_000)
+_CHUNK_SAMPLES = 1 << 15
+
+
+def _recording(seconds: float) -> np.ndarray:
+    rng = np.random.default_rng(3)
+    frames = []
+    for baud in config.BAUD_RATES:
+        message = f"benchmark frame at {baud} baud"
+        header = Header(
+            version=config.DEFAULT_VERSION,
+            rate_code=config.BAUD_TO_RATE_CODE[baud],
+            flags=config.DEFAULT_FLAGS,
+            length=len(message),
+        )
+        frames.append(np.asarray(assemble_transmission(message, header=header)))
+    waveform = 0.05 * rng.normal(size=int(seconds * config.SAMPLE_RATE))
+    offset = config.SAMPLE_RATE
+    index = 0
+    while offset + frames[index].size < waveform.size:
+        waveform[offset : offset + frames[index].size] += frames[index]
+        offset += frames[index].size + config.SAMPLE_RATE
+        index = (index + 1) % len(frames)
+    return waveform.astype(np.float32)
+
+
+def _decode(waveform: np.ndarray, processing_rate: int) -> tuple[float, list[tuple], int]:
+    decoder = IncrementalFrameDecoder(processing_rate=processing_rate)
+    started = time.process_time()
+    frames = [
+        (metadata.detected_baud, header, payload)
+        for start in range(0, waveform.size, _CHUNK_SAMPLES)
+        for metadata, header, payload in decoder.ingest(waveform[start : start + _CHUNK_SAMPLES])
+    ]
+    return time.process_time() - started, frames, decoder.parse_attempts
+
+
+def main() -> None:
+    seconds = float(sys.argv[1]) if len(sys.argv) > 1 else 60.0
+    waveform = _recording(seconds)
+    reference: list[tuple] | None = None
+    for processing_rate in _PROCESSING_RATES:
+        elapsed, frames, attempts = _decode(waveform, processing_rate)
+        reference = frames if reference is None else reference
+        print(
+            f"{processing_rate:6d} Hz  frames {len(frames):3d}  "
+            f"{1000 * elapsed / seconds:7.2f} ms CPU per second of audio  "
+            f"attempts/frame {attempts / max(len(frames), 1):4.2f}  "
+            f"identical {frames == reference}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,48 @@
+"""
+Micro-benchmark for the Viterbi decoders in `modem.fec_conv`.
+
+Run with `uv run python benchmarks/bench_viterbi.py`.
+"""
+
+from __future__ import annotations
+
+import timeit
+
+import numpy as np
+
+from modem import fec_conv
+
+
+def main() -> None:
+    rng = np.random.default_rng(0)
+    for size in (64, 512, 4096):
+        bits = rng.integers(0, 2, size=8 * size).tolist()
+        encoded = fec_conv.conv_encode(bits)
+        soft = fec_conv.soft_bits(encoded, rng.uniform(0.5, 1.0, size=len(encoded)))
+        reference_loops = max(1, 256 // size)
+        loops = max(3, 4096 // size)
+        reference = min(
+            timeit.repeat(
+                lambda: fec_conv._viterbi_decode_hard_reference(encoded),
+                number=reference_loops,
+                repeat=3,
+            )
+        )
+        hard = min(
+            timeit.repeat(lambda: fec_conv.viterbi_decode_hard(encoded), number=loops, repeat=3)
+        )
+        soft_time = min(
+            timeit.repeat(lambda: fec_conv.viterbi_decode_soft(soft), number=loops, repeat=3)
+        )
+        reference /= reference_loops
+        hard /= loops
+        soft_time /= loops
+        print(
+            f"{size:5d} B  reference {1e3 * reference:8.1f} ms  "
+            f"vectorized {1e3 * hard:6.2f} ms  soft {1e3 * soft_time:6.2f} ms  "
+            f"speed-up {reference / hard:5.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -8,8 +8,12 @@ The modules inside provide the following responsibilities:
 - `afsk`: Audio Frequency-Shift Keying primitives for synthesis and demodulation.
 - `tx`: High-level transmission helpers (playback, WAV emission).
 - `rx`: Receive pipeline with tone detection and frame parsing.
+- `async_rx`: Asyncio frame receiver that offloads decoding to an executor.
 - `crypto`: Optional ChaCha20-Poly1305 helpers and key handling.
-- `utils`: Utility helpers for bit/byte conversion and window shaping.
+- `resample`: Streaming polyphase resampling between source and modem sample rates.
+- `wav`: Memory-mapped, block-wise WAV input.
+- `batch`: Parallel offline decoding of long recordings across processes.
+- `utils`: Utility helpers for bit/byte conversion, window shaping, and sample buffering.
 """
 
 from __future__ import annotations
@@ -21,8 +25,12 @@ __all__ = [
     "css",
     "tx",
     "rx",
+    "async_rx",
     "crypto",
     "utils",
+    "resample",
+    "wav",
+    "batch",
     "fec_conv",
 ]
 
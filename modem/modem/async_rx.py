@@ -0,0 +1,167 @@
+"""
+Asyncio receive API for the audio modem.
+
+`AsyncFrameReceiver` wraps any chunk decoder (`rx.IncrementalFrameDecoder`,
+`rx.MultiChannelFrameDecoder`, `css_rx.IncrementalCSSDecoder`) so frames can be consumed
+with `async for`. NumPy work and blocking sources run in an executor, so one event loop can
+serve many links without a dedicated thread per link.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+from collections.abc import AsyncIterable, AsyncIterator, Callable, Iterable, Iterator
+from concurrent.futures import Executor
+from typing import Any, Protocol
+
+import numpy as np
+
+from .rx import IncrementalFrameDecoder
+
+# Marks the end of the frame queue; also returned by `next` when a sync source is exhausted.
+_END = object()
+
+
+class ChunkDecoder(Protocol):
+    """Anything that turns sample chunks into decoded frames."""
+
+    def ingest(self, samples: np.ndarray) -> Iterator[Any]: ...
+
+
+class AsyncFrameReceiver:
+    """
+    Asynchronous iterator over the frames decoded from a stream of sample chunks.
+
+    `source` may be an async iterable or a plain iterable of float32 chunks, such as
+    `rx.read_from_microphone(capture="callback")`. Chunks from a plain iterable are fetched
+    in the executor, since such sources usually block. Each chunk is decoded in the
+    executor, one chunk at a time per receiver.
+
+    Backpressure: at most `max_pending_frames` decoded frames wait for the consumer. When
+    the queue is full, the receiver stops pulling from `source` until a frame is taken.
+
+    `aclose()`, or leaving an `async with` block, cancels the background task. It waits for
+    any executor call still running and then closes the source. A consumer still waiting in
+    `async for` then stops cleanly. Errors raised by the source or decoder are re-raised
+    from `__anext__`.
+    """
+
+    def __init__(
+        self,
+        source: AsyncIterable[np.ndarray] | Iterable[np.ndarray],
+        *,
+        decoder: ChunkDecoder | None = None,
+        executor: Executor | None = None,
+        max_pending_frames: int = 8,
+    ) -> None:
+        if max_pending_frames <= 0:
+            raise ValueError("max_pending_frames must be positive.")
+        self._source = source
+        self._iterator: Iterator[np.ndarray] | None = None
+        self.decoder = decoder if decoder is not None else IncrementalFrameDecoder()
+        self._executor = executor
+        self._max_pending_frames = max_pending_frames
+        self._queue: asyncio.Queue[Any] | None = None
+        self._task: asyncio.Task[None] | None = None
+        self._inflight: asyncio.Future[Any] | None = None
+        self._error: BaseException | None = None
+        self._closed = False
+
+    @property
+    def pending_frames(self) -> int:
+        """Number of decoded frames waiting for the consumer."""
+        return self._queue.qsize() if self._queue is not None else 0
+
+    def __aiter__(self) -> AsyncFrameReceiver:
+        return self
+
+    async def __anext__(self) -> Any:
+        if self._closed:
+            raise StopAsyncIteration
+        self._start()
+        assert self._queue is not None
+        item = await self._queue.get()
+        if item is _END:
+            self._closed = True
+            if self._error is not None:
+                error, self._error = self._error, None
+                raise error
+            raise StopAsyncIteration
+        return item
+
+    async def __aenter__(self) -> AsyncFrameReceiver:
+        self._start()
+        return self
+
+    async def __aexit__(self, *exc_info: object) -> None:
+        await self.aclose()
+
+    async def aclose(self) -> None:
+        """Stop receiving, release the source and wake any waiting consumer."""
+        self._closed = True
+        task, self._task = self._task, None
+        if task is not None and not task.done():
+            task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await task
+        if self._inflight is not None and not self._inflight.done():
+            # Executor calls cannot be interrupted; let the last one finish before the
+            # source is closed underneath it.
+            with contextlib.suppress(Exception):
+                await self._inflight
+        await self._close_source()
+        if self._queue is not None:
+            while not self._queue.empty():
+                self._queue.get_nowait()
+            self._queue.put_nowait(_END)
+
+    def _start(self) -> None:
+        if self._task is not None or self._closed:
+            return
+        self._queue = asyncio.Queue(maxsize=self._max_pending_frames)
+        self._task = asyncio.get_running_loop().create_task(self._pump())
+
+    async def _pump(self) -> None:
+        assert self._queue is not None
+        try:
+            async for chunk in self._chunks():
+                for frame in await self._offload(_decode_chunk, self.decoder, chunk):
+                    await self._queue.put(frame)
+        except asyncio.CancelledError:
+            raise
+        except Exception as exc:
+            self._error = exc
+        await self._queue.put(_END)
+
+    async def _chunks(self) -> AsyncIterator[np.ndarray]:
+        if isinstance(self._source, AsyncIterable):
+            async for chunk in self._source:
+                yield chunk
+            return
+        self._iterator = iter(self._source)
+        while True:
+            chunk = await self._offload(next, self._iterator, _END)
+            if chunk is _END:
+                return
+            yield chunk
+
+    async def _offload(self, func: Callable[..., Any], *args: Any) -> Any:
+        loop = asyncio.get_running_loop()
+        self._inflight = loop.run_in_executor(self._executor, func, *args)
+        # Shielded so cancelling the pump leaves the future for `aclose` to wait on.
+        return await asyncio.shield(self._inflight)
+
+    async def _close_source(self) -> None:
+        if isinstance(self._source, AsyncIterable):
+            aclose = getattr(self._source, "aclose", None)
+            if aclose is not None:
+                await aclose()
+            return
+        close = getattr(self._iterator, "close", None)
+        if close is not None:
+            close()
+
+
+def _decode_chunk(decoder: ChunkDecoder, chunk: np.ndarray) -> list[Any]:
+    return list(decoder.ingest(chunk))
@@ -0,0 +1,161 @@
+"""
+Parallel offline decoding of long WAV recordings.
+
+A recording is split into segments that overlap by more than the longest frame the decoder
+can hold, so every frame lies wholly inside the segment where it starts. Segments decode
+independently in a `ProcessPoolExecutor`; each worker memory-maps the same file with
+`wav.WavReader`, so no audio is copied between processes. The merge keeps only frames that
+start in a segment's own core and drops the copies a neighbouring segment decoded from the
+overlap.
+"""
+
+from __future__ import annotations
+
+import os
+from collections.abc import Iterable, Iterator
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from itertools import repeat
+from pathlib import Path
+
+from . import config
+from .framing import Header
+from .rx import FrameMetadata, IncrementalFrameDecoder, _max_frame_samples
+from .wav import WAV_CHUNK_SAMPLES, WavReader
+
+# A segment core spans at least this many overlaps, which bounds the repeated work.
+_MIN_SEGMENT_OVERLAPS = 2
+
+Frame = tuple[FrameMetadata, Header, bytes]
+
+
+@dataclass(frozen=True, slots=True)
+class Segment:
+    """Samples `[start, stop)` are decoded; frames starting in `[start, core_stop)` are kept."""
+
+    start: int
+    core_stop: int
+    stop: int
+
+
+def segment_overlap(sample_rate: int = config.SAMPLE_RATE) -> int:
+    """Return the overlap that guarantees no frame is cut at a segment boundary."""
+    tone_samples = int(round(sample_rate * (config.START_END_TONE_DURATION_MS / 1000.0)))
+    # One extra tone window covers a start tone detected before the tone fills the window.
+    return _max_frame_samples(sample_rate) + tone_samples
+
+
+def plan_segments(total_samples: int, *, segment_samples: int, overlap: int) -> list[Segment]:
+    """Split `total_samples` into cores of `segment_samples`, each extended by `overlap`."""
+    if segment_samples <= 0:
+        raise ValueError("segment_samples must be positive.")
+    if overlap < 0:
+        raise ValueError("overlap must be non-negative.")
+    return [
+        Segment(
+            start=start,
+            core_stop=min(start + segment_samples, total_samples),
+            stop=min(start + segment_samples + overlap, total_samples),
+        )
+        for start in range(0, total_samples, segment_samples)
+    ]
+
+
+def merge_segment_frames(
+    segments: Iterable[Segment], results: Iterable[list[Frame]], *, tolerance: int
+) -> Iterator[Frame]:
+    """
+    Yield each segment's frames in order, without the copies decoded from an overlap.
+
+    A frame belongs to the segment whose core contains its `sample_offset`. A frame whose
+    start tone straddles a boundary can be detected on both sides of it, so a frame is also
+    dropped when it repeats the previous segment's frame within `tolerance` samples.
+    """
+    previous: list[Frame] = []
+    for segment, frames in zip(segments, results):
+        owned = [
+            frame
+            for frame in frames
+            if segment.start <= frame[0].sample_offset < segment.core_stop
+        ]
+        for frame in owned:
+            if not any(_same_frame(frame, earlier, tolerance) for earlier in previous):
+                yield frame
+        previous = owned
+
+
+def _same_frame(frame: Frame, other: Frame, tolerance: int) -> bool:
+    return (
+        frame[1:] == other[1:]
+        and abs(frame[0].sample_offset - other[0].sample_offset) <= tolerance
+    )
+
+
+def _decode_segment(
+    path: Path, start: int, stop: int, chunk_samples: int, processing_rate: int | None
+) -> list[Frame]:
+    reader = WavReader(path)
+    decoder = IncrementalFrameDecoder(processing_rate=processing_rate)
+    # Offsets come back at the decoder rate; report them in file samples.
+    scale = reader.sample_rate / config.SAMPLE_RATE
+    frames: list[Frame] = []
+    chunks = reader.iter_chunks(
+        chunk_samples=chunk_samples, start=start, stop=stop, output_rate=config.SAMPLE_RATE
+    )
+    for chunk in chunks:
+        for metadata, header, payload in decoder.ingest(chunk):
+            metadata.sample_offset = start + int(round(metadata.sample_offset * scale))
+            frames.append((metadata, header, payload))
+    reader.close()
+    return frames
+
+
+def decode_wav_parallel(
+    path: str | Path,
+    *,
+    jobs: int | None = None,
+    segment_samples: int | None = None,
+    chunk_samples: int = WAV_CHUNK_SAMPLES,
+    processing_rate: int | None = None,
+) -> Iterator[Frame]:
+    """
+    Decode a WAV recording on `jobs` processes and yield frames in recording order.
+
+    By default the recording is cut into one segment per job, but never shorter than
+    `_MIN_SEGMENT_OVERLAPS` overlaps. Frames are yielded segment by segment as soon as
+    each segment and all earlier ones have finished. `metadata.sample_offset` is the
+    absolute offset of the frame's start tone in file samples. Recordings at other rates
+    are resampled to `config.SAMPLE_RATE` inside each worker, and `processing_rate` is
+    passed on to each worker's `IncrementalFrameDecoder`.
+    """
+    path = Path(path)
+    reader = WavReader(path)
+    jobs = jobs or os.cpu_count() or 1
+    if jobs <= 0:
+        raise ValueError("jobs must be positive.")
+    overlap = segment_overlap(reader.sample_rate)
+    if segment_samples is None:
+        segment_samples = max(-(-reader.frames // jobs), _MIN_SEGMENT_OVERLAPS * overlap)
+    segments = plan_segments(reader.frames, segment_samples=segment_samples, overlap=overlap)
+    # Detections of one start tone differ by less than two tone windows, while genuine
+    # repeats are at least a whole frame apart.
+    tolerance = 2 * int(
+        round(reader.sample_rate * (config.START_END_TONE_DURATION_MS / 1000.0))
+    )
+    arguments = (
+        repeat(path),
+        [segment.start for segment in segments],
+        [segment.stop for segment in segments],
+        repeat(chunk_samples),
+        repeat(processing_rate),
+    )
+
+    if jobs == 1 or len(segments) <= 1:
+        yield from merge_segment_frames(
+            segments, map(_decode_segment, *arguments), tolerance=tolerance
+        )
+        return
+    with ProcessPoolExecutor(max_workers=min(jobs, len(segments))) as pool:
+        yield from merge_segment_frames(
+            segments, pool.map(_decode_segment, *arguments), tolerance=tolerance
+        )
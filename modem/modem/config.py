@@ -28,6 +28,15 @@ BAUD_TO_RATE_CODE: Final[dict[int, int]] = {baud: idx for idx, baud in enumerate
 DEFAULT_VERSION: Final[int] = 0x01
 DEFAULT_FLAGS: Final[int] = 0x00
 
+# Messages longer than one frame are split into fragments. The low nibble of `Header.flags`
+# carries the fragment sequence number and FLAG_MORE_FRAGMENTS marks every fragment except
+# the last, so a single-frame message keeps DEFAULT_FLAGS. Sequence 0 starts a message, so a
+# message may span at most MAX_FRAGMENTS frames before the sequence number would wrap.
+MAX_FRAME_PAYLOAD: Final[int] = 512
+FLAG_SEQUENCE_MASK: Final[int] = 0x0F
+FLAG_MORE_FRAGMENTS: Final[int] = 0x10
+MAX_FRAGMENTS: Final[int] = FLAG_SEQUENCE_MASK + 1
+
 
 @dataclass(frozen=True, slots=True)
 class TransmissionProfile:
@@ -44,6 +53,50 @@ class TransmissionProfile:
         return BAUD_TO_RATE_CODE[self.baud]
 
 
+# Frequency-division channels: channel n moves every tone of the base set up by
+# n * CHANNEL_SPACING_HZ, so several links can share one sound card.
+CHANNEL_SPACING_HZ: Final[float] = 2_400.0
+
+
+@dataclass(frozen=True, slots=True)
+class ChannelPlan:
+    """Tone frequencies used by one AFSK link."""
+
+    mark: float = MARK_FREQUENCY
+    space: float = SPACE_FREQUENCY
+    start_tone: float = START_TONE_FREQUENCY
+    end_tone: float = END_TONE_FREQUENCY
+
+    @property
+    def frequencies(self) -> tuple[float, float, float, float]:
+        """Return `(start_tone, end_tone, mark, space)`."""
+        return (self.start_tone, self.end_tone, self.mark, self.space)
+
+    def shifted(self, offset_hz: float) -> "ChannelPlan":
+        """Return the same tone set moved up by `offset_hz`."""
+        return ChannelPlan(
+            mark=self.mark + offset_hz,
+            space=self.space + offset_hz,
+            start_tone=self.start_tone + offset_hz,
+            end_tone=self.end_tone + offset_hz,
+        )
+
+
+DEFAULT_CHANNEL: Final[ChannelPlan] = ChannelPlan()
+
+
+def channel_plans(
+    count: int, *, spacing_hz: float = CHANNEL_SPACING_HZ, sample_rate: int = SAMPLE_RATE
+) -> tuple[ChannelPlan, ...]:
+    """Return `count` channels spaced `spacing_hz` apart, starting at `DEFAULT_CHANNEL`."""
+    if count <= 0:
+        raise ValueError("count must be positive.")
+    plans = tuple(DEFAULT_CHANNEL.shifted(index * spacing_hz) for index in range(count))
+    if max(plans[-1].frequencies) >= sample_rate / 2:
+        raise ValueError(f"{count} channels do not fit below the Nyquist frequency.")
+    return plans
+
+
 def baud_from_rate_code(code: int) -> int:
     """Return the baud value for a given rate code."""
     try:
@@ -4,12 +4,15 @@ Chirp Spread Spectrum transmitter helpers.
 
 from __future__ import annotations
 
+import threading
+from collections import OrderedDict
 from dataclasses import dataclass, field
 from typing import Iterable, Sequence
 
 import numpy as np
 
 from . import config
+from . import fec_conv
 from . import framing
 from . import utils
 from .framing import Header
@@ -64,6 +67,20 @@ def generate_reference_chirp(params: ChirpParams) -> np.ndarray:
     return chirp.astype(np.complex64, copy=False)
 
 
+def generate_down_chirp(params: ChirpParams) -> np.ndarray:
+    """
+    Return the complex down-chirp sweeping from `f0 + bw` back to `f0`.
+
+    This is the time reverse of the reference up-chirp's frequency track. (The conjugate of
+    the up-chirp is not usable here: its real part, which is what we transmit, equals the
+    up-chirp's.)
+    """
+    t = np.arange(params.Ns, dtype=np.float64) / params.fs
+    phase = 2.0 * np.pi * ((params.f0 + params.bw) * t - 0.5 * params.k * t * t)
+    chirp = np.exp(1j * phase)
+    return chirp.astype(np.complex64, copy=False)
+
+
 def _raised_cosine_window(params: ChirpParams) -> np.ndarray:
     window = utils.raised_cosine_window(params.Ns, ramp_fraction=params.window_fraction)
     return np.asarray(window, dtype=np.float32)
@@ -102,6 +119,20 @@ def shift_to_symbol(index: int, params: ChirpParams) -> int:
     return _gray_decode(index)
 
 
+def shifts_to_symbols(indices: np.ndarray, params: ChirpParams) -> np.ndarray:
+    """
+    Vectorized `shift_to_symbol` for an array of shift indices.
+    """
+    result = np.asarray(indices, dtype=np.int64)
+    if result.size and (int(result.min()) < 0 or int(result.max()) >= params.M):
+        raise ValueError("shift index out of range.")
+    gray = result >> 1
+    while gray.any():
+        result = result ^ gray
+        gray = gray >> 1
+    return result
+
+
 def _synthesize_symbol_waveform(
     shift_index: int, reference: np.ndarray, window: np.ndarray, params: ChirpParams
 ) -> np.ndarray:
@@ -110,11 +141,127 @@ def _synthesize_symbol_waveform(
     return np.real(shifted).astype(np.float32, copy=False)
 
 
-def _generate_down_chirp(reference: np.ndarray, window: np.ndarray) -> np.ndarray:
-    down = np.conj(reference) * window
+def _generate_down_chirp(params: ChirpParams, window: np.ndarray) -> np.ndarray:
+    down = generate_down_chirp(params) * window
     return np.real(down).astype(np.float32, copy=False)
 
 
+# Upper bound on the bytes held by the per-`ChirpParams` table cache. A symbol waveform table
+# that would not fit on its own is skipped and rows are sliced on demand instead.
+_CHIRP_TABLE_CACHE_BYTES = 64 << 20
+
+
+def _read_only(array: np.ndarray) -> np.ndarray:
+    array.flags.writeable = False
+    return array
+
+
+class ChirpTables:
+    """
+    Precomputed waveforms shared by CSS synthesis and demodulation for one `ChirpParams`.
+
+    The real part of a cyclically shifted chirp is the cyclic shift of the real chirp, so
+    every data symbol is a slice of the real reference repeated twice, times the window.
+    When the `(M, Ns)` table of all symbol waveforms fits in the cache budget it is built
+    once; otherwise rows are sliced from the doubled reference on request. All arrays are
+    read-only. Use `chirp_tables` to share instances.
+    """
+
+    def __init__(
+        self, params: ChirpParams, *, max_table_bytes: int = _CHIRP_TABLE_CACHE_BYTES
+    ) -> None:
+        self.params = params
+        self.reference = _read_only(generate_reference_chirp(params))
+        self.window = _read_only(_raised_cosine_window(params))
+        self.down_chirp = _read_only(generate_down_chirp(params))
+        self.down_symbol = _read_only(_generate_down_chirp(params, self.window))
+        real_reference = np.real(self.reference).astype(np.float32)
+        self._doubled = _read_only(np.concatenate([real_reference, real_reference]))
+        self._starts = _read_only(
+            (params.Ns - np.rint(np.arange(params.M) * params.Ns / params.M).astype(np.int64))
+            % params.Ns
+        )
+        self.symbol_waveforms: np.ndarray | None = None
+        if params.M * params.Ns * np.dtype(np.float32).itemsize <= max_table_bytes:
+            windows = np.lib.stride_tricks.sliding_window_view(self._doubled, params.Ns)
+            self.symbol_waveforms = _read_only(windows[self._starts] * self.window)
+
+    @property
+    def nbytes(self) -> int:
+        """Approximate memory held by the tables."""
+        arrays = (self.reference, self.window, self.down_chirp, self.down_symbol, self._doubled)
+        total = sum(array.nbytes for array in arrays)
+        if self.symbol_waveforms is not None:
+            total += self.symbol_waveforms.nbytes
+        return total
+
+    def symbol_waveform(self, shift_index: int) -> np.ndarray:
+        """Return the windowed real waveform for one cyclic shift."""
+        if not 0 <= shift_index < self.params.M:
+            raise ValueError("shift index out of range.")
+        if self.symbol_waveforms is not None:
+            return self.symbol_waveforms[shift_index]
+        start = int(self._starts[shift_index])
+        return self._doubled[start : start + self.params.Ns] * self.window
+
+    def symbol_waveform_rows(self, shift_indices: np.ndarray) -> np.ndarray:
+        """Return a `(count, Ns)` array of the waveforms for `shift_indices`."""
+        indices = np.asarray(shift_indices, dtype=np.int64)
+        if indices.size and (int(indices.min()) < 0 or int(indices.max()) >= self.params.M):
+            raise ValueError("shift index out of range.")
+        if self.symbol_waveforms is not None:
+            return self.symbol_waveforms[indices]
+        windows = np.lib.stride_tricks.sliding_window_view(self._doubled, self.params.Ns)
+        return windows[self._starts[indices]] * self.window
+
+
+class _ChirpTableCache:
+    """Least-recently-used `ChirpTables` cache bounded by total bytes."""
+
+    def __init__(self, max_bytes: int) -> None:
+        self.max_bytes = max_bytes
+        self._entries: OrderedDict[ChirpParams, ChirpTables] = OrderedDict()
+        self._lock = threading.Lock()
+
+    @property
+    def nbytes(self) -> int:
+        with self._lock:
+            return sum(tables.nbytes for tables in self._entries.values())
+
+    def get(self, params: ChirpParams) -> ChirpTables:
+        with self._lock:
+            tables = self._entries.get(params)
+            if tables is not None:
+                self._entries.move_to_end(params)
+                return tables
+        tables = ChirpTables(params, max_table_bytes=self.max_bytes)
+        with self._lock:
+            self._entries[params] = tables
+            self._entries.move_to_end(params)
+            total = sum(entry.nbytes for entry in self._entries.values())
+            while total > self.max_bytes and len(self._entries) > 1:
+                _, evicted = self._entries.popitem(last=False)
+                total -= evicted.nbytes
+        return tables
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+_chirp_table_cache = _ChirpTableCache(_CHIRP_TABLE_CACHE_BYTES)
+
+
+def chirp_tables(params: ChirpParams) -> ChirpTables:
+    """
+    Return the cached `ChirpTables` for `params`, building them on first use.
+
+    Entries are evicted least recently used first once the cache holds more than
+    `_CHIRP_TABLE_CACHE_BYTES`.
+    """
+    return _chirp_table_cache.get(params)
+
+
 def synthesize_symbols(
     symbols: Sequence[int],
     params: ChirpParams,
@@ -126,8 +273,7 @@ def synthesize_symbols(
     """
     Convert a sequence of byte values into a CSS waveform.
     """
-    reference = generate_reference_chirp(params)
-    window = _raised_cosine_window(params)
+    tables = chirp_tables(params)
 
     waveform_parts: list[np.ndarray] = []
 
@@ -137,21 +283,14 @@ def synthesize_symbols(
         )
 
     if include_preamble:
-        up_symbol = _synthesize_symbol_waveform(0, reference, window, params)
-        down_symbol = _generate_down_chirp(reference, window)
-        for _ in range(params.preamble_up):
-            waveform_parts.append(up_symbol)
-        for _ in range(params.preamble_down):
-            waveform_parts.append(down_symbol)
-
-    if include_sync:
-        for pattern in SYNC_PATTERN:
-            shift = symbol_to_shift(pattern, params)
-            waveform_parts.append(_synthesize_symbol_waveform(shift, reference, window, params))
-
-    for symbol in symbols:
-        shift = symbol_to_shift(symbol, params)
-        waveform_parts.append(_synthesize_symbol_waveform(shift, reference, window, params))
+        up_symbol = tables.symbol_waveform(0)
+        waveform_parts.append(np.tile(up_symbol, params.preamble_up))
+        waveform_parts.append(np.tile(tables.down_symbol, params.preamble_down))
+
+    shifts = [symbol_to_shift(pattern, params) for pattern in SYNC_PATTERN] if include_sync else []
+    shifts.extend(symbol_to_shift(symbol, params) for symbol in symbols)
+    if shifts:
+        waveform_parts.append(tables.symbol_waveform_rows(np.asarray(shifts)).reshape(-1))
 
     if include_tones:
         waveform_parts.append(
@@ -208,12 +347,13 @@ def assemble_css_transmission(
         )
 
     frame_bytes = framing.build_frame(base_header, payload)
-    frame_bits = utils.bits_from_bytes(frame_bytes)
-
     if fec_enabled:
-        raise NotImplementedError("FEC support will arrive in a later milestone.")
-
-    symbols = list(frame_bytes)
+        header_length = framing.Header.HEADER_LENGTH
+        symbols = fec_encode_section(
+            frame_bytes[:header_length], interleave_depth=interleave_depth
+        ) + fec_encode_section(frame_bytes[header_length:], interleave_depth=interleave_depth)
+    else:
+        symbols = list(frame_bytes)
     waveform = synthesize_symbols(
         symbols,
         params,
@@ -228,6 +368,27 @@ def assemble_css_transmission(
     return waveform.astype(np.float32, copy=False)
 
 
+def fec_section_symbols(byte_count: int) -> int:
+    """Number of CSS symbols that carry `byte_count` bytes after convolutional coding."""
+    coded_bits = 2 * (8 * byte_count + fec_conv.ConstraintLength - 1)
+    return -(-coded_bits // 8)
+
+
+def fec_encode_section(data: bytes, *, interleave_depth: int) -> list[int]:
+    """
+    Convolutionally encode and interleave `data`, returning one byte value per CSS symbol.
+
+    FEC frames carry the header and the payload-plus-CRC as two separately terminated
+    sections, so a receiver can decode the header and learn the payload length before the
+    rest of the frame arrives. The coded bits are zero-padded to whole symbols.
+    """
+    coded = fec_conv.conv_encode_array(utils.unpack_bits(data))
+    coded = fec_conv.interleave(coded, interleave_depth)
+    padded = np.zeros(8 * fec_section_symbols(len(data)), dtype=np.uint8)
+    padded[: coded.size] = coded
+    return list(utils.pack_bits(padded))
+
+
 def _update_flags(original_flags: int, fec_enabled: bool) -> int:
     if fec_enabled:
         return original_flags | config.CSS_FLAG_FEC
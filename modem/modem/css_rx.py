@@ -1,21 +1,25 @@
 """
-Baseline CSS demodulator helpers.
+CSS demodulator helpers.
 
-This module currently assumes a single, well-aligned frame synthesized by
-`modem.css`. Preamble detection and streaming integration will follow in later
-milestones.
+`decode_css_waveform` decodes a single, well-aligned frame synthesized by
+`modem.css`. `IncrementalCSSDecoder` finds frames anywhere in a stream of audio
+chunks, recovering symbol timing and carrier frequency offset from the preamble.
 """
 
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import Iterable, List, Sequence, Tuple
+from functools import lru_cache
+from time import time
+from typing import Iterable, Iterator, List, Sequence, Tuple
 
 import numpy as np
 
 from . import config
 from . import css
+from . import fec_conv
 from . import framing
+from . import utils
 
 
 @dataclass(slots=True)
@@ -27,6 +31,34 @@ class SymbolDecision:
     dominance: float
 
 
+@dataclass(frozen=True, slots=True)
+class SymbolDecisions:
+    """
+    Demodulation decisions for a run of symbols, stored as parallel arrays.
+
+    Indexing or iterating builds `SymbolDecision` objects on demand; bulk consumers should
+    read `shifts`, `magnitudes` and `dominances` directly.
+    """
+
+    shifts: np.ndarray
+    magnitudes: np.ndarray
+    dominances: np.ndarray
+
+    def __len__(self) -> int:
+        return int(self.shifts.size)
+
+    def __getitem__(self, index: int) -> SymbolDecision:
+        return SymbolDecision(
+            shift=int(self.shifts[index]),
+            magnitude=float(self.magnitudes[index]),
+            dominance=float(self.dominances[index]),
+        )
+
+    def __iter__(self) -> Iterator[SymbolDecision]:
+        for index in range(len(self)):
+            yield self[index]
+
+
 @dataclass(slots=True)
 class CSSFrameMetadata:
     """Placeholder metadata for decoded frames."""
@@ -35,6 +67,21 @@ class CSSFrameMetadata:
     detected_bw: float
     timestamp: float = 0.0
     rssi: float | None = None
+    cfo_hz: float | None = None
+
+
+DEMOD_MODES: Tuple[str, ...] = ("fft", "correlator")
+
+
+def _decision_from_correlations(correlations: np.ndarray) -> SymbolDecision:
+    peak_index = int(np.argmax(correlations))
+    peak_value = float(correlations[peak_index])
+    if correlations.size > 1:
+        second_peak = float(np.partition(correlations, -2)[-2])
+    else:
+        second_peak = peak_value
+    dominance = peak_value / (second_peak + 1e-6)
+    return SymbolDecision(shift=peak_index, magnitude=peak_value, dominance=dominance)
 
 
 def demod_symbol(
@@ -45,19 +92,167 @@ def demod_symbol(
 ) -> SymbolDecision:
     """
     Demodulate a single symbol worth of samples and return the detected shift.
+
+    Reference correlator against an explicit `(M, Ns)` template matrix.
     """
     if samples.ndim != 1:
         raise ValueError("Symbol samples must be one-dimensional.")
     normalized = samples.astype(np.float32, copy=False)
     correlations = (templates @ normalized) / template_energy
-    peak_index = int(np.argmax(correlations))
-    peak_value = float(correlations[peak_index])
-    if correlations.size > 1:
-        second_peak = float(np.partition(correlations, -2)[-2])
+    return _decision_from_correlations(correlations)
+
+
+class FFTSymbolCorrelator:
+    """
+    Template correlator for one `ChirpParams`, evaluated with FFTs instead of a matrix.
+
+    Every template is the windowed real reference chirp cyclically shifted by
+    `round(shift * Ns / M)` samples, so correlating a symbol against all of them is a
+    circular cross-correlation of `symbol * window` with the real chirp, read at the M shift
+    lags. One real FFT pair per symbol replaces the `(M, Ns)` template product and gives the
+    same normalized correlations as `demod_symbol`. Use `fft_symbol_correlator` to share
+    instances.
+    """
+
+    def __init__(self, params: css.ChirpParams) -> None:
+        self.params = params
+        tables = css.chirp_tables(params)
+        reference = np.real(tables.reference).astype(np.float64)
+        window = tables.window.astype(np.float64)
+        self._lags = np.rint(np.arange(params.M) * params.Ns / params.M).astype(np.int64)
+        self._lags %= params.Ns
+        # ||roll(reference, lag) * window|| for each lag, itself a circular correlation.
+        energy = np.fft.irfft(
+            np.fft.rfft(window * window) * np.conj(np.fft.rfft(reference * reference)),
+            n=params.Ns,
+        )[self._lags]
+        norms = np.sqrt(np.maximum(energy, 0.0))
+        norms[norms == 0.0] = 1.0
+        self._inverse_norms = 1.0 / norms
+        # Single precision halves the FFT cost and leaves the decisions unchanged.
+        self._window = window.astype(np.float32)
+        self._reference_spectrum = np.conj(np.fft.rfft(reference)).astype(np.complex64)
+        # When every lag is a multiple of `Ns / M`, sampling the correlation at the lags is
+        # the same as folding its spectrum into M bins, so an M-point inverse FFT suffices.
+        self._decimation = params.Ns // params.M if params.Ns % params.M == 0 else 0
+
+    def correlations(
+        self, symbols: np.ndarray, *, lag_offset: float = 0.0, envelope: bool = False
+    ) -> np.ndarray:
+        """
+        Return normalized template correlations for one symbol or a stack of symbols.
+
+        Args:
+            symbols: Array of shape `(Ns,)` or `(count, Ns)`.
+            lag_offset: Fractional number of samples added to every template lag, used to
+                compensate a known timing or frequency offset.
+            envelope: Return the magnitude of the analytic correlation instead of its real
+                part. This is insensitive to the carrier phase, which a frequency offset
+                rotates from symbol to symbol.
+
+        Returns:
+            Array of shape `(M,)` or `(count, M)`.
+        """
+        data = np.asarray(symbols, dtype=np.float32)
+        if data.ndim not in (1, 2) or data.shape[-1] != self.params.Ns:
+            raise ValueError(f"Symbol samples must have shape (..., {self.params.Ns}).")
+        spectrum = np.fft.rfft(data * self._window, axis=-1)
+        spectrum *= self._reference_spectrum
+        if lag_offset:
+            bins = np.arange(spectrum.shape[-1], dtype=np.float64)
+            spectrum *= np.exp(2j * np.pi * bins * lag_offset / self.params.Ns).astype(
+                spectrum.dtype
+            )
+        ns, m = self.params.Ns, self.params.M
+        half = ns // 2
+        if not envelope and not self._decimation:
+            correlation = np.fft.irfft(spectrum, n=ns, axis=-1)
+            return correlation[..., self._lags] * self._inverse_norms
+
+        full = np.zeros(data.shape[:-1] + (ns,), dtype=spectrum.dtype)
+        full[..., : half + 1] = spectrum
+        if envelope:
+            # One-sided spectrum: the inverse transform is the analytic correlation.
+            full[..., 1:half] *= 2
+        else:
+            # Hermitian symmetry of a real signal's spectrum supplies the negative frequencies.
+            full[..., half + 1 :] = np.conj(spectrum[..., 1 : ns - half][..., ::-1])
+        if self._decimation:
+            folded = full.reshape(data.shape[:-1] + (self._decimation, m)).sum(axis=-2)
+            correlation = np.fft.ifft(folded, axis=-1) * (m / ns)
+        else:
+            correlation = np.fft.ifft(full, axis=-1)[..., self._lags]
+        correlation = np.abs(correlation) if envelope else correlation.real
+        return correlation.astype(np.float64) * self._inverse_norms
+
+
+@lru_cache(maxsize=8)
+def fft_symbol_correlator(params: css.ChirpParams) -> FFTSymbolCorrelator:
+    """Return a cached `FFTSymbolCorrelator` for the given parameters."""
+    return FFTSymbolCorrelator(params)
+
+
+def demod_symbol_fft(samples: np.ndarray, params: css.ChirpParams) -> SymbolDecision:
+    """
+    Demodulate a single symbol with the FFT correlator; decisions match `demod_symbol`.
+    """
+    if samples.ndim != 1:
+        raise ValueError("Symbol samples must be one-dimensional.")
+    correlations = fft_symbol_correlator(params).correlations(samples)
+    return _decision_from_correlations(correlations)
+
+
+# Samples per batched FFT or template product. Keeping each block's complex spectra within
+# the cache is faster than one very large call and bounds the scratch space.
+_DEMOD_BLOCK_SAMPLES = 1 << 17
+
+
+def _decisions_from_correlations(correlations: np.ndarray) -> SymbolDecisions:
+    """Vectorized `_decision_from_correlations` over the rows of `(count, M)` correlations."""
+    count = correlations.shape[0]
+    shifts = np.argmax(correlations, axis=1)
+    peaks = correlations[np.arange(count), shifts]
+    if correlations.shape[1] > 1:
+        second = np.partition(correlations, -2, axis=1)[:, -2]
     else:
-        second_peak = peak_value
-    dominance = peak_value / (second_peak + 1e-6)
-    return SymbolDecision(shift=peak_index, magnitude=peak_value, dominance=dominance)
+        second = peaks
+    return SymbolDecisions(
+        shifts=shifts.astype(np.int64, copy=False),
+        magnitudes=peaks.astype(np.float64, copy=False),
+        dominances=peaks / (second + 1e-6),
+    )
+
+
+def demod_symbols(
+    symbols: np.ndarray, params: css.ChirpParams, *, demod: str = "fft"
+) -> SymbolDecisions:
+    """
+    Demodulate a `(count, Ns)` stack of symbols and return the decisions as parallel arrays.
+
+    The FFT correlator handles whole blocks of symbols per FFT call; the `"correlator"` mode
+    builds the template matrix once and scores each block with a single matrix product.
+    """
+    if demod not in DEMOD_MODES:
+        raise ValueError(f"Unknown demod mode {demod!r}; choose from {DEMOD_MODES}.")
+    data = np.asarray(symbols)
+    if data.ndim != 2 or data.shape[1] != params.Ns:
+        raise ValueError(f"Symbols must have shape (count, {params.Ns}).")
+
+    if demod == "correlator":
+        templates, template_energy = _symbol_templates(params)
+
+        def score(block: np.ndarray) -> np.ndarray:
+            return (block.astype(np.float32, copy=False) @ templates.T) / template_energy
+
+    else:
+        score = fft_symbol_correlator(params).correlations
+
+    correlations = np.empty((data.shape[0], params.M), dtype=np.float64)
+    block = max(1, _DEMOD_BLOCK_SAMPLES // params.Ns)
+    for start in range(0, data.shape[0], block):
+        stop = start + block
+        correlations[start:stop] = score(data[start:stop])
+    return _decisions_from_correlations(correlations)
 
 
 def _strip_tones(samples: np.ndarray) -> np.ndarray:
@@ -77,13 +272,22 @@ def decode_css_waveform(
     includes_preamble: bool = True,
     includes_sync: bool = True,
     includes_tones: bool = False,
+    demod: str = "fft",
+    fec_enabled: bool = False,
+    interleave_depth: int = 1,
 ) -> tuple[CSSFrameMetadata, framing.Header, bytes]:
     """
     Decode a CSS waveform into a frame.
 
-    This assumes a single, complete frame synthesized by `modem.css`. It does
-    not yet support repeated frames or streaming decode.
+    This assumes a single, complete frame synthesized by `modem.css`; use
+    `IncrementalCSSDecoder` for streams. `demod` selects the FFT correlator
+    (default) or the reference template-matrix `"correlator"`. `fec_enabled` and
+    `interleave_depth` must match the settings the frame was assembled with.
     """
+    if demod not in DEMOD_MODES:
+        raise ValueError(f"Unknown demod mode {demod!r}; choose from {DEMOD_MODES}.")
+    if interleave_depth < 1:
+        raise ValueError("interleave_depth must be >= 1.")
     waveform = np.asarray(list(samples) if not isinstance(samples, np.ndarray) else samples)
     if waveform.ndim != 1:
         raise ValueError("CSS demodulator expects a mono waveform.")
@@ -107,37 +311,35 @@ def decode_css_waveform(
     if complete_symbols == 0:
         raise ValueError("No complete data symbols found in waveform.")
 
-    reference = css.generate_reference_chirp(params)
-    window = np.asarray(css._raised_cosine_window(params), dtype=np.float32)
-    reference = css.generate_reference_chirp(params)
-    templates = _build_symbol_templates(reference, window, params)
-    template_energy = np.linalg.norm(templates, axis=1)
-    template_energy[template_energy == 0.0] = 1.0
-
-    decisions: list[SymbolDecision] = []
-    bytes_out: list[int] = []
-
-    for idx in range(complete_symbols):
-        start = idx * symbol_stride
-        segment = data_region[start : start + symbol_stride]
-        if segment.size != symbol_stride:
-            break
-        decision = demod_symbol(segment, templates=templates, template_energy=template_energy)
-        symbol = css.shift_to_symbol(decision.shift, params)
-        decisions.append(decision)
-        bytes_out.append(symbol)
-
-    if len(bytes_out) < framing.Header.HEADER_LENGTH:
+    # Zero-copy `(symbols, Ns)` view of the data region.
+    symbol_matrix = data_region[: complete_symbols * symbol_stride].reshape(
+        complete_symbols, symbol_stride
+    )
+    header_symbols = _section_symbols(framing.Header.HEADER_LENGTH, fec_enabled)
+    if complete_symbols < header_symbols:
         raise ValueError("Insufficient bytes to recover frame header.")
 
-    byte_stream = bytes(bytes_out)
-    header = framing.Header.from_bytes(byte_stream[: framing.Header.HEADER_LENGTH])
-    total_frame_bytes = framing.Header.HEADER_LENGTH + header.length + 2
-    if len(byte_stream) < total_frame_bytes:
+    # Demodulate the header first so only the symbols the frame occupies are processed.
+    header_bytes = _decode_section(
+        demod_symbols(symbol_matrix[:header_symbols], params, demod=demod),
+        params,
+        framing.Header.HEADER_LENGTH,
+        fec_enabled=fec_enabled,
+        interleave_depth=interleave_depth,
+    )
+    header = framing.Header.from_bytes(header_bytes)
+    body_length = header.length + 2
+    total_symbols = header_symbols + _section_symbols(body_length, fec_enabled)
+    if complete_symbols < total_symbols:
         raise ValueError("Decoded byte stream shorter than expected frame size.")
-
-    frame_bytes = byte_stream[:total_frame_bytes]
-    header, payload = framing.parse_frame(frame_bytes)
+    byte_stream = header_bytes + _decode_section(
+        demod_symbols(symbol_matrix[header_symbols:total_symbols], params, demod=demod),
+        params,
+        body_length,
+        fec_enabled=fec_enabled,
+        interleave_depth=interleave_depth,
+    )
+    header, payload = framing.parse_frame(byte_stream)
 
     energy = float(np.mean(data_region**2))
     metadata = CSSFrameMetadata(
@@ -149,6 +351,54 @@ def decode_css_waveform(
     return metadata, header, payload
 
 
+def _section_symbols(byte_count: int, fec_enabled: bool) -> int:
+    """Number of symbols a frame section of `byte_count` bytes occupies on air."""
+    return css.fec_section_symbols(byte_count) if fec_enabled else byte_count
+
+
+def _decode_section(
+    decisions: SymbolDecisions,
+    params: css.ChirpParams,
+    byte_count: int,
+    *,
+    fec_enabled: bool,
+    interleave_depth: int,
+) -> bytes:
+    """
+    Turn the symbol decisions of one frame section back into `byte_count` bytes.
+
+    With FEC, every bit of a symbol is weighted by the symbol's dominance (a peak barely above
+    the runner-up is nearly an erasure) and the soft values are Viterbi decoded. Shifts that do
+    not map to a byte are treated as erasures.
+    """
+    if not fec_enabled:
+        return _symbols_to_bytes(decisions, params)
+    values = css.shifts_to_symbols(decisions.shifts, params)
+    valid = values <= 0xFF
+    bits = np.unpackbits(np.where(valid, values, 0).astype(np.uint8))
+    confidence = np.where(valid, 1.0 - 1.0 / np.maximum(decisions.dominances, 1.0), 0.0)
+    coded_bits = 2 * (8 * byte_count + fec_conv.ConstraintLength - 1)
+    soft = fec_conv.soft_bits(bits, np.repeat(confidence, 8))[:coded_bits]
+    decoded = fec_conv.viterbi_decode_soft(fec_conv.deinterleave(soft, interleave_depth))
+    return utils.pack_bits(np.asarray(decoded, dtype=np.uint8))
+
+
+def _symbols_to_bytes(decisions: SymbolDecisions, params: css.ChirpParams) -> bytes:
+    values = css.shifts_to_symbols(decisions.shifts, params)
+    if values.size and int(values.max()) > 0xFF:
+        raise ValueError("Decoded symbol does not fit in one byte.")
+    return values.astype(np.uint8).tobytes()
+
+
+@lru_cache(maxsize=2)
+def _symbol_templates(params: css.ChirpParams) -> tuple[np.ndarray, np.ndarray]:
+    """Return the cached reference template matrix and its row norms."""
+    templates = css.chirp_tables(params).symbol_waveform_rows(np.arange(params.M))
+    template_energy = np.linalg.norm(templates, axis=1)
+    template_energy[template_energy == 0.0] = 1.0
+    return templates, template_energy
+
+
 def _build_symbol_templates(
     reference: np.ndarray, window: np.ndarray, params: css.ChirpParams
 ) -> np.ndarray:
@@ -161,3 +411,355 @@ def _build_symbol_templates(
     return templates
 
 
+# Half-symbol hop between preamble search windows, and how many consecutive windows must
+# agree on the symbol timing before a preamble is declared.
+_PREAMBLE_HOP_FRACTION = 0.5
+_PREAMBLE_MIN_WINDOWS = 4
+# Headroom reserved in the CSS decoder's ring buffer for newly ingested audio.
+_CSS_INGEST_BLOCK_SECONDS = 0.5
+
+
+class _ChirpAligner:
+    """
+    Locates up- and down-chirp boundaries inside one symbol-length window.
+
+    The window is circularly cross-correlated with the transmitted (windowed) chirp through
+    FFTs. Only positive frequencies are kept, so the correlation is analytic and its
+    magnitude is a smooth envelope without the carrier ripple. The envelope peak is refined
+    with parabolic interpolation to a fractional lag.
+    """
+
+    def __init__(self, params: css.ChirpParams) -> None:
+        self.params = params
+        tables = css.chirp_tables(params)
+        half = params.Ns // 2
+        self._spectra = {}
+        self._norms = {}
+        for name, symbol in (
+            ("up", tables.symbol_waveform(0).astype(np.float64)),
+            ("down", tables.down_symbol.astype(np.float64)),
+        ):
+            self._spectra[name] = np.conj(np.fft.rfft(symbol))[: half + 1]
+            self._norms[name] = float(np.linalg.norm(symbol)) or 1.0
+
+    def peak(self, samples: np.ndarray, chirp: str = "up") -> tuple[float, float]:
+        """
+        Return `(score, lag)` for the strongest alignment of `chirp` within `samples`.
+
+        `score` is the correlation envelope normalized to 1 for a clean, perfectly aligned
+        chirp. `lag` is the fractional offset in samples, wrapped to `[-Ns/2, Ns/2)`, from
+        the start of `samples` to the nearest chirp boundary.
+        """
+        ns = self.params.Ns
+        data = np.asarray(samples, dtype=np.float64)
+        energy = float(np.linalg.norm(data))
+        if energy == 0.0:
+            return 0.0, 0.0
+        spectrum = np.zeros(ns, dtype=np.complex128)
+        half = ns // 2
+        spectrum[: half + 1] = np.fft.rfft(data) * self._spectra[chirp]
+        spectrum[1:half] *= 2.0
+        envelope = np.abs(np.fft.ifft(spectrum))
+        index = int(np.argmax(envelope))
+        left = envelope[index - 1]
+        right = envelope[(index + 1) % ns]
+        centre = envelope[index]
+        denominator = left - 2.0 * centre + right
+        fraction = 0.5 * (left - right) / denominator if denominator < 0.0 else 0.0
+        lag = (index + fraction + half) % ns - half
+        return float(centre / (energy * self._norms[chirp])), float(lag)
+
+
+@lru_cache(maxsize=8)
+def _chirp_aligner(params: css.ChirpParams) -> _ChirpAligner:
+    return _ChirpAligner(params)
+
+
+class IncrementalCSSDecoder:
+    """
+    Streaming CSS frame decoder that accepts audio in arbitrary chunks.
+
+    The decoder mirrors `rx.IncrementalFrameDecoder`. It scans for a run of up-chirps by
+    correlating half-symbol-spaced windows against the up-chirp, then follows the preamble
+    symbol by symbol until the down-chirps. The up- and down-chirp alignments give the
+    fractional symbol timing, and their difference gives the carrier frequency offset (a
+    frequency offset moves up- and down-chirp correlation peaks in opposite directions).
+    The sync word is verified and each data symbol is demodulated as soon as it has been
+    received. Only a few symbols of audio are ever buffered, so memory use does not grow
+    with the frame length or the session length.
+    """
+
+    def __init__(
+        self,
+        params: css.ChirpParams,
+        *,
+        detection_threshold: float = 0.2,
+        max_payload: int = config.MAX_FRAME_PAYLOAD,
+        fec_enabled: bool = False,
+        interleave_depth: int = 1,
+    ) -> None:
+        if params.preamble_up < 2 or params.preamble_down < 1:
+            raise ValueError("Streaming decode needs at least two up-chirps and one down-chirp.")
+        if not 0.0 < detection_threshold < 1.0:
+            raise ValueError("detection_threshold must be between 0 and 1.")
+        if interleave_depth < 1:
+            raise ValueError("interleave_depth must be >= 1.")
+        self.params = params
+        self.detection_threshold = detection_threshold
+        self.max_payload = max_payload
+        self.fec_enabled = fec_enabled
+        self.interleave_depth = interleave_depth
+        self._header_symbols = _section_symbols(framing.Header.HEADER_LENGTH, fec_enabled)
+        self._aligner = _chirp_aligner(params)
+        self._correlator = fft_symbol_correlator(params)
+        self._sync_shifts = [css.symbol_to_shift(value, params) for value in css.SYNC_PATTERN]
+        self._hop = max(1, int(round(params.Ns * _PREAMBLE_HOP_FRACTION)))
+        self._min_windows = max(2, min(_PREAMBLE_MIN_WINDOWS, 2 * (params.preamble_up - 1)))
+        # Timing estimates from consecutive windows must agree to within half a chip.
+        self._timing_tolerance = max(1.0, 0.5 * params.Ns / params.M)
+
+        ingest_block = max(1, int(round(_CSS_INGEST_BLOCK_SECONDS * params.fs)))
+        self._ring = utils.RingBuffer(2 * params.Ns + self._hop + ingest_block)
+        # Absolute sample index of the first buffered sample.
+        self._origin = 0
+        self._enter_search(0)
+
+    @property
+    def capacity(self) -> int:
+        """Maximum number of samples retained between calls to `ingest`."""
+        return self._ring.capacity
+
+    @property
+    def buffered_samples(self) -> int:
+        """Number of samples currently held for preamble search and demodulation."""
+        return len(self._ring)
+
+    def ingest(
+        self, samples: Iterable[float] | np.ndarray
+    ) -> Iterator[tuple[CSSFrameMetadata, framing.Header, bytes]]:
+        """
+        Append samples into the decoder and yield any frames that completed.
+        """
+        if isinstance(samples, np.ndarray):
+            array = np.asarray(samples, dtype=np.float32)
+        else:
+            array = np.asarray(list(samples), dtype=np.float32)
+        if array.ndim != 1:
+            raise ValueError("samples must be a one-dimensional sequence.")
+
+        frames: list[tuple[CSSFrameMetadata, framing.Header, bytes]] = []
+        position = 0
+        while position < array.size:
+            take = min(array.size - position, self._ring.free)
+            self._ring.append(array[position : position + take])
+            position += take
+            frames.extend(self._process())
+            self._release()
+        return iter(frames)
+
+    # -- state transitions -------------------------------------------------------------
+
+    def _enter_search(self, position: float) -> None:
+        self._state = "search"
+        self._search_position = int(np.ceil(position))
+        self._run_length = 0
+        self._run_boundary = 0.0
+
+    def _enter_preamble(self, boundary: float) -> None:
+        self._state = "preamble"
+        self._boundary = boundary
+        self._up_offsets: list[float] = []
+        self._down_offsets: list[float] = []
+
+    def _enter_frame(self, boundary: float, lag_bias: float) -> None:
+        self._state = "frame"
+        self._boundary = boundary
+        self._lag_bias = lag_bias
+        self._symbol_index = 0
+        self._decisions: list[SymbolDecision] = []
+        self._header: framing.Header | None = None
+        self._header_bytes = b""
+        self._expected_symbols = self._header_symbols
+        self._frame_energy = 0.0
+
+    # -- processing ----------------------------------------------------------------------
+
+    def _window(self, start: int) -> np.ndarray | None:
+        """Return `Ns` buffered samples from absolute index `start`, if available."""
+        relative = start - self._origin
+        if relative < 0 or relative + self.params.Ns > len(self._ring):
+            return None
+        return self._ring.view()[relative : relative + self.params.Ns]
+
+    def _process(self) -> list[tuple[CSSFrameMetadata, framing.Header, bytes]]:
+        frames = []
+        while True:
+            if self._state == "search":
+                progressed = self._search_step()
+            elif self._state == "preamble":
+                progressed = self._preamble_step()
+            else:
+                progressed, frame = self._frame_step()
+                if frame is not None:
+                    frames.append(frame)
+            if not progressed:
+                return frames
+
+    def _search_step(self) -> bool:
+        window = self._window(self._search_position)
+        if window is None:
+            return False
+        score, lag = self._aligner.peak(window, "up")
+        boundary = self._search_position + lag
+        if score >= self.detection_threshold:
+            ns = self.params.Ns
+            drift = (boundary - self._run_boundary + ns / 2) % ns - ns / 2
+            if self._run_length and abs(drift) <= self._timing_tolerance:
+                self._run_length += 1
+            else:
+                self._run_length = 1
+            self._run_boundary = boundary
+        else:
+            self._run_length = 0
+        self._search_position += self._hop
+
+        if self._run_length >= self._min_windows:
+            ns = self.params.Ns
+            symbols_ahead = np.ceil((self._search_position - self._run_boundary) / ns)
+            self._enter_preamble(self._run_boundary + symbols_ahead * ns)
+        return True
+
+    def _preamble_step(self) -> bool:
+        start = int(round(self._boundary))
+        window = self._window(start)
+        if window is None:
+            return False
+        up_score, up_lag = self._aligner.peak(window, "up")
+        down_score, down_lag = self._aligner.peak(window, "down")
+        offset_base = start - self._boundary
+
+        if down_score >= self.detection_threshold and down_score > up_score:
+            self._down_offsets.append(offset_base + down_lag)
+        elif up_score >= self.detection_threshold and not self._down_offsets:
+            self._up_offsets.append(offset_base + up_lag)
+            if len(self._up_offsets) > self.params.preamble_up + 2:
+                # Too long for a preamble (e.g. a continuous chirp); start over.
+                self._enter_search(start)
+                return True
+        else:
+            self._enter_search(start)
+            return True
+
+        self._boundary += self.params.Ns
+        if len(self._down_offsets) == self.params.preamble_down:
+            if not self._up_offsets:
+                self._enter_search(start)
+                return True
+            up_offset = float(np.median(self._up_offsets))
+            down_offset = float(np.median(self._down_offsets))
+            timing = 0.5 * (up_offset + down_offset)
+            self._enter_frame(self._boundary + timing, 0.5 * (up_offset - down_offset))
+        return True
+
+    def _frame_step(self) -> tuple[bool, tuple[CSSFrameMetadata, framing.Header, bytes] | None]:
+        start = int(round(self._boundary))
+        window = self._window(start)
+        if window is None:
+            return False, None
+        correlations = self._correlator.correlations(
+            window, lag_offset=(self._boundary - start) + self._lag_bias, envelope=True
+        )
+        shift = int(np.argmax(correlations))
+        self._frame_energy += float(np.dot(window, window))
+        self._boundary += self.params.Ns
+        self._symbol_index += 1
+
+        sync_length = len(self._sync_shifts)
+        if self._symbol_index <= sync_length:
+            if shift != self._sync_shifts[self._symbol_index - 1]:
+                self._enter_search(start)
+            return True, None
+
+        self._decisions.append(_decision_from_correlations(correlations))
+        if len(self._decisions) < self._expected_symbols:
+            return True, None
+
+        if self._header is None:
+            try:
+                self._header_bytes = self._decode_section(framing.Header.HEADER_LENGTH)
+            except ValueError:
+                self._enter_search(start)
+                return True, None
+            self._header = framing.Header.from_bytes(self._header_bytes)
+            if self._header.length > self.max_payload:
+                self._enter_search(start)
+                return True, None
+            self._decisions = []
+            self._expected_symbols = _section_symbols(self._header.length + 2, self.fec_enabled)
+            return True, None
+
+        symbol_count = self._symbol_index
+        try:
+            frame_bytes = self._header_bytes + self._decode_section(self._header.length + 2)
+            header, payload = framing.parse_frame(frame_bytes)
+        except ValueError:
+            self._enter_search(self._boundary)
+            return True, None
+        self._enter_search(self._boundary)
+        energy = self._frame_energy / (symbol_count * self.params.Ns)
+        metadata = CSSFrameMetadata(
+            detected_sf=self.params.sf,
+            detected_bw=self.params.bw,
+            timestamp=time(),
+            rssi=10.0 * np.log10(energy + 1e-12),
+            cfo_hz=-self._lag_bias / self.params.fs * self.params.k,
+        )
+        return True, (metadata, header, payload)
+
+    def _decode_section(self, byte_count: int) -> bytes:
+        decisions = SymbolDecisions(
+            shifts=np.array([decision.shift for decision in self._decisions], dtype=np.int64),
+            magnitudes=np.array([decision.magnitude for decision in self._decisions]),
+            dominances=np.array([decision.dominance for decision in self._decisions]),
+        )
+        return _decode_section(
+            decisions,
+            self.params,
+            byte_count,
+            fec_enabled=self.fec_enabled,
+            interleave_depth=self.interleave_depth,
+        )
+
+    def _release(self) -> None:
+        """Drop buffered samples that no state will look at again."""
+        if self._state == "search":
+            keep_from = self._search_position
+        else:
+            keep_from = int(round(self._boundary))
+        drop = min(keep_from - self._origin - 1, len(self._ring))
+        if drop > 0:
+            self._ring.consume(drop)
+            self._origin += drop
+        if self._ring.free == 0:
+            # Cannot happen while every state reads at most `Ns` samples past `keep_from`,
+            # but never let a stalled state wedge the decoder.
+            self._ring.consume(self.params.Ns)
+            self._origin += self.params.Ns
+            self._enter_search(self._origin)
+
+
+def stream_css_frames_from_chunks(
+    chunks: Iterable[np.ndarray],
+    params: css.ChirpParams,
+    *,
+    fec_enabled: bool = False,
+    interleave_depth: int = 1,
+) -> Iterator[tuple[CSSFrameMetadata, framing.Header, bytes]]:
+    """
+    Consume a sequence of sample chunks and yield CSS frames as they are decoded.
+    """
+    decoder = IncrementalCSSDecoder(
+        params, fec_enabled=fec_enabled, interleave_depth=interleave_depth
+    )
+    for chunk in chunks:
+        yield from decoder.ingest(chunk)
@@ -4,8 +4,11 @@ Convolutional FEC encoder/decoder helpers for the CSS modem.
 
 from __future__ import annotations
 
+from functools import lru_cache
 from typing import Iterable, List, Sequence
 
+import numpy as np
+
 ConstraintLength = 7
 Generators = (0o133, 0o171)
 StateMask = (1 << (ConstraintLength - 1)) - 1
@@ -25,9 +28,9 @@ def _polynomial_output(state: int, bit: int) -> tuple[int, int]:
     return (new_state & StateMask, outputs[0], outputs[1])
 
 
-def conv_encode(bits: Iterable[int], *, terminate: bool = True) -> list[int]:
+def _conv_encode_reference(bits: Iterable[int], *, terminate: bool = True) -> list[int]:
     """
-    Encode a sequence of bits using the rate-1/2 K=7 convolutional code.
+    Reference bit-at-a-time encoder, kept to validate and benchmark `conv_encode_array`.
     """
     state = 0
     encoded: list[int] = []
@@ -43,6 +46,38 @@ def conv_encode(bits: Iterable[int], *, terminate: bool = True) -> list[int]:
     return encoded
 
 
+def conv_encode_array(bits: Sequence[int] | np.ndarray, *, terminate: bool = True) -> np.ndarray:
+    """
+    Encode a bit array with the rate-1/2 K=7 convolutional code and return a uint8 array.
+
+    The K-bit shift register for every input bit is assembled at once from shifted copies of
+    the input, and both generator outputs are looked up in `_OUTPUT_TABLE`.
+    """
+    data = np.asarray(bits, dtype=np.uint8)
+    if data.ndim != 1:
+        raise ValueError("bits must be one-dimensional.")
+    data = data & 1
+    tail = ConstraintLength - 1
+    if terminate:
+        data = np.concatenate([data, np.zeros(tail, dtype=np.uint8)])
+    padded = np.concatenate([np.zeros(tail, dtype=np.uint8), data])
+    registers = np.zeros(data.size, dtype=np.uint8)
+    for age in range(ConstraintLength):
+        registers |= padded[tail - age : tail - age + data.size] << age
+    outputs = _OUTPUT_TABLE[registers]
+    encoded = np.empty(2 * data.size, dtype=np.uint8)
+    encoded[0::2] = outputs >> 1
+    encoded[1::2] = outputs & 1
+    return encoded
+
+
+def conv_encode(bits: Iterable[int], *, terminate: bool = True) -> list[int]:
+    """
+    Encode a sequence of bits using the rate-1/2 K=7 convolutional code.
+    """
+    return conv_encode_array(np.fromiter(bits, dtype=np.uint8), terminate=terminate).tolist()
+
+
 def _branch_metric(pair: tuple[int, int], expected0: int, expected1: int) -> int:
     return (pair[0] ^ expected0) + (pair[1] ^ expected1)
 
@@ -56,9 +91,19 @@ def _expected_pair(next_state: int, generator: int) -> int:
     return parity
 
 
-def viterbi_decode_hard(bits: Sequence[int], *, terminate: bool = True) -> list[int]:
+# Encoder output pair packed as `2 * out0 + out1` for every K-bit shift-register value.
+_OUTPUT_TABLE = np.array(
+    [
+        2 * _expected_pair(register, Generators[0]) + _expected_pair(register, Generators[1])
+        for register in range(1 << ConstraintLength)
+    ],
+    dtype=np.uint8,
+)
+
+
+def _viterbi_decode_hard_reference(bits: Sequence[int], *, terminate: bool = True) -> list[int]:
     """
-    Decode a hard-decision bit stream that was encoded with `conv_encode`.
+    Reference scalar hard-decision decoder, kept to validate and benchmark `viterbi_decode_soft`.
     """
     if len(bits) % 2 != 0:
         raise ValueError("Convolutional decoder expects an even number of bits.")
@@ -107,3 +152,287 @@ def viterbi_decode_hard(bits: Sequence[int], *, terminate: bool = True) -> list[
     return decoded_bits
 
 
+# Trellis tables. A state holds the last K-1 input bits with the newest in bit 0, so state `s`
+# is entered from `(s >> 1) | (m << (K - 2))` for m in {0, 1} with input bit `s & 1`, and the
+# full K-bit register on that branch is `s | (m << (K - 1))`. Encoder output pairs are packed
+# as `2 * out0 + out1`.
+_NUM_STATES = 1 << (ConstraintLength - 1)
+_OUTPUT_PAIRS = np.array([[0, 0], [0, 1], [1, 0], [1, 1]], dtype=np.float64)
+
+
+def _register_outputs(registers: np.ndarray) -> np.ndarray:
+    """Packed encoder outputs for an array of full K-bit shift-register contents."""
+    return _OUTPUT_TABLE[registers].astype(np.intp)
+
+
+_STATES = np.arange(_NUM_STATES)
+# Two trellis steps are combined per update (radix 4): state `s` is reached from
+# `(s >> 2) | (m << (K - 3))` for m in 0..3 through the intermediate state
+# `(s >> 1) | ((m & 1) << (K - 2))`. Row m of these tables holds the packed outputs of the
+# first and second branch on that path.
+_RADIX4_FIRST_OUTPUTS = _register_outputs(
+    (_STATES >> 1)
+    | ((np.arange(4)[:, None] & 1) << (ConstraintLength - 2))
+    | ((np.arange(4)[:, None] >> 1) << (ConstraintLength - 1))
+)
+_RADIX4_SECOND_OUTPUTS = _register_outputs(
+    _STATES | ((np.arange(4)[:, None] & 1) << (ConstraintLength - 1))
+)
+# Single-step (radix 2) outputs, used for a trailing odd step.
+_RADIX2_OUTPUTS = _register_outputs(_STATES | (np.arange(2)[:, None] << (ConstraintLength - 1)))
+# Trellis step pairs whose branch metrics are expanded at once.
+_VITERBI_CHUNK_PAIRS = 512
+
+
+def soft_bits(
+    bits: Sequence[int] | np.ndarray, confidence: Sequence[float] | np.ndarray
+) -> np.ndarray:
+    """
+    Combine hard decisions with per-bit confidence in [0, 1] into soft decoder input.
+
+    A confidence of 1 keeps the hard bit, 0 marks it as an erasure (0.5), and values in
+    between move it proportionally towards 0.5. `confidence` broadcasts against `bits`.
+    """
+    hard = np.asarray(bits, dtype=np.float64)
+    weight = np.clip(np.asarray(confidence, dtype=np.float64), 0.0, 1.0)
+    return 0.5 + (hard - 0.5) * weight
+
+
+def _branch_costs(values: np.ndarray) -> np.ndarray:
+    """Cost of each packed output pair at every step, shape `(steps, 4)`."""
+    return np.abs(values.reshape(-1, 1, 2) - _OUTPUT_PAIRS).sum(axis=2)
+
+
+def _add_compare_select(costs: np.ndarray, metrics: np.ndarray) -> np.ndarray:
+    """
+    Advance the 64 path `metrics` in place over `costs` and return the survivor decisions.
+
+    Two trellis steps are combined per update; a trailing odd step is handled on its own. The
+    per-step decisions are recovered afterwards from the stored candidate metrics, one chunk at
+    a time, and returned packed as one little-endian 64-bit word per step (bit `s` set when
+    state `s` was entered from its upper predecessor).
+    """
+    num_steps = costs.shape[0]
+    half = _NUM_STATES // 2
+    quarter = _NUM_STATES // 4
+    survivors = np.empty((num_steps, _NUM_STATES), dtype=np.bool_)
+
+    # Candidate m for state s sits at `[m, s >> 2, s & 3]`; the predecessor metrics broadcast
+    # over the last axis and the winners land in natural state order.
+    previous = metrics.reshape(4, quarter, 1)
+    updated = metrics.reshape(quarter, 4)
+    num_pairs = num_steps // 2
+    candidates = np.empty((min(num_pairs, _VITERBI_CHUNK_PAIRS), 4, quarter, 4))
+    for start in range(0, num_pairs, _VITERBI_CHUNK_PAIRS):
+        stop = min(start + _VITERBI_CHUNK_PAIRS, num_pairs)
+        steps = costs[2 * start : 2 * stop]
+        branch = (
+            steps[0::2][:, _RADIX4_FIRST_OUTPUTS] + steps[1::2][:, _RADIX4_SECOND_OUTPUTS]
+        ).reshape(stop - start, 4, quarter, 4)
+        stored = candidates[: stop - start]
+        for pair_branch, pair_candidates in zip(branch, stored):
+            np.add(previous, pair_branch, out=pair_candidates)
+            np.minimum.reduce(pair_candidates, axis=0, out=updated)
+
+        # Path m = 2 * b + a takes first-step decision b and second-step decision a. The
+        # second step keeps the lower predecessor on ties, like the reference decoder.
+        flat = stored.reshape(-1, 4, _NUM_STATES)
+        second = survivors[2 * start + 1 : 2 * stop : 2]
+        np.less(
+            np.minimum(flat[:, 1], flat[:, 3]), np.minimum(flat[:, 0], flat[:, 2]), out=second
+        )
+        # The first-step decision for intermediate state p = (s >> 1) | (a << 5) can be read
+        # at s = 2 * (p & 31), comparing the b = 1 path against the b = 0 path.
+        first = survivors[2 * start : 2 * stop : 2]
+        np.less(flat[:, 2, 0::2], flat[:, 0, 0::2], out=first[:, :half])
+        np.less(flat[:, 3, 0::2], flat[:, 1, 0::2], out=first[:, half:])
+
+    if num_steps % 2:
+        single = metrics.reshape(2, half, 1) + costs[-1][_RADIX2_OUTPUTS].reshape(2, half, 2)
+        np.less(single[1], single[0], out=survivors[-1].reshape(half, 2))
+        np.minimum(single[0], single[1], out=metrics.reshape(half, 2))
+
+    return np.packbits(survivors, axis=1, bitorder="little").view("<u8").ravel()
+
+
+def _traceback(packed: Sequence[int], state: int) -> list[int]:
+    """Follow packed survivor words backwards from `state` and return the decided input bits."""
+    decoded = [0] * len(packed)
+    shift = ConstraintLength - 2
+    for idx in range(len(packed) - 1, -1, -1):
+        decoded[idx] = state & 1
+        state = (state >> 1) | (((packed[idx] >> state) & 1) << shift)
+    return decoded
+
+
+def _initial_metrics() -> np.ndarray:
+    metrics = np.full(_NUM_STATES, np.inf)
+    metrics[0] = 0.0
+    return metrics
+
+
+def viterbi_decode_soft(
+    values: Sequence[float] | np.ndarray, *, terminate: bool = True
+) -> list[int]:
+    """
+    Decode soft-decision input encoded with `conv_encode`.
+
+    Each value is the received bit as a number in [0, 1]: 0 and 1 are confident decisions and
+    0.5 carries no information (see `soft_bits`). The branch metric is the absolute distance
+    to the expected bits, which for hard input equals the Hamming distance used by
+    `_viterbi_decode_hard_reference`, including its tie-breaking.
+
+    All 64 states are updated at once, two trellis steps per update, with NumPy
+    add-compare-select over precomputed trellis tables. Survivors are traced back from one
+    packed 64-bit word per step.
+    """
+    received = np.asarray(values, dtype=np.float64)
+    if received.ndim != 1 or received.size % 2 != 0:
+        raise ValueError("Convolutional decoder expects an even number of bits.")
+
+    metrics = _initial_metrics()
+    packed = _add_compare_select(_branch_costs(received), metrics).tolist()
+    decoded = _traceback(packed, 0 if terminate else int(np.argmin(metrics)))
+    if terminate and len(decoded) >= ConstraintLength - 1:
+        decoded = decoded[: -(ConstraintLength - 1)]
+    return decoded
+
+
+# Default number of trellis steps a streaming decision lags behind the newest input. Five
+# constraint lengths is the usual rule of thumb for hard decisions; soft input and bursty
+# channels benefit from a little more.
+_DEFAULT_TRACEBACK_DEPTH = 64
+
+
+class StreamingViterbiDecoder:
+    """
+    Incremental Viterbi decoder for `conv_encode` output with a fixed traceback depth.
+
+    Encoded values (hard bits or soft values in [0, 1], see `viterbi_decode_soft`) are pushed
+    in pieces of any length. A decoded bit is released once `traceback_depth` further trellis
+    steps have been received, by tracing back from the currently best state. Survivors are
+    kept only for the undecided steps, so memory does not grow with the stream length, and
+    path metrics are renormalized after every update so they stay bounded.
+
+    Traceback runs once per `traceback_depth` released bits rather than once per bit. With a
+    depth at least as long as the whole message the output equals `viterbi_decode_soft`.
+    """
+
+    def __init__(self, *, traceback_depth: int = _DEFAULT_TRACEBACK_DEPTH) -> None:
+        if traceback_depth < ConstraintLength:
+            raise ValueError(f"traceback_depth must be at least {ConstraintLength}.")
+        self.traceback_depth = traceback_depth
+        self.reset()
+
+    def reset(self) -> None:
+        """Discard all state and start a new message."""
+        self._metrics = _initial_metrics()
+        self._survivors: list[int] = []
+        # Encoded values waiting for the rest of a two-step update.
+        self._pending = np.empty(0, dtype=np.float64)
+        self._decoded_bits = 0
+
+    @property
+    def pending_steps(self) -> int:
+        """Trellis steps received but not yet released as decoded bits."""
+        return len(self._survivors) + self._pending.size // 2
+
+    def push(self, values: Sequence[float] | np.ndarray) -> list[int]:
+        """
+        Add encoded values and return the input bits that are now decided.
+        """
+        data = np.asarray(values, dtype=np.float64)
+        if data.ndim != 1:
+            raise ValueError("values must be a one-dimensional sequence.")
+        if self._pending.size:
+            data = np.concatenate([self._pending, data])
+
+        decoded: list[int] = []
+        # Whole step pairs only, in bounded pieces, so the radix-4 update never needs a
+        # trailing single step until `flush`.
+        usable = data.size - data.size % 4
+        piece = 4 * _VITERBI_CHUNK_PAIRS
+        for start in range(0, usable, piece):
+            self._advance(data[start : min(start + piece, usable)])
+            if len(self._survivors) >= 2 * self.traceback_depth:
+                decoded.extend(self._release(len(self._survivors) - self.traceback_depth))
+        self._pending = data[usable:].copy()
+        return decoded
+
+    def flush(self, *, terminate: bool = True) -> list[int]:
+        """
+        Decide every remaining bit, then reset for the next message.
+
+        With `terminate`, the stream is assumed to end in the zero state and the K-1 tail bits
+        appended by `conv_encode` are dropped.
+        """
+        if self._pending.size % 2:
+            raise ValueError("Convolutional decoder expects an even number of bits.")
+        if self._pending.size:
+            self._advance(self._pending)
+            self._pending = np.empty(0, dtype=np.float64)
+
+        total_steps = self._decoded_bits + len(self._survivors)
+        state = 0 if terminate else int(np.argmin(self._metrics))
+        decoded = _traceback(self._survivors, state)
+        if terminate and total_steps >= ConstraintLength - 1:
+            decoded = decoded[: -(ConstraintLength - 1)]
+        self.reset()
+        return decoded
+
+    def _advance(self, values: np.ndarray) -> None:
+        self._survivors.extend(_add_compare_select(_branch_costs(values), self._metrics).tolist())
+        self._metrics -= self._metrics.min()
+
+    def _release(self, count: int) -> list[int]:
+        decoded = _traceback(self._survivors, int(np.argmin(self._metrics)))[:count]
+        del self._survivors[:count]
+        self._decoded_bits += count
+        return decoded
+
+
+def viterbi_decode_hard(bits: Sequence[int], *, terminate: bool = True) -> list[int]:
+    """
+    Decode a hard-decision bit stream that was encoded with `conv_encode`.
+    """
+    if len(bits) % 2 != 0:
+        raise ValueError("Convolutional decoder expects an even number of bits.")
+    return viterbi_decode_soft(np.asarray(bits, dtype=np.float64), terminate=terminate)
+
+
+@lru_cache(maxsize=32)
+def _interleave_order(length: int, depth: int) -> np.ndarray:
+    """Read order of a `depth`-row block interleaver filled row by row, skipping padding."""
+    columns = -(-length // depth)
+    order = np.arange(depth * columns).reshape(depth, columns).T.ravel()
+    order = order[order < length]
+    order.flags.writeable = False
+    return order
+
+
+def interleave(values: Sequence[float] | np.ndarray, depth: int) -> np.ndarray:
+    """
+    Block-interleave `values`: write them row by row into `depth` rows, read column by column.
+
+    Neighbouring coded bits end up `depth` positions apart, so a burst such as one corrupted
+    CSS symbol is spread into isolated errors the Viterbi decoder can correct. A depth of 1
+    leaves the order unchanged. Works for hard bits and soft values alike.
+    """
+    if depth < 1:
+        raise ValueError("interleave depth must be >= 1.")
+    data = np.asarray(values)
+    if depth == 1 or data.size == 0:
+        return data.copy()
+    return data[_interleave_order(data.size, depth)]
+
+
+def deinterleave(values: Sequence[float] | np.ndarray, depth: int) -> np.ndarray:
+    """Inverse of `interleave`."""
+    if depth < 1:
+        raise ValueError("interleave depth must be >= 1.")
+    data = np.asarray(values)
+    if depth == 1 or data.size == 0:
+        return data.copy()
+    restored = np.empty_like(data)
+    restored[_interleave_order(data.size, depth)] = data
+    return restored
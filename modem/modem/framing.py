@@ -10,6 +10,10 @@ from __future__ import annotations
 from dataclasses import dataclass
 from typing import ClassVar
 
+import numpy as np
+
+from . import config
+
 FramePayload = bytes
 
 CRC_POLY = 0x1021
@@ -49,11 +53,9 @@ class Header:
         return cls(version=version, rate_code=rate_code, flags=flags, length=length)
 
 
-def crc16_ccitt(data: bytes, initial: int = 0xFFFF) -> int:
+def _crc16_ccitt_bitwise(data: bytes, initial: int = 0xFFFF) -> int:
     """
-    Calculate the CRC-16-CCITT checksum for the provided payload.
-
-    Implements the polynomial 0x1021 with refin/refout disabled.
+    Reference bit-at-a-time CRC-16-CCITT, kept to validate and benchmark the table.
     """
     crc = initial & 0xFFFF
     for byte in data:
@@ -66,6 +68,147 @@ def crc16_ccitt(data: bytes, initial: int = 0xFFFF) -> int:
     return crc & 0xFFFF
 
 
+def _build_crc16_table() -> tuple[int, ...]:
+    """Return the CRC of every single byte value, for byte-at-a-time updates."""
+    return tuple(_crc16_ccitt_bitwise(bytes((value,)), initial=0) for value in range(256))
+
+
+def _build_crc16_word_table(byte_table: np.ndarray) -> np.ndarray:
+    """
+    Return the CRC update for every 16-bit value, for two-bytes-at-a-time updates.
+
+    A CRC-16 register is exactly two bytes wide, so after feeding two bytes the new state
+    depends only on `crc ^ word`: `crc' = table[crc ^ ((b0 << 8) | b1)]`.
+    """
+    word = np.arange(1 << 16, dtype=np.uint32)
+    crc = ((word << 8) & 0xFFFF) ^ byte_table[word >> 8]
+    crc = ((crc << 8) & 0xFFFF) ^ byte_table[crc >> 8]
+    return crc.astype(np.uint16)
+
+
+_CRC16_TABLE: tuple[int, ...] = _build_crc16_table()
+_CRC16_WORD_TABLE_NP = _build_crc16_word_table(np.asarray(_CRC16_TABLE, dtype=np.uint32))
+_CRC16_WORD_TABLE: tuple[int, ...] = tuple(_CRC16_WORD_TABLE_NP.tolist())
+
+
+def crc16_ccitt(data: bytes, initial: int = 0xFFFF) -> int:
+    """
+    Calculate the CRC-16-CCITT checksum for the provided payload.
+
+    Implements the polynomial 0x1021 with refin/refout disabled. Bytes are consumed in
+    pairs through a 65,536-entry table (slicing-by-2); an odd trailing byte uses the
+    256-entry table.
+    """
+    crc = initial & 0xFFFF
+    words = _CRC16_WORD_TABLE
+    end = len(data) - (len(data) % 2)
+    for index in range(0, end, 2):
+        crc = words[crc ^ ((data[index] << 8) | data[index + 1])]
+    if end != len(data):
+        crc = ((crc << 8) & 0xFFFF) ^ _CRC16_TABLE[((crc >> 8) ^ data[end]) & 0xFF]
+    return crc
+
+
+def crc16_ccitt_batch(
+    rows: np.ndarray, lengths: np.ndarray | None = None, *, initial: int = 0xFFFF
+) -> np.ndarray:
+    """
+    Calculate CRC-16-CCITT for every row of a 2-D uint8 array at once.
+
+    Args:
+        rows: Array of shape `(count, width)`; each row holds one candidate message.
+        lengths: Optional per-row message lengths (`<= width`); bytes past a row's length
+            are ignored. Defaults to the full width for every row.
+        initial: CRC preset shared by every row.
+
+    Returns:
+        uint16 array of shape `(count,)` matching `crc16_ccitt` applied to each row.
+    """
+    data = np.asarray(rows, dtype=np.uint8)
+    if data.ndim != 2:
+        raise ValueError("rows must be a two-dimensional array.")
+    count, width = data.shape
+    limits = np.full(count, width, dtype=np.int64) if lengths is None else np.asarray(lengths)
+    limits = limits.astype(np.int64, copy=False)
+    if limits.shape != (count,):
+        raise ValueError("lengths must provide one entry per row.")
+    if np.any(limits < 0) or np.any(limits > width):
+        raise ValueError("lengths must lie within the row width.")
+
+    crc = np.full(count, initial & 0xFFFF, dtype=np.uint16)
+    short = limits < 2
+    for row in np.flatnonzero(short):
+        crc[row] = crc16_ccitt(data[row, : limits[row]].tobytes(), initial=initial)
+    if np.all(short):
+        return crc
+
+    # Leading zero bytes leave a zero register unchanged, and a preset equals XOR-ing it
+    # into the first two message bytes. Right-aligning every message in an even-width
+    # matrix therefore lets all rows run the same number of word steps with no masking.
+    aligned_width = width + (width % 2)
+    source = np.arange(aligned_width, dtype=np.int64) - (aligned_width - limits)[:, None]
+    aligned = np.where(
+        source >= 0, data[np.arange(count)[:, None], np.clip(source, 0, width - 1)], 0
+    ).astype(np.uint8)
+    first = aligned_width - limits
+    long_rows = np.flatnonzero(~short)
+    aligned[long_rows, first[long_rows]] ^= (initial >> 8) & 0xFF
+    aligned[long_rows, first[long_rows] + 1] ^= initial & 0xFF
+
+    words = aligned.view(">u2")
+    register = np.zeros(count, dtype=np.uint16)
+    for column in range(words.shape[1]):
+        register = _CRC16_WORD_TABLE_NP[register ^ words[:, column]]
+    crc[long_rows] = register[long_rows]
+    return crc
+
+
+def fragment_flags(sequence: int, *, more: bool, base_flags: int = config.DEFAULT_FLAGS) -> int:
+    """Return header flags carrying a fragment sequence number and continuation bit."""
+    flags = base_flags & ~(config.FLAG_SEQUENCE_MASK | config.FLAG_MORE_FRAGMENTS)
+    flags |= sequence & config.FLAG_SEQUENCE_MASK
+    if more:
+        flags |= config.FLAG_MORE_FRAGMENTS
+    return flags
+
+
+def split_payload(
+    payload: FramePayload, max_payload: int = config.MAX_FRAME_PAYLOAD
+) -> list[FramePayload]:
+    """
+    Split `payload` into chunks of at most `max_payload` bytes for multi-frame messages.
+
+    Cuts are moved back so they never land inside a UTF-8 multi-byte sequence, keeping each
+    fragment of a text message independently decodable. An empty payload yields one
+    empty fragment. Payloads needing more than `config.MAX_FRAGMENTS` fragments raise
+    ValueError, since the receiver could not tell their sequence numbers apart.
+    """
+    if max_payload < 4:
+        raise ValueError("max_payload must be at least 4 bytes to hold any UTF-8 character.")
+    if max_payload > 0xFFFF:
+        raise ValueError("max_payload must fit the 16-bit header length field.")
+
+    fragments: list[FramePayload] = []
+    start = 0
+    while True:
+        end = min(start + max_payload, len(payload))
+        if end < len(payload):
+            cut = end
+            # Step back over continuation bytes (0b10xxxxxx) to the start of the character.
+            while cut > start and (payload[cut] & 0xC0) == 0x80:
+                cut -= 1
+            if cut > start:
+                end = cut
+        fragments.append(payload[start:end])
+        start = end
+        if start >= len(payload):
+            return fragments
+        if len(fragments) == config.MAX_FRAGMENTS:
+            raise ValueError(
+                f"Payload needs more than {config.MAX_FRAGMENTS} frames of {max_payload} bytes."
+            )
+
+
 def build_frame(header: Header, payload: FramePayload) -> bytes:
     """
     Construct a full frame `[header || payload || crc]`.
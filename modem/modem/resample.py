@@ -0,0 +1,142 @@
+"""
+Streaming rational-ratio resampling for audio sources.
+
+`StreamingResampler` is a polyphase FIR resampler that keeps its filter history between
+chunks, so resampling a stream chunk by chunk gives the same samples as resampling it in
+one piece. It sits between capture or file sources running at an arbitrary rate and
+decoders that expect `config.SAMPLE_RATE` or a lower internal processing rate.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterable, Iterator
+from functools import lru_cache
+from math import gcd
+
+import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
+
+# Filter half-length in zero crossings of the narrower of the two rates, and the Kaiser
+# window shape; the same defaults as `scipy.signal.resample_poly`.
+_HALF_LENGTH_ZERO_CROSSINGS = 10
+_KAISER_BETA = 5.0
+
+
+@lru_cache(maxsize=16)
+def _polyphase_filter(up: int, down: int) -> np.ndarray:
+    """Return the anti-aliasing filter split into `up` reversed phases of equal length."""
+    max_rate = max(up, down)
+    half_length = _HALF_LENGTH_ZERO_CROSSINGS * max_rate
+    taps = np.arange(-half_length, half_length + 1, dtype=np.float64)
+    cutoff = 1.0 / max_rate
+    prototype = cutoff * np.sinc(cutoff * taps) * np.kaiser(taps.size, _KAISER_BETA)
+    # Zero insertion divides the passband gain by `up`.
+    prototype *= up / prototype.sum()
+    per_phase = -(-prototype.size // up)
+    padded = np.zeros(per_phase * up, dtype=np.float64)
+    padded[: prototype.size] = prototype
+    # phases[p, k] multiplies input sample (base - k) for outputs with phase p; stored
+    # reversed so it lines up with a forward window ending at `base`.
+    phases = padded.reshape(per_phase, up).T[:, ::-1].copy()
+    phases.setflags(write=False)
+    return phases
+
+
+class StreamingResampler:
+    """
+    Stateful polyphase resampler from `input_rate` to `output_rate`.
+
+    The ratio is reduced to `up / down`. Output sample `n` is aligned with input time
+    `n * down / up`; the filter delay is compensated, so the outputs that depend on input
+    not yet seen are held back until the next `process` call or `flush`. After `flush`,
+    exactly `ceil(total_input * up / down)` samples have been produced.
+    """
+
+    def __init__(self, input_rate: int, output_rate: int) -> None:
+        if input_rate <= 0 or output_rate <= 0:
+            raise ValueError("input_rate and output_rate must be positive.")
+        divisor = gcd(int(input_rate), int(output_rate))
+        self.input_rate = int(input_rate)
+        self.output_rate = int(output_rate)
+        self.up = self.output_rate // divisor
+        self.down = self.input_rate // divisor
+        self._phases = _polyphase_filter(self.up, self.down)
+        self._taps = self._phases.shape[1]
+        # Filter delay in upsampled samples: output n reads the tap centred on n * down.
+        self._delay = _HALF_LENGTH_ZERO_CROSSINGS * max(self.up, self.down)
+        self.reset()
+
+    def reset(self) -> None:
+        """Forget all history, as if no samples had been processed."""
+        self._history = np.zeros(self._taps - 1, dtype=np.float64)
+        self._consumed = 0
+        self._produced = 0
+
+    @property
+    def passthrough(self) -> bool:
+        """Whether input and output rates are equal."""
+        return self.up == self.down
+
+    def process(self, samples: np.ndarray) -> np.ndarray:
+        """Resample the next chunk and return every output sample it completes."""
+        chunk = np.asarray(samples, dtype=np.float64)
+        if chunk.ndim != 1:
+            raise ValueError("samples must be a one-dimensional array.")
+        if self.passthrough:
+            self._consumed += chunk.size
+            self._produced += chunk.size
+            return chunk.astype(np.float32)
+
+        buffer = np.concatenate((self._history, chunk))
+        first_input = self._consumed - (self._taps - 1)
+        self._consumed += chunk.size
+        # Output n needs upsampled position n * down + delay, i.e. input index
+        # (n * down + delay) // up, to have arrived.
+        available = self._consumed * self.up - self._delay
+        count = max(0, -(-available // self.down) - self._produced)
+        out = self._render(buffer, first_input, count)
+        self._history = buffer[buffer.size - (self._taps - 1) :]
+        return out
+
+    def flush(self) -> np.ndarray:
+        """Return the outputs still held back by the filter delay, padding with silence."""
+        if self.passthrough:
+            return np.zeros(0, dtype=np.float32)
+        total = -(-self._consumed * self.up // self.down)
+        pad = -(-self._delay // self.up) + 1
+        consumed = self._consumed
+        buffer = np.concatenate((self._history, np.zeros(pad)))
+        out = self._render(buffer, consumed - (self._taps - 1), total - self._produced)
+        self.reset()
+        return out
+
+    def _render(self, buffer: np.ndarray, first_input: int, count: int) -> np.ndarray:
+        if count <= 0:
+            return np.zeros(0, dtype=np.float32)
+        positions = (self._produced + np.arange(count, dtype=np.int64)) * self.down
+        positions += self._delay
+        base = positions // self.up
+        phase = positions % self.up
+        # Window j of the buffer ends at input index first_input + j + taps - 1.
+        windows = sliding_window_view(buffer, self._taps)
+        rows = base - first_input - (self._taps - 1)
+        out = np.einsum("ij,ij->i", windows[rows], self._phases[phase])
+        self._produced += count
+        return out.astype(np.float32)
+
+
+def resample_chunks(
+    chunks: Iterable[np.ndarray], input_rate: int, output_rate: int
+) -> Iterator[np.ndarray]:
+    """Resample a stream of chunks, flushing the filter once the stream ends."""
+    resampler = StreamingResampler(input_rate, output_rate)
+    if resampler.passthrough:
+        yield from chunks
+        return
+    for chunk in chunks:
+        out = resampler.process(chunk)
+        if out.size:
+            yield out
+    tail = resampler.flush()
+    if tail.size:
+        yield tail
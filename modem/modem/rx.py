@@ -6,18 +6,22 @@ This module will host tone detection, symbol timing, and frame parsing logic.
 
 from __future__ import annotations
 
-from collections.abc import Callable, Iterable, Iterator
-from dataclasses import dataclass
+import threading
+from collections.abc import Callable, Iterable, Iterator, Sequence
+from dataclasses import dataclass, replace
+from functools import lru_cache
 from logging import getLogger
-from time import time
+from time import perf_counter, time
+from typing import ClassVar
 
 import numpy as np
 
 from . import config
 from . import framing
 from . import utils
-from .afsk import demodulate_afsk, goertzel_power
+from .afsk import MultiRateDemodulator, goertzel_bank
 from .framing import Header
+from .resample import StreamingResampler, resample_chunks
 
 try:  # pragma: no cover - optional dependency for runtime audio capture
     import sounddevice as sd
@@ -26,6 +30,24 @@ except ImportError:  # pragma: no cover - handled at call-time
 
 logger = getLogger(__name__)
 
+# Number of window offsets scored per vectorized detector evaluation. Bounds the working set
+# of a batch search while still amortising the NumPy call overhead.
+_TONE_SEARCH_BLOCK = 64
+# Leading preamble duration emitted by `tx.assemble_transmission`.
+_PREAMBLE_SECONDS = 0.2
+# Headroom reserved in the decoder's ring buffer for newly ingested audio.
+_INGEST_BLOCK_SECONDS = 1.0
+# Audio held between the capture callback and the decode thread.
+_CAPTURE_BUFFER_SECONDS = 4.0
+# Frame sync word that follows the preamble.
+_SYNC_BITS = utils.unpack_bits(b"\xDD\xAA")
+# Baud candidates whose mean symbol confidence falls below this fraction of the best
+# candidate's are tried last: symbols of the wrong length straddle transitions.
+_BAUD_CONFIDENCE_RATIO = 0.9
+# Every tone must sit below this fraction of a decoder's processing rate, inside the
+# passband of the decimation filter.
+_PROCESSING_BANDWIDTH = 0.4
+
 
 @dataclass(slots=True)
 class FrameMetadata:
@@ -34,6 +56,8 @@ class FrameMetadata:
     timestamp: float
     detected_baud: int
     rssi: float | None = None
+    # Index of the frame's start-tone window in the decoder's input stream.
+    sample_offset: int | None = None
 
 
 def _detect_tone(
@@ -43,75 +67,297 @@ def _detect_tone(
     comparison_frequencies: tuple[float, ...],
     energy_ratio_threshold: float = 0.1,
     dominance_threshold: float = 8.0,
+    sample_rate: int = config.SAMPLE_RATE,
 ) -> bool:
     if samples.ndim != 1:
         raise ValueError("samples must be a one-dimensional array.")
     if samples.size == 0:
         return False
 
-    tone_power = goertzel_power(samples, frequency, sample_rate=config.SAMPLE_RATE)
-    comparison_powers = [
-        goertzel_power(samples, other_freq, sample_rate=config.SAMPLE_RATE)
-        for other_freq in comparison_frequencies
-    ]
+    # One bank pass scores the tone and every comparison frequency together.
+    bank = goertzel_bank(samples.size, (frequency, *comparison_frequencies), sample_rate)
+    powers = bank.power(samples)
+    tone_power = float(powers[0])
     total_power = float(np.dot(samples, samples))
     if total_power <= 0.0 or tone_power <= 0.0:
         return False
-    dominance = tone_power / max(max(comparison_powers, default=0.0), 1e-12)
+    dominance = tone_power / max(float(powers[1:].max(initial=0.0)), 1e-12)
     energy_ratio = tone_power / total_power
     return dominance > dominance_threshold and energy_ratio > energy_ratio_threshold
 
 
+@dataclass(frozen=True, slots=True)
+class ToneDetector:
+    """
+    Tone dominance detector that can score a single window or many window offsets at once.
+
+    Calling the detector on a window runs the reference per-window Goertzel path. The
+    `detect_windows` method evaluates the same decision for every offset of a longer buffer
+    in one vectorized pass. `sample_rate` is the rate of the windows it is given, so a
+    detector built for a decimated processing rate scores proportionally shorter windows.
+    """
+
+    frequency: float
+    comparison_frequencies: tuple[float, ...]
+    energy_ratio_threshold: float = 0.1
+    dominance_threshold: float = 8.0
+    sample_rate: int = config.SAMPLE_RATE
+
+    def __call__(self, samples: np.ndarray) -> bool:
+        return _detect_tone(
+            samples,
+            frequency=self.frequency,
+            comparison_frequencies=self.comparison_frequencies,
+            energy_ratio_threshold=self.energy_ratio_threshold,
+            dominance_threshold=self.dominance_threshold,
+            sample_rate=self.sample_rate,
+        )
+
+    def detect_windows(
+        self, waveform: np.ndarray, offsets: np.ndarray, *, window_size: int
+    ) -> np.ndarray:
+        """Return a boolean mask of detections for each window start in `offsets`."""
+        offsets = np.asarray(offsets, dtype=np.int64)
+        if offsets.size == 0:
+            return np.zeros(0, dtype=bool)
+        bank = goertzel_bank(
+            window_size, (self.frequency, *self.comparison_frequencies), self.sample_rate
+        )
+        powers = bank.sliding_power(waveform, offsets)
+        lo = int(offsets.min())
+        hi = int(offsets.max()) + window_size
+        span = np.asarray(waveform[lo:hi], dtype=np.float64)
+        energy = np.empty(span.size + 1, dtype=np.float64)
+        energy[0] = 0.0
+        np.cumsum(span * span, out=energy[1:])
+        relative = offsets - lo
+        total_power = energy[relative + window_size] - energy[relative]
+
+        tone_power = powers[0]
+        if powers.shape[0] > 1:
+            strongest_other = np.maximum(powers[1:].max(axis=0), 1e-12)
+        else:
+            strongest_other = np.full(offsets.size, 1e-12)
+        valid = (total_power > 0.0) & (tone_power > 0.0)
+        safe_total = np.where(valid, total_power, 1.0)
+        return (
+            valid
+            & (tone_power / strongest_other > self.dominance_threshold)
+            & (tone_power / safe_total > self.energy_ratio_threshold)
+        )
+
+
+@lru_cache(maxsize=32)
+def channel_tone_detectors(
+    channel: config.ChannelPlan = config.DEFAULT_CHANNEL,
+    sample_rate: int = config.SAMPLE_RATE,
+) -> tuple[ToneDetector, ToneDetector]:
+    """Return the start and end tone detectors for one channel at `sample_rate`."""
+    start = ToneDetector(
+        frequency=channel.start_tone,
+        comparison_frequencies=(channel.end_tone, channel.mark, channel.space),
+        sample_rate=sample_rate,
+    )
+    end = ToneDetector(
+        frequency=channel.end_tone,
+        comparison_frequencies=(channel.start_tone, channel.mark, channel.space),
+        sample_rate=sample_rate,
+    )
+    return start, end
+
+
+START_TONE_DETECTOR, END_TONE_DETECTOR = channel_tone_detectors(config.DEFAULT_CHANNEL)
+
+
 def detect_start_tone(samples: np.ndarray) -> bool:
     """
     Detect whether the start tone is present in the provided samples.
     """
-    return _detect_tone(
-        samples,
-        frequency=config.START_TONE_FREQUENCY,
-        comparison_frequencies=(
-            config.END_TONE_FREQUENCY,
-            config.MARK_FREQUENCY,
-            config.SPACE_FREQUENCY,
-        ),
-    )
+    return START_TONE_DETECTOR(samples)
 
 
 def detect_end_tone(samples: np.ndarray) -> bool:
     """
     Detect whether the end tone is present in the provided samples.
     """
-    return _detect_tone(
-        samples,
-        frequency=config.END_TONE_FREQUENCY,
-        comparison_frequencies=(
-            config.START_TONE_FREQUENCY,
-            config.MARK_FREQUENCY,
-            config.SPACE_FREQUENCY,
-        ),
-    )
+    return END_TONE_DETECTOR(samples)
 
 
 def decode_stream(
-    samples: Iterable[float],
+    samples: Iterable[float], *, processing_rate: int | None = None
 ) -> Iterator[tuple[FrameMetadata, Header, bytes]]:
     """
     Stream decoder that yields frames as they are detected.
     """
-    decoder = IncrementalFrameDecoder()
+    decoder = IncrementalFrameDecoder(processing_rate=processing_rate)
     yield from decoder.ingest(samples)
 
 
-def read_from_microphone(*, device: str | None = None) -> Iterator[np.ndarray]:
+@dataclass(slots=True)
+class CaptureMetrics:
+    """Counters kept by `CallbackCapture`; `CallbackCapture.metrics` returns a snapshot."""
+
+    callbacks: int = 0
+    captured_samples: int = 0
+    # Callbacks flagged with a PortAudio input overflow.
+    input_overflows: int = 0
+    # Samples discarded because the decode thread fell a whole ring behind.
+    dropped_samples: int = 0
+    # Samples waiting in the ring when the snapshot was taken, and the high-water mark.
+    queue_depth: int = 0
+    max_queue_depth: int = 0
+    # Seconds from ADC capture of a block until the callback has stored it.
+    last_callback_latency: float = 0.0
+    max_callback_latency: float = 0.0
+
+
+class CallbackCapture:
+    """
+    Callback-driven microphone capture with a lock-free handoff to the decode thread.
+
+    The PortAudio callback only copies each block into a preallocated `SPSCRingBuffer` and
+    updates `metrics`; it never allocates or waits. The thread iterating `chunks()` drains
+    the ring, so a slow decode step grows the queue depth instead of overflowing the input.
+    A `threading.Event` only wakes an idle consumer; samples never pass through a lock.
+    """
+
+    def __init__(
+        self,
+        *,
+        device: str | None = None,
+        sample_rate: int = config.SAMPLE_RATE,
+        blocksize: int | None = None,
+        buffer_seconds: float = _CAPTURE_BUFFER_SECONDS,
+    ) -> None:
+        if buffer_seconds <= 0:
+            raise ValueError("buffer_seconds must be positive.")
+        self.device = device
+        self.sample_rate = sample_rate
+        self.blocksize = blocksize or max(1, int(round(0.1 * sample_rate)))
+        self._ring = utils.SPSCRingBuffer(int(round(buffer_seconds * sample_rate)))
+        self._metrics = CaptureMetrics()
+        self._ready = threading.Event()
+        self._stream = None
+        self._running = False
+
+    @property
+    def running(self) -> bool:
+        """Whether the input stream is delivering callbacks."""
+        return self._running
+
+    @property
+    def metrics(self) -> CaptureMetrics:
+        """Return a snapshot of the capture counters."""
+        return replace(self._metrics, queue_depth=len(self._ring))
+
+    def start(self) -> None:
+        """Open the input stream and start capturing."""
+        if sd is None:
+            raise RuntimeError(
+                "sounddevice is not installed. Install the 'sounddevice' dependency to enable "
+                "capture."
+            )
+        if self._stream is not None:
+            return
+        self._stream = sd.InputStream(
+            samplerate=self.sample_rate,
+            channels=1,
+            dtype="float32",
+            device=self.device,
+            blocksize=self.blocksize,
+            callback=self._callback,
+        )
+        self._running = True
+        self._stream.start()
+
+    def stop(self) -> None:
+        """Stop capturing; `chunks()` finishes once the ring is drained."""
+        stream, self._stream = self._stream, None
+        self._running = False
+        try:
+            if stream is not None:
+                stream.stop()
+                stream.close()
+        finally:
+            self._ready.set()
+
+    def __enter__(self) -> "CallbackCapture":
+        self.start()
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.stop()
+
+    def _callback(self, indata: np.ndarray, frames: int, time_info, status) -> None:
+        started = perf_counter()
+        metrics = self._metrics
+        metrics.callbacks += 1
+        if getattr(status, "input_overflow", False):
+            metrics.input_overflows += 1
+        accepted = self._ring.write(indata[:frames, 0])
+        metrics.captured_samples += accepted
+        metrics.dropped_samples += frames - accepted
+        metrics.max_queue_depth = max(metrics.max_queue_depth, len(self._ring))
+        latency = perf_counter() - started
+        adc_time = getattr(time_info, "inputBufferAdcTime", 0.0)
+        current_time = getattr(time_info, "currentTime", 0.0)
+        if adc_time > 0.0 and current_time >= adc_time:
+            latency += current_time - adc_time
+        metrics.last_callback_latency = latency
+        metrics.max_callback_latency = max(metrics.max_callback_latency, latency)
+        self._ready.set()
+
+    def chunks(
+        self, *, max_samples: int | None = None, poll_seconds: float = 0.5
+    ) -> Iterator[np.ndarray]:
+        """
+        Yield captured samples as float32 arrays until the capture stops and the ring is empty.
+
+        Run this on the decode thread. Each chunk holds everything queued since the previous
+        one, up to `max_samples`.
+        """
+        while True:
+            # Clear before checking so a callback landing in between still wakes us.
+            self._ready.clear()
+            if len(self._ring):
+                yield self._ring.read(max_samples)
+                continue
+            if not self._running:
+                return
+            self._ready.wait(poll_seconds)
+
+
+def read_from_microphone(
+    *, device: str | None = None, capture: str = "blocking", sample_rate: int | None = None
+) -> Iterator[np.ndarray]:
     """
     Capture audio chunks from an input device.
+
+    `capture="callback"` reads through a `CallbackCapture`, which keeps capturing while the
+    consumer is busy; the default `"blocking"` mode reads the stream on the caller's thread.
+    `sample_rate` opens the device at its own rate; the chunks are then resampled to
+    `config.SAMPLE_RATE` with a `resample.StreamingResampler`.
     """
+    device_rate = sample_rate or config.SAMPLE_RATE
+    yield from resample_chunks(
+        _capture_chunks(device=device, capture=capture, sample_rate=device_rate),
+        device_rate,
+        config.SAMPLE_RATE,
+    )
+
+
+def _capture_chunks(*, device: str | None, capture: str, sample_rate: int) -> Iterator[np.ndarray]:
+    if capture == "callback":
+        with CallbackCapture(device=device, sample_rate=sample_rate) as callback_capture:
+            yield from callback_capture.chunks()
+        return
+    if capture != "blocking":
+        raise ValueError(f"Unknown capture mode {capture!r}; choose 'blocking' or 'callback'.")
     if sd is None:
         raise RuntimeError(
             "sounddevice is not installed. Install the 'sounddevice' dependency to enable capture."
         )
 
-    sample_rate = config.SAMPLE_RATE
     blocksize = max(1, int(round(0.1 * sample_rate)))  # 100 ms blocks by default
 
     stream = sd.InputStream(
@@ -144,14 +390,9 @@ def read_from_microphone(*, device: str | None = None) -> Iterator[np.ndarray]:
         stream.close()
 
 
-def _find_sync(bits: list[int], pattern: list[int]) -> int:
+def _find_sync(bits: Sequence[int] | np.ndarray, pattern: Sequence[int] | np.ndarray) -> int:
     """Return the index of the first occurrence of pattern in bits, or -1."""
-    plen = len(pattern)
-    limit = len(bits) - plen + 1
-    for idx in range(max(0, limit)):
-        if bits[idx : idx + plen] == pattern:
-            return idx
-    return -1
+    return utils.find_sync(np.asarray(bits), np.asarray(pattern))
 
 
 def _find_tone_window(
@@ -162,8 +403,17 @@ def _find_tone_window(
     start_index: int,
     step_size: int | None = None,
     refine_forward: bool = False,
+    vectorized: bool = True,
+    on_evaluate: Callable[[int], None] | None = None,
 ) -> int:
-    """Return the index where the detector finds a tone window, or -1 if absent."""
+    """
+    Return the index where the detector finds a tone window, or -1 if absent.
+
+    When `vectorized` is set and the detector is a `ToneDetector`, window offsets are scored
+    in blocks via `ToneDetector.detect_windows`; otherwise each window is tested in turn.
+    Both paths visit the same offsets and return the same index. `on_evaluate`, if given,
+    is called with the number of windows scored by each detector invocation.
+    """
     if window_size <= 0:
         raise ValueError("window_size must be positive.")
     step = step_size or max(1, window_size // 10)
@@ -171,8 +421,32 @@ def _find_tone_window(
     limit = waveform.size - window_size
     if limit < start:
         return -1
+    if vectorized and isinstance(detector, ToneDetector):
+        idx = _first_detection(
+            waveform,
+            detector,
+            window_size=window_size,
+            start=start,
+            stop=limit,
+            step=step,
+            on_evaluate=on_evaluate,
+        )
+        if idx < 0 or not refine_forward:
+            return idx
+        return _refine_tone_window_forward(
+            waveform,
+            detector,
+            initial_index=idx,
+            window_size=window_size,
+            limit=limit,
+            base_step=step,
+            vectorized=True,
+            on_evaluate=on_evaluate,
+        )
     for idx in range(start, limit + 1, step):
         segment = waveform[idx : idx + window_size]
+        if on_evaluate is not None:
+            on_evaluate(1)
         if detector(segment):
             if not refine_forward:
                 return idx
@@ -183,10 +457,51 @@ def _find_tone_window(
                 window_size=window_size,
                 limit=limit,
                 base_step=step,
+                vectorized=False,
+                on_evaluate=on_evaluate,
             )
     return -1
 
 
+def _next_search_offset(start_index: int, limit: int, step: int) -> int:
+    """
+    Return the first offset on the `start_index + n * step` grid beyond `limit`.
+
+    After a search over `range(start_index, limit + 1, step)` found nothing, resuming from
+    this offset continues the same grid without scoring any window twice.
+    """
+    if limit < start_index:
+        return start_index
+    return start_index + ((limit - start_index) // step + 1) * step
+
+
+def _first_detection(
+    waveform: np.ndarray,
+    detector: ToneDetector,
+    *,
+    window_size: int,
+    start: int,
+    stop: int,
+    step: int,
+    expect: bool = True,
+    on_evaluate: Callable[[int], None] | None = None,
+) -> int:
+    """
+    Return the first offset in `range(start, stop + 1, step)` whose detection equals `expect`.
+    """
+    block_span = step * _TONE_SEARCH_BLOCK
+    for block_start in range(start, stop + 1, block_span):
+        block_stop = min(stop, block_start + block_span - step)
+        offsets = np.arange(block_start, block_stop + 1, step, dtype=np.int64)
+        if on_evaluate is not None:
+            on_evaluate(int(offsets.size))
+        hits = detector.detect_windows(waveform, offsets, window_size=window_size)
+        matches = np.flatnonzero(hits == expect)
+        if matches.size:
+            return int(offsets[matches[0]])
+    return -1
+
+
 def _refine_tone_window_forward(
     waveform: np.ndarray,
     detector: Callable[[np.ndarray], bool],
@@ -195,9 +510,42 @@ def _refine_tone_window_forward(
     window_size: int,
     limit: int,
     base_step: int,
+    vectorized: bool = False,
+    on_evaluate: Callable[[int], None] | None = None,
 ) -> int:
     """Refine a detected tone window forward to the last contiguous detection."""
     refine_step = max(1, base_step // 4)
+    if vectorized and isinstance(detector, ToneDetector):
+        # Coarse refinement: the last detection before the first miss.
+        miss = _first_detection(
+            waveform,
+            detector,
+            window_size=window_size,
+            start=initial_index + refine_step,
+            stop=limit,
+            step=refine_step,
+            expect=False,
+            on_evaluate=on_evaluate,
+        )
+        if miss < 0:
+            last_idx = initial_index + ((limit - initial_index) // refine_step) * refine_step
+        else:
+            last_idx = miss - refine_step
+        fine_limit = min(last_idx + refine_step, limit)
+        miss = _first_detection(
+            waveform,
+            detector,
+            window_size=window_size,
+            start=last_idx + 1,
+            stop=fine_limit,
+            step=1,
+            expect=False,
+            on_evaluate=on_evaluate,
+        )
+        if miss < 0:
+            return max(last_idx, fine_limit)
+        return miss - 1
+
     idx = initial_index
     last_idx = idx
     # Coarse refinement
@@ -206,6 +554,8 @@ def _refine_tone_window_forward(
         if next_idx > limit:
             break
         segment = waveform[next_idx : next_idx + window_size]
+        if on_evaluate is not None:
+            on_evaluate(1)
         if not detector(segment):
             break
         last_idx = next_idx
@@ -214,12 +564,47 @@ def _refine_tone_window_forward(
     fine_limit = min(last_idx + refine_step, limit)
     for next_idx in range(last_idx + 1, fine_limit + 1):
         segment = waveform[next_idx : next_idx + window_size]
+        if on_evaluate is not None:
+            on_evaluate(1)
         if not detector(segment):
             break
         last_idx = next_idx
     return last_idx
 
 
+def _first_crc_valid_frame(bits: np.ndarray, frame_starts: np.ndarray, *, baud: int) -> int:
+    """
+    Return the first bit offset in `frame_starts` that begins a CRC-valid frame, or -1.
+
+    Candidates whose header advertises a different rate than `baud`, or whose declared
+    length runs past the end of `bits`, are rejected before any CRC work. The survivors are
+    checked together with `framing.crc16_ccitt_batch`.
+    """
+    header_bits = Header.HEADER_LENGTH * 8
+    starts = frame_starts[frame_starts + header_bits <= bits.size]
+    if starts.size == 0:
+        return -1
+    header_index = starts[:, None] + np.arange(header_bits, dtype=np.int64)
+    headers = np.packbits(bits[header_index], axis=1).astype(np.int64)
+    rate_ok = headers[:, 1] == config.BAUD_TO_RATE_CODE.get(baud, -1)
+    core_lengths = Header.HEADER_LENGTH + ((headers[:, 3] << 8) | headers[:, 4])
+    fits = starts + (core_lengths + 2) * 8 <= bits.size
+    keep = rate_ok & fits
+    if not np.any(keep):
+        return -1
+    starts = starts[keep]
+    core_lengths = core_lengths[keep]
+
+    width = int(core_lengths.max()) + 2
+    bit_index = starts[:, None] + np.arange(width * 8, dtype=np.int64)
+    frames = np.packbits(bits[np.minimum(bit_index, bits.size - 1)], axis=1)
+    rows = np.arange(starts.size)
+    carried = (frames[rows, core_lengths].astype(np.uint16) << 8) | frames[rows, core_lengths + 1]
+    valid = framing.crc16_ccitt_batch(frames, core_lengths) == carried
+    matches = np.flatnonzero(valid)
+    return int(starts[matches[0]]) if matches.size else -1
+
+
 def _estimate_rssi(start_segment: np.ndarray, end_segment: np.ndarray) -> float:
     """Crude RSSI estimate based on average magnitude of start tone region."""
     del end_segment  # Placeholder for future refinement.
@@ -227,118 +612,339 @@ def _estimate_rssi(start_segment: np.ndarray, end_segment: np.ndarray) -> float:
     return 20.0 * np.log10(max(rms, 1e-12))
 
 
+def _max_frame_samples(sample_rate: int) -> int:
+    """Return the number of samples the decoders retain while a frame is in flight."""
+    max_frame_seconds = 0.0
+    # Rough upper bound: start tone + end tone + preamble + sync + payload at the
+    # slowest baud rate.
+    if config.BAUD_RATES:
+        slowest_baud = min(config.BAUD_RATES)
+        # Senders split longer messages, so one frame carries at most MAX_FRAME_PAYLOAD.
+        payload_bits = (Header.HEADER_LENGTH + config.MAX_FRAME_PAYLOAD + 2) * 8
+        max_frame_seconds = (
+            2 * (config.START_END_TONE_DURATION_MS / 1000.0)
+            + _PREAMBLE_SECONDS
+            + (len(_SYNC_BITS) + payload_bits) / float(slowest_baud)
+        )
+    # Fall back to 10 seconds if configuration lacks baud rates.
+    if max_frame_seconds <= 0.0:
+        max_frame_seconds = 10.0
+    return int(round(max_frame_seconds * sample_rate))
+
+
+def check_processing_rate(
+    sample_rate: int, processing_rate: int, channels: Sequence[config.ChannelPlan]
+) -> None:
+    """
+    Raise ValueError unless `processing_rate` can decode `channels` captured at `sample_rate`.
+
+    The rate must not exceed `sample_rate`, must be a whole multiple of every baud rate,
+    and must keep all of the channels' tones well inside its Nyquist band.
+    """
+    if processing_rate <= 0:
+        raise ValueError("processing_rate must be positive.")
+    if processing_rate > sample_rate:
+        raise ValueError("processing_rate must not exceed sample_rate.")
+    unsupported = [baud for baud in config.BAUD_RATES if processing_rate % baud != 0]
+    if unsupported:
+        raise ValueError(
+            f"processing_rate {processing_rate} Hz is not a multiple of baud {unsupported[0]}."
+        )
+    highest = max(max(channel.frequencies) for channel in channels)
+    if highest >= _PROCESSING_BANDWIDTH * processing_rate:
+        raise ValueError(
+            f"processing_rate {processing_rate} Hz is too low for a {highest:g} Hz tone."
+        )
+
+
+def _processing_decimator(
+    sample_rate: int, processing_rate: int, channels: Sequence[config.ChannelPlan]
+) -> StreamingResampler | None:
+    """Validate a decoder's processing rate; return its resampler, or None if not needed."""
+    check_processing_rate(sample_rate, processing_rate, channels)
+    if processing_rate == sample_rate:
+        return None
+    return StreamingResampler(sample_rate, processing_rate)
+
+
+def _ranked_bauds(demodulator: MultiRateDemodulator) -> list[tuple[int, np.ndarray]]:
+    """
+    Return `(baud, bits)` for every usable baud rate, most plausible first.
+
+    Each candidate is demodulated at its own recovered symbol timing, so a data section
+    that starts mid-symbol still yields clean bits. Candidates whose mean confidence is
+    well below the best keep their configured order but move behind the plausible ones.
+    """
+    candidates = []
+    for baud in config.BAUD_RATES:
+        try:
+            symbols = demodulator.demodulate_timed(baud)
+        except ValueError:
+            continue
+        score = float(symbols.confidence.mean()) if len(symbols) else 0.0
+        candidates.append((baud, symbols.bits, score))
+    if not candidates:
+        return []
+    floor = _BAUD_CONFIDENCE_RATIO * max(score for _, _, score in candidates)
+    candidates.sort(key=lambda candidate: candidate[2] < floor)
+    return [(baud, bits) for baud, bits, _ in candidates]
+
+
+def _parse_data_segment(
+    data_segment: np.ndarray,
+    *,
+    channel: config.ChannelPlan,
+    sample_rate: int,
+    on_attempt: Callable[[], None] | None = None,
+) -> tuple[int, Header, bytes] | None:
+    """
+    Demodulate the samples between the start and end tones into `(baud, header, payload)`.
+
+    `on_attempt`, if given, is called for every baud candidate searched for a frame.
+    """
+    sync_len = _SYNC_BITS.size
+    header_bits = Header.HEADER_LENGTH * 8
+    # Mark/space products are computed once and shared by every candidate rate.
+    demodulator = MultiRateDemodulator(data_segment, sample_rate=sample_rate, channel=channel)
+    for baud, bits in _ranked_bauds(demodulator):
+        if bits.size < sync_len + header_bits:
+            continue
+        if on_attempt is not None:
+            on_attempt()
+
+        # Every sync hit is screened at once: header rate and length first, then a batch
+        # CRC over all surviving alignments. Only the first passing one is parsed.
+        frame_start = _first_crc_valid_frame(
+            bits, utils.find_sync_all(bits, _SYNC_BITS) + sync_len, baud=baud
+        )
+        if frame_start < 0:
+            continue
+
+        header = Header.from_bytes(utils.pack_bits(bits[frame_start : frame_start + header_bits]))
+        expected_total = Header.HEADER_LENGTH + header.length + 2
+        frame_bits = bits[frame_start : frame_start + expected_total * 8]
+        try:
+            parsed_header, payload = framing.parse_frame(utils.pack_bits(frame_bits))
+        except ValueError:
+            continue
+        return baud, parsed_header, payload
+
+    return None
+
+
 class IncrementalFrameDecoder:
     """
     Incremental frame decoder that can accept new audio samples over time.
+
+    Tone searches use the vectorized `ToneDetector.detect_windows` path by default. Pass
+    `tone_search="reference"` to test every window with the per-window Goertzel detector
+    instead; both modes visit the same offsets and decode the same frames.
+
+    Search progress survives between calls to `ingest`: once a start tone is found, the
+    decoder remembers it and the last end-tone offset already scored, so each new chunk only
+    costs the windows it completes. `detector_evaluations` counts every window scored.
+
+    Data sections are demodulated with symbol timing recovery, and baud rates are tried in
+    order of symbol confidence; `parse_attempts` counts the candidates searched for a frame.
+
+    `channel` selects the tone set to listen for; use `MultiChannelFrameDecoder` to follow
+    several channels from one capture.
+
+    `processing_rate` optionally runs the whole pipeline below `sample_rate`: ingested
+    audio is band-limited and decimated once by a `resample.StreamingResampler`, and tone
+    detection and demodulation then work on the shorter windows and symbols of the lower
+    rate. `FrameMetadata.sample_offset` is still reported in input samples.
     """
 
-    def __init__(self, *, sample_rate: int = config.SAMPLE_RATE) -> None:
+    TONE_SEARCH_MODES: ClassVar[tuple[str, ...]] = ("vectorized", "reference")
+
+    def __init__(
+        self,
+        *,
+        sample_rate: int = config.SAMPLE_RATE,
+        tone_search: str = "vectorized",
+        channel: config.ChannelPlan = config.DEFAULT_CHANNEL,
+        processing_rate: int | None = None,
+    ) -> None:
+        if tone_search not in self.TONE_SEARCH_MODES:
+            raise ValueError(
+                f"Unknown tone_search mode {tone_search!r}; choose from {self.TONE_SEARCH_MODES}."
+            )
         self.sample_rate = sample_rate
-        self._buffer = np.empty(0, dtype=np.float64)
+        self.processing_rate = processing_rate or sample_rate
+        self._decimator = _processing_decimator(sample_rate, self.processing_rate, (channel,))
+        self.tone_search = tone_search
+        self.channel = channel
+        self._start_detector, self._end_detector = channel_tone_detectors(
+            channel, self.processing_rate
+        )
+        self._vectorized = tone_search == "vectorized"
         self._search_index = 0
+        # Start tone of a frame whose end tone has not been found yet, and the next end-tone
+        # offset to score for it. Both are buffer-relative and shift with `_consume`.
+        self._pending_start: int | None = None
+        self._end_search_index = 0
+        self._detector_evaluations = 0
+        self._parse_attempts = 0
+        # Samples dropped from the front of the ring so far; buffer index + this is the
+        # absolute stream offset.
+        self._consumed = 0
         self._tone_samples = int(
-            round(self.sample_rate * (config.START_END_TONE_DURATION_MS / 1000.0))
+            round(self.processing_rate * (config.START_END_TONE_DURATION_MS / 1000.0))
         )
-        self._sync_bits = utils.bits_from_bytes(b"\xDD\xAA")
-        max_frame_seconds = 0.0
-        # Rough upper bound: start tone + end tone + payload at the slowest baud rate.
-        if config.BAUD_RATES:
-            slowest_baud = min(config.BAUD_RATES)
-            # Assume a conservative upper bound of 512 payload bytes + header + CRC.
-            payload_bits = (Header.HEADER_LENGTH + 512 + 2) * 8
-            max_frame_seconds = (
-                2 * (config.START_END_TONE_DURATION_MS / 1000.0)
-                + payload_bits / float(slowest_baud)
-            )
-        # Fall back to 10 seconds if configuration lacks baud rates.
-        if max_frame_seconds <= 0.0:
-            max_frame_seconds = 10.0
-        max_frame_samples = int(round(max_frame_seconds * self.sample_rate))
+        self._search_step = max(1, self._tone_samples // 10)
         # Keep at least the tone window plus the max frame budget to avoid truncation.
-        self._tail_keep = max(max_frame_samples, self._tone_samples * 2)
+        self._tail_keep = max(_max_frame_samples(self.processing_rate), self._tone_samples * 2)
+        # The retained tail never exceeds `_tail_keep`, so one ingest block of headroom on
+        # top of it is all the storage the decoder ever needs.
+        ingest_block = max(1, int(round(_INGEST_BLOCK_SECONDS * self.processing_rate)))
+        self._ring = utils.RingBuffer(self._tail_keep + ingest_block, dtype=np.float32)
+
+    @property
+    def capacity(self) -> int:
+        """Maximum number of samples retained between calls to `ingest`."""
+        return self._ring.capacity
+
+    @property
+    def buffered_samples(self) -> int:
+        """Number of samples currently held for tone and frame search."""
+        return len(self._ring)
+
+    @property
+    def max_frame_samples(self) -> int:
+        """Longest span, in input samples, the decoder retains while waiting for an end tone."""
+        return -(-self._tail_keep * self.sample_rate // self.processing_rate)
+
+    @property
+    def detector_evaluations(self) -> int:
+        """Total number of tone windows scored since the decoder was created."""
+        return self._detector_evaluations
+
+    @property
+    def parse_attempts(self) -> int:
+        """Total number of baud candidates searched for a frame since creation."""
+        return self._parse_attempts
+
+    def _count_evaluations(self, count: int) -> None:
+        self._detector_evaluations += count
+
+    def _count_attempt(self) -> None:
+        self._parse_attempts += 1
 
     def ingest(
         self, samples: Iterable[float] | np.ndarray
     ) -> Iterator[tuple[FrameMetadata, Header, bytes]]:
         """
         Append samples into the decoder and yield any frames that can be parsed.
+
+        Samples are copied into a fixed-size ring buffer; inputs larger than its free space
+        are processed in pieces, so memory use does not depend on the chunk size or on how
+        long the session runs.
         """
         if isinstance(samples, np.ndarray):
-            array = np.asarray(samples, dtype=np.float64)
+            array = np.asarray(samples, dtype=np.float32)
         else:
-            array = np.asarray(list(samples), dtype=np.float64)
+            array = np.asarray(list(samples), dtype=np.float32)
 
         if array.ndim != 1:
             raise ValueError("samples must be a one-dimensional sequence.")
+        if self._decimator is not None:
+            array = self._decimator.process(array)
         if array.size == 0:
             return iter(())
 
-        if self._buffer.size == 0:
-            self._buffer = array.copy()
-        else:
-            self._buffer = np.concatenate((self._buffer, array))
-
-        return self._extract_frames()
+        frames: list[tuple[FrameMetadata, Header, bytes]] = []
+        position = 0
+        while position < array.size:
+            take = min(array.size - position, self._ring.free)
+            self._ring.append(array[position : position + take])
+            position += take
+            frames.extend(self._extract_frames())
+            # A pending frame that has outgrown `_tail_keep` is longer than any valid frame
+            # (e.g. a false start detection), so it is safe to let its start fall off.
+            self._keep_recent_tail()
+        return iter(frames)
 
     def _extract_frames(self) -> Iterator[tuple[FrameMetadata, Header, bytes]]:
         frames: list[tuple[FrameMetadata, Header, bytes]] = []
-        if self._buffer.size <= self._tone_samples * 2:
+        if len(self._ring) <= self._tone_samples * 2:
             return iter(frames)
 
-        guard_samples = max(1, self._tone_samples // 8)
         while True:
-            if self._buffer.size <= self._tone_samples * 2:
+            # Views are only valid until the next append, so refresh after every consume.
+            buffer = self._ring.view()
+            if buffer.size <= self._tone_samples * 2:
                 self._keep_recent_tail()
                 break
 
-            start_index = _find_tone_window(
-                self._buffer,
-                detect_start_tone,
-                window_size=self._tone_samples,
-                start_index=self._search_index,
-            )
-
-            if start_index < 0:
-                self._search_index = max(0, self._buffer.size - self._tone_samples)
-                self._keep_recent_tail()
-                break
+            window_limit = buffer.size - self._tone_samples
+            if self._pending_start is not None:
+                start_index = self._pending_start
+                end_search_index = self._end_search_index
+            else:
+                start_index = _find_tone_window(
+                    buffer,
+                    self._start_detector,
+                    window_size=self._tone_samples,
+                    start_index=self._search_index,
+                    step_size=self._search_step,
+                    vectorized=self._vectorized,
+                    on_evaluate=self._count_evaluations,
+                )
+                if start_index < 0:
+                    self._search_index = _next_search_offset(
+                        self._search_index, window_limit, self._search_step
+                    )
+                    self._keep_recent_tail()
+                    break
+                end_search_index = start_index + self._tone_samples
 
             start_end = start_index + self._tone_samples
-            if start_end >= self._buffer.size:
-                self._trim_prefix_for_partial(start_index)
+            if start_end >= buffer.size:
+                self._trim_prefix_for_partial(start_index, end_search_index)
                 break
 
             end_index = _find_tone_window(
-                self._buffer,
-                detect_end_tone,
+                buffer,
+                self._end_detector,
                 window_size=self._tone_samples,
-                start_index=start_end,
+                start_index=end_search_index,
+                step_size=self._search_step,
                 refine_forward=True,
+                vectorized=self._vectorized,
+                on_evaluate=self._count_evaluations,
             )
             if end_index < 0:
-                self._trim_prefix_for_partial(start_index)
+                self._trim_prefix_for_partial(
+                    start_index,
+                    _next_search_offset(end_search_index, window_limit, self._search_step),
+                )
                 break
 
             end_end = end_index + self._tone_samples
-            if end_end > self._buffer.size:
-                self._trim_prefix_for_partial(start_index)
+            if end_end > buffer.size:
+                self._trim_prefix_for_partial(start_index, end_search_index)
                 break
 
-            data_end_index = min(
-                end_index + guard_samples, end_index + self._tone_samples, self._buffer.size
-            )
-            data_segment = self._buffer[start_end:data_end_index]
+            # The end-tone window may have been detected while still overlapping the last data
+            # symbols (e.g. when the buffer ended mid-tone), so keep the whole window; bits
+            # past the CRC are ignored by the parser.
+            data_end_index = min(end_index + self._tone_samples, buffer.size)
+            data_segment = buffer[start_end:data_end_index]
             if data_segment.size <= 0:
                 self._consume(end_end)
                 continue
 
-            start_segment = self._buffer[start_index:start_end]
-            end_segment = self._buffer[end_index:end_end]
+            start_segment = buffer[start_index:start_end]
+            end_segment = buffer[end_index:end_end]
 
             frame = self._parse_frame_from_segment(
                 data_segment=data_segment,
                 start_segment=start_segment,
                 end_segment=end_segment,
+                sample_offset=_input_offset(
+                    self._consumed + start_index, self.sample_rate, self.processing_rate
+                ),
             )
             if frame is None:
                 # Could not parse; drop this window and continue searching.
@@ -357,100 +963,384 @@ class IncrementalFrameDecoder:
         data_segment: np.ndarray,
         start_segment: np.ndarray,
         end_segment: np.ndarray,
+        sample_offset: int | None = None,
     ) -> tuple[FrameMetadata, Header, bytes] | None:
-        sync_len = len(self._sync_bits)
-        for baud in config.BAUD_RATES:
-            try:
-                bits = demodulate_afsk(data_segment, baud=baud)
-            except ValueError:
-                continue
-
-            if len(bits) < sync_len + Header.HEADER_LENGTH * 8:
-                continue
-
-            sync_index = _find_sync(bits, self._sync_bits)
-            if sync_index < 0:
-                continue
-
-            post_sync_bits = bits[sync_index + sync_len :]
-            usable_len = len(post_sync_bits) - (len(post_sync_bits) % 8)
-            if usable_len < Header.HEADER_LENGTH * 8:
-                continue
-
-            frame_bits = post_sync_bits[:usable_len]
-            frame_bytes = utils.bytes_from_bits(frame_bits)
-
-            if len(frame_bytes) < Header.HEADER_LENGTH + 2:
-                continue
-
-            try:
-                header = Header.from_bytes(frame_bytes[: Header.HEADER_LENGTH])
-            except ValueError:
-                continue
-
-            expected_total = Header.HEADER_LENGTH + header.length + 2
-            if len(frame_bytes) < expected_total:
-                continue
-
-            frame_payload_bytes = frame_bytes[:expected_total]
-            try:
-                parsed_header, payload = framing.parse_frame(frame_payload_bytes)
-            except ValueError:
-                continue
-
-            metadata = FrameMetadata(
-                timestamp=time(),
-                detected_baud=baud,
-                rssi=_estimate_rssi(start_segment, end_segment),
-            )
-            return metadata, parsed_header, payload
-
-        return None
+        parsed = _parse_data_segment(
+            data_segment,
+            channel=self.channel,
+            sample_rate=self.processing_rate,
+            on_attempt=self._count_attempt,
+        )
+        if parsed is None:
+            return None
+        baud, header, payload = parsed
+        metadata = FrameMetadata(
+            timestamp=time(),
+            detected_baud=baud,
+            rssi=_estimate_rssi(start_segment, end_segment),
+            sample_offset=sample_offset,
+        )
+        return metadata, header, payload
 
     def _consume(self, count: int) -> None:
-        if count <= 0 or self._buffer.size == 0:
+        if count <= 0 or len(self._ring) == 0:
             return
-        if count >= self._buffer.size:
-            self._buffer = np.empty(0, dtype=np.float64)
+        if count >= len(self._ring):
+            self._consumed += len(self._ring)
+            self._ring.clear()
             self._search_index = 0
+            self._pending_start = None
             return
-        self._buffer = self._buffer[count:]
+        self._ring.consume(count)
+        self._consumed += count
         self._search_index = max(0, self._search_index - count)
-
-    def _trim_prefix_for_partial(self, start_index: int) -> None:
+        if self._pending_start is not None:
+            self._pending_start -= count
+            self._end_search_index -= count
+            if self._pending_start < 0:
+                # The pending start tone fell off the buffer; search afresh.
+                self._pending_start = None
+
+    def _trim_prefix_for_partial(self, start_index: int, end_search_index: int) -> None:
+        # Remember the detected start tone and end-tone progress for the next chunk.
+        self._pending_start = start_index
+        self._end_search_index = end_search_index
         # Keep a guard region before the detected start tone.
         guard = max(self._tone_samples, 1)
         drop = max(0, start_index - guard)
         if drop > 0:
             self._consume(drop)
             start_index -= drop
-        max_start = max(0, self._buffer.size - self._tone_samples)
+        max_start = max(0, len(self._ring) - self._tone_samples)
         self._search_index = min(start_index, max_start)
 
     def _keep_recent_tail(self) -> None:
-        if self._buffer.size <= self._tail_keep:
+        if len(self._ring) <= self._tail_keep:
             return
-        drop = self._buffer.size - self._tail_keep
+        drop = len(self._ring) - self._tail_keep
         self._consume(drop)
 
 
+def _input_offset(offset: int, sample_rate: int, processing_rate: int) -> int:
+    """Convert a sample offset at the processing rate back to input samples."""
+    if sample_rate == processing_rate:
+        return offset
+    return int(round(offset * sample_rate / processing_rate))
+
+
+def _tone_rssi(power: float, window_size: int) -> float:
+    """RSSI of a pure tone from its Goertzel power over `window_size` samples."""
+    rms = float(np.sqrt(2.0 * max(power, 0.0))) / window_size
+    return 20.0 * np.log10(max(rms, 1e-12))
+
+
+class MultiChannelFrameDecoder:
+    """
+    Decode several frequency-division AFSK channels from one shared capture buffer.
+
+    Every ingested sample is copied once into a single ring buffer. Tone search scores the
+    start and end tones of all channels together: one `GoertzelBank` covering every
+    channel's start, end, mark and space tones is evaluated per block of window offsets,
+    and each channel applies the `ToneDetector` dominance and energy tests to its own four
+    bins. When a channel's end tone arrives, only its data section is mixed down with a
+    `MultiRateDemodulator` at that channel's mark and space tones.
+
+    `ingest` yields `(channel_index, frame)` pairs in the order the frames end, where
+    `frame` is the usual `(metadata, header, payload)` tuple and `channel_index` indexes
+    `channels`.
+
+    `processing_rate` decimates the capture once at ingest, as in `IncrementalFrameDecoder`;
+    it must leave every channel's tones inside the decimated band.
+    """
+
+    def __init__(
+        self,
+        channels: Sequence[config.ChannelPlan] | None = None,
+        *,
+        sample_rate: int = config.SAMPLE_RATE,
+        processing_rate: int | None = None,
+    ) -> None:
+        self.channels: tuple[config.ChannelPlan, ...] = (
+            tuple(channels) if channels is not None else (config.DEFAULT_CHANNEL,)
+        )
+        if not self.channels:
+            raise ValueError("channels must contain at least one ChannelPlan.")
+        self.sample_rate = sample_rate
+        self.processing_rate = processing_rate or sample_rate
+        self._decimator = _processing_decimator(sample_rate, self.processing_rate, self.channels)
+        self._tone_samples = int(
+            round(self.processing_rate * (config.START_END_TONE_DURATION_MS / 1000.0))
+        )
+        self._search_step = max(1, self._tone_samples // 10)
+        self._tail_keep = max(_max_frame_samples(self.processing_rate), self._tone_samples * 2)
+        ingest_block = max(1, int(round(_INGEST_BLOCK_SECONDS * self.processing_rate)))
+        self._ring = utils.RingBuffer(self._tail_keep + ingest_block, dtype=np.float32)
+        detectors = [
+            channel_tone_detectors(channel, self.processing_rate) for channel in self.channels
+        ]
+        self._end_detectors = tuple(end for _, end in detectors)
+        self._energy_ratio_threshold = np.array(
+            [start.energy_ratio_threshold for start, _ in detectors]
+        )[:, None]
+        self._dominance_threshold = np.array(
+            [start.dominance_threshold for start, _ in detectors]
+        )[:, None]
+        self._bank = goertzel_bank(
+            self._tone_samples,
+            tuple(f for channel in self.channels for f in channel.frequencies),
+            self.processing_rate,
+        )
+        # Absolute sample index of the oldest buffered sample and of the next window offset
+        # to score. Per channel: the absolute start of a frame awaiting its end tone, and
+        # the first offset where a new start tone may be accepted.
+        self._origin = 0
+        self._scan = 0
+        self._pending: list[int | None] = [None] * len(self.channels)
+        self._resume = [0] * len(self.channels)
+
+    @property
+    def capacity(self) -> int:
+        """Maximum number of samples retained between calls to `ingest`."""
+        return self._ring.capacity
+
+    @property
+    def buffered_samples(self) -> int:
+        """Number of samples currently held for tone and frame search."""
+        return len(self._ring)
+
+    def ingest(
+        self, samples: Iterable[float] | np.ndarray
+    ) -> Iterator[tuple[int, tuple[FrameMetadata, Header, bytes]]]:
+        """Append samples and yield `(channel_index, frame)` for every frame completed."""
+        if isinstance(samples, np.ndarray):
+            array = np.asarray(samples, dtype=np.float32)
+        else:
+            array = np.asarray(list(samples), dtype=np.float32)
+
+        if array.ndim != 1:
+            raise ValueError("samples must be a one-dimensional sequence.")
+        if self._decimator is not None:
+            array = self._decimator.process(array)
+
+        frames: list[tuple[int, tuple[FrameMetadata, Header, bytes]]] = []
+        position = 0
+        while position < array.size:
+            take = min(array.size - position, self._ring.free)
+            self._ring.append(array[position : position + take])
+            position += take
+            frames.extend(self._scan_buffer())
+            self._release()
+        return iter(frames)
+
+    def _detect(self, buffer: np.ndarray, offsets: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+        """Return `(start_hits, end_hits)`, each of shape `(channels, offsets)`."""
+        powers = self._bank.sliding_power(buffer, offsets).reshape(
+            len(self.channels), 4, offsets.size
+        )
+        lo = int(offsets[0])
+        span = np.asarray(buffer[lo : int(offsets[-1]) + self._tone_samples], dtype=np.float64)
+        energy = np.empty(span.size + 1, dtype=np.float64)
+        energy[0] = 0.0
+        np.cumsum(span * span, out=energy[1:])
+        relative = offsets - lo
+        total_power = energy[relative + self._tone_samples] - energy[relative]
+        safe_total = np.where(total_power > 0.0, total_power, np.inf)
+
+        def hits(tone: np.ndarray, others: np.ndarray) -> np.ndarray:
+            strongest_other = np.maximum(others.max(axis=1), 1e-12)
+            return (
+                (tone > 0.0)
+                & (tone / strongest_other > self._dominance_threshold)
+                & (tone / safe_total > self._energy_ratio_threshold)
+            )
+
+        start_hits = hits(powers[:, 0], powers[:, 1:])
+        end_hits = hits(powers[:, 1], powers[:, (0, 2, 3)])
+        return start_hits, end_hits
+
+    def _scan_buffer(self) -> list[tuple[int, tuple[FrameMetadata, Header, bytes]]]:
+        buffer = self._ring.view()
+        limit = self._origin + buffer.size - self._tone_samples
+        found: list[tuple[int, int, tuple[FrameMetadata, Header, bytes]]] = []
+        block_span = self._search_step * _TONE_SEARCH_BLOCK
+        while self._scan <= limit:
+            stop = min(limit, self._scan + block_span - self._search_step)
+            offsets = np.arange(self._scan, stop + 1, self._search_step, dtype=np.int64)
+            start_hits, end_hits = self._detect(buffer, offsets - self._origin)
+            for index in range(len(self.channels)):
+                found.extend(
+                    self._advance_channel(
+                        index, buffer, offsets, start_hits[index], end_hits[index]
+                    )
+                )
+            self._scan = int(offsets[-1]) + self._search_step
+        found.sort(key=lambda item: item[0])
+        return [(index, frame) for _, index, frame in found]
+
+    def _advance_channel(
+        self,
+        index: int,
+        buffer: np.ndarray,
+        offsets: np.ndarray,
+        start_hits: np.ndarray,
+        end_hits: np.ndarray,
+    ) -> list[tuple[int, int, tuple[FrameMetadata, Header, bytes]]]:
+        """Follow one channel through a block of scored offsets."""
+        found: list[tuple[int, int, tuple[FrameMetadata, Header, bytes]]] = []
+        while True:
+            if self._pending[index] is None:
+                candidates = np.flatnonzero(start_hits & (offsets >= self._resume[index]))
+                if candidates.size == 0:
+                    return found
+                self._pending[index] = int(offsets[candidates[0]])
+            start = self._pending[index]
+            candidates = np.flatnonzero(end_hits & (offsets >= start + self._tone_samples))
+            if candidates.size == 0:
+                return found
+
+            end = self._origin + _refine_tone_window_forward(
+                buffer,
+                self._end_detectors[index],
+                initial_index=int(offsets[candidates[0]]) - self._origin,
+                window_size=self._tone_samples,
+                limit=buffer.size - self._tone_samples,
+                base_step=self._search_step,
+                vectorized=True,
+            )
+            self._pending[index] = None
+            self._resume[index] = end + self._tone_samples
+            frame = self._parse(index, buffer, start, end)
+            if frame is not None:
+                found.append((end, index, frame))
+
+    def _parse(
+        self, index: int, buffer: np.ndarray, start: int, end: int
+    ) -> tuple[FrameMetadata, Header, bytes] | None:
+        channel = self.channels[index]
+        start_rel = start - self._origin
+        end_rel = end - self._origin
+        # As in `IncrementalFrameDecoder`, keep the whole end-tone window in the data
+        # section; bits past the CRC are ignored by the parser.
+        data_segment = buffer[start_rel + self._tone_samples : end_rel + self._tone_samples]
+        if data_segment.size == 0:
+            return None
+        parsed = _parse_data_segment(
+            data_segment, channel=channel, sample_rate=self.processing_rate
+        )
+        if parsed is None:
+            return None
+        baud, header, payload = parsed
+        # The start segment also carries the other channels, so measure the start tone's
+        # own bin instead of the segment's total energy.
+        tone_power = goertzel_bank(
+            self._tone_samples, (channel.start_tone,), self.processing_rate
+        ).power(buffer[start_rel : start_rel + self._tone_samples])[0]
+        metadata = FrameMetadata(
+            timestamp=time(),
+            detected_baud=baud,
+            rssi=_tone_rssi(float(tone_power), self._tone_samples),
+            sample_offset=_input_offset(start, self.sample_rate, self.processing_rate),
+        )
+        return metadata, header, payload
+
+    def _release(self) -> None:
+        end = self._origin + len(self._ring)
+        keep_from = min([self._scan, *(p for p in self._pending if p is not None)])
+        # A frame still pending after `_tail_keep` samples is longer than any valid frame
+        # (e.g. a false start detection), so its start is allowed to fall off.
+        floor = end - self._tail_keep
+        if keep_from < floor:
+            for index, pending in enumerate(self._pending):
+                if pending is not None and pending < floor:
+                    self._pending[index] = None
+                    self._resume[index] = max(self._resume[index], floor)
+            keep_from = floor
+        drop = keep_from - self._origin
+        if drop > 0:
+            self._ring.consume(drop)
+            self._origin = keep_from
+
+
+class FrameReassembler:
+    """
+    Rebuild multi-frame messages from frames produced by `tx.TransmitQueue`.
+
+    Sequence numbers and the more-fragments bit are read from `Header.flags`. A fragment with
+    sequence 0 starts a new message; a gap or out-of-order fragment drops the partial message.
+    """
+
+    def __init__(self) -> None:
+        self._fragments: list[bytes] = []
+        self._next_sequence = 0
+
+    @property
+    def pending_fragments(self) -> int:
+        """Number of fragments buffered for the message in progress."""
+        return len(self._fragments)
+
+    def reset(self) -> None:
+        """Discard any partially received message."""
+        self._fragments.clear()
+        self._next_sequence = 0
+
+    def push(self, header: Header, payload: bytes) -> bytes | None:
+        """Add a decoded frame and return the full message once its last fragment arrives."""
+        sequence = header.flags & config.FLAG_SEQUENCE_MASK
+        if sequence == 0:
+            self.reset()
+        elif not self._fragments or sequence != self._next_sequence:
+            self.reset()
+            return None
+
+        self._fragments.append(payload)
+        self._next_sequence = (sequence + 1) & config.FLAG_SEQUENCE_MASK
+        if header.flags & config.FLAG_MORE_FRAGMENTS:
+            return None
+        message = b"".join(self._fragments)
+        self.reset()
+        return message
+
+
 def stream_frames_from_chunks(
-    chunks: Iterable[np.ndarray],
+    chunks: Iterable[np.ndarray], *, processing_rate: int | None = None
 ) -> Iterator[tuple[FrameMetadata, Header, bytes]]:
     """
     Consume a sequence of sample chunks and yield frames as they are decoded.
     """
-    decoder = IncrementalFrameDecoder()
+    decoder = IncrementalFrameDecoder(processing_rate=processing_rate)
+    for chunk in chunks:
+        yield from decoder.ingest(chunk)
+
+
+def stream_channel_frames_from_chunks(
+    chunks: Iterable[np.ndarray],
+    channels: Sequence[config.ChannelPlan],
+    *,
+    processing_rate: int | None = None,
+) -> Iterator[tuple[int, tuple[FrameMetadata, Header, bytes]]]:
+    """
+    Consume sample chunks and yield `(channel_index, frame)` for every channel in `channels`.
+    """
+    decoder = MultiChannelFrameDecoder(channels, processing_rate=processing_rate)
     for chunk in chunks:
         yield from decoder.ingest(chunk)
 
 
 def stream_frames_from_microphone(
-    *, device: str | None = None
+    *,
+    device: str | None = None,
+    capture: str = "blocking",
+    sample_rate: int | None = None,
+    processing_rate: int | None = None,
 ) -> Iterator[tuple[FrameMetadata, Header, bytes]]:
     """
     Convenience wrapper that listens to the microphone and yields frames continuously.
+
+    `processing_rate` is passed to the `IncrementalFrameDecoder` to decode at a decimated rate.
     """
-    for frame in stream_frames_from_chunks(read_from_microphone(device=device)):
+    for frame in stream_frames_from_chunks(
+        read_from_microphone(device=device, capture=capture, sample_rate=sample_rate),
+        processing_rate=processing_rate,
+    ):
         yield frame
 
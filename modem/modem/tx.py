@@ -1,15 +1,20 @@
 """
 Transmission helpers for the audio modem.
 
-This module will eventually integrate with sounddevice for live playback and
-wave file emission. The stubs below provide the intended surface area.
+Transmissions are synthesized as fixed-size sample blocks so that live playback through
+sounddevice and WAV emission can stream long or repeated frames without holding the
+whole waveform in memory.
 """
 
 from __future__ import annotations
 
+import itertools
+import queue
+import struct
+import threading
+from functools import lru_cache
 from pathlib import Path
-from pathlib import Path
-from typing import Iterable, Sequence
+from typing import Callable, Iterable, Iterator
 
 import numpy as np
 
@@ -49,19 +54,41 @@ def _sine_tone(
     return tone.astype(np.float32, copy=False)
 
 
-def assemble_transmission(
-    text: str,
-    *,
-    header: Header,
-    repeats: int = 1,
-) -> Iterable[float]:
-    """
-    Yield audio samples for the provided text payload.
+# Default number of samples per block handed to the output stream or WAV writer.
+TX_BLOCK_SIZE = 4096
+# Blocks buffered between the synthesis thread and the audio callback.
+_PLAYBACK_QUEUE_BLOCKS = 16
+# Output level applied to every transmission to avoid clipping.
+_OUTPUT_LEVEL = 0.8
+_WAV_HEADER_BYTES = 58
+
+
+@lru_cache(maxsize=16)
+def _frame_tones(
+    sample_rate: int, channel: config.ChannelPlan = config.DEFAULT_CHANNEL
+) -> tuple[ArrayLike, ArrayLike]:
+    """Return the read-only start and end tones shared by every frame on `channel`."""
+    tones = []
+    for frequency in (channel.start_tone, channel.end_tone):
+        tone = _sine_tone(
+            frequency,
+            config.START_END_TONE_DURATION_MS / 1000.0,
+            sample_rate=sample_rate,
+        )
+        tone.setflags(write=False)
+        tones.append(tone)
+    return tones[0], tones[1]
+
+
+def _transmission_segments(
+    payload: bytes, *, header: Header, channel: config.ChannelPlan = config.DEFAULT_CHANNEL
+) -> Callable[[int], Iterator[ArrayLike]]:
     """
-    if repeats <= 0:
-        raise ValueError("repeats must be a positive integer.")
+    Validate the payload and return a factory for one frame's unscaled sample blocks.
 
-    payload = text.encode("utf-8")
+    The factory yields the start tone, the AFSK data section in blocks of at most the
+    requested size, and the end tone. Calling it again re-synthesizes the frame.
+    """
     if header.length != len(payload):
         raise ValueError(
             f"Header length ({header.length}) does not match payload ({len(payload)})."
@@ -71,80 +98,383 @@ def assemble_transmission(
     sample_rate = config.SAMPLE_RATE
 
     frame_bytes = framing.build_frame(header, payload)
-    frame_bits: Sequence[int] = utils.bits_from_bytes(frame_bytes)
+    frame_bits = utils.unpack_bits(frame_bytes)
 
     preamble_symbol_count = max(1, int(round(0.2 * baud)))
-    preamble_bits = [0, 1] * ((preamble_symbol_count + 1) // 2)
-    preamble_bits = preamble_bits[:preamble_symbol_count]
+    preamble_bits = np.arange(preamble_symbol_count, dtype=np.uint8) & 0x01
 
-    sync_bits = utils.bits_from_bytes(b"\xDD\xAA")
-    bitstream = list(preamble_bits) + list(sync_bits) + list(frame_bits)
+    sync_bits = utils.unpack_bits(b"\xDD\xAA")
+    bitstream = np.concatenate((preamble_bits, sync_bits, frame_bits))
 
-    data_waveform = afsk.generate_afsk_waveform(
-        bitstream,
-        baud=baud,
-        sample_rate=sample_rate,
-    )
+    start_tone, end_tone = _frame_tones(sample_rate, channel)
 
-    start_tone = _sine_tone(
-        config.START_TONE_FREQUENCY,
-        config.START_END_TONE_DURATION_MS / 1000.0,
-        sample_rate=sample_rate,
-    )
-    end_tone = _sine_tone(
-        config.END_TONE_FREQUENCY,
-        config.START_END_TONE_DURATION_MS / 1000.0,
-        sample_rate=sample_rate,
-    )
+    def segments(block_size: int) -> Iterator[ArrayLike]:
+        yield start_tone
+        yield from afsk.iter_afsk_waveform(
+            bitstream,
+            baud=baud,
+            block_size=block_size,
+            sample_rate=sample_rate,
+            channel=channel,
+        )
+        yield end_tone
+
+    return segments
+
+
+def _rebatch(pieces: Iterable[ArrayLike | None], block_size: int) -> Iterator[ArrayLike]:
+    """
+    Regroup arrays of arbitrary length into float32 blocks of exactly `block_size`.
+
+    A `None` piece flushes the partially filled block early, which lets a live source
+    hand over everything it has before it blocks waiting for more input.
+    """
+    block = np.empty(block_size, dtype=np.float32)
+    filled = 0
+    for piece in pieces:
+        if piece is None:
+            if filled:
+                yield block[:filled].copy()
+                filled = 0
+            continue
+        offset = 0
+        while offset < piece.size:
+            take = min(block_size - filled, piece.size - offset)
+            block[filled : filled + take] = piece[offset : offset + take]
+            filled += take
+            offset += take
+            if filled == block_size:
+                yield block.copy()
+                filled = 0
+    if filled:
+        yield block[:filled].copy()
+
+
+def iter_transmission_blocks(
+    text: str,
+    *,
+    header: Header,
+    repeats: int = 1,
+    block_size: int = TX_BLOCK_SIZE,
+    channel: config.ChannelPlan = config.DEFAULT_CHANNEL,
+) -> Iterator[ArrayLike]:
+    """
+    Yield the scaled float32 transmission for `text` in blocks of `block_size` samples.
+
+    Repeats are synthesized lazily, so memory use is bounded by the block size rather than
+    the length of the transmission. Only the final block may be shorter than `block_size`.
+    Validation errors are raised immediately rather than on first iteration. `channel`
+    selects the tone set, so several transmitters can share the band (see
+    `config.channel_plans`).
+    """
+    if repeats <= 0:
+        raise ValueError("repeats must be a positive integer.")
+    if block_size <= 0:
+        raise ValueError("block_size must be positive.")
+    segments = _transmission_segments(text.encode("utf-8"), header=header, channel=channel)
 
-    frame_waveform = np.concatenate((start_tone, data_waveform, end_tone), dtype=np.float32)
+    def pieces() -> Iterator[ArrayLike]:
+        for _ in range(repeats):
+            yield from segments(block_size)
 
-    if repeats > 1:
-        frame_waveform = np.tile(frame_waveform, repeats)
+    def blocks() -> Iterator[ArrayLike]:
+        for block in _rebatch(pieces(), block_size):
+            block *= _OUTPUT_LEVEL
+            yield block
 
-    # Scale to a conservative output level to avoid clipping.
-    return (0.8 * frame_waveform).astype(np.float32, copy=False)
+    return blocks()
 
 
-def play_audio(samples: Iterable[float], *, device: str | None = None) -> None:
+def assemble_transmission(
+    text: str,
+    *,
+    header: Header,
+    repeats: int = 1,
+    channel: config.ChannelPlan = config.DEFAULT_CHANNEL,
+) -> Iterable[float]:
     """
-    Play an iterable of audio samples using the default or provided audio device.
+    Yield audio samples for the provided text payload.
+    """
+    blocks = iter_transmission_blocks(text, header=header, repeats=repeats, channel=channel)
+    return np.concatenate(list(blocks))
+
+
+class TransmitQueue:
+    """
+    Thread-safe queue of outgoing messages rendered as one continuous block stream.
+
+    Messages longer than `max_payload` bytes are split into multiple frames whose header
+    flags carry a sequence number and a more-fragments bit (see `framing.fragment_flags`).
+    `blocks()` renders queued frames back to back, so the end tone of one frame is followed
+    directly by the start tone of the next. Because blocks are synthesized lazily, passing
+    `blocks()` to `play_audio` synthesizes frame N+1 while frame N is still playing. Other
+    threads may `put` further messages until `close` is called.
+    """
+
+    def __init__(
+        self,
+        *,
+        baud: int,
+        version: int = config.DEFAULT_VERSION,
+        max_payload: int = config.MAX_FRAME_PAYLOAD,
+        block_size: int = TX_BLOCK_SIZE,
+        channel: config.ChannelPlan = config.DEFAULT_CHANNEL,
+    ) -> None:
+        if baud not in config.BAUD_TO_RATE_CODE:
+            raise ValueError(f"Unsupported baud: {baud}. Choose from {config.BAUD_RATES}.")
+        if block_size <= 0:
+            raise ValueError("block_size must be positive.")
+        framing.split_payload(b"", max_payload)  # validate max_payload eagerly
+        self._rate_code = config.BAUD_TO_RATE_CODE[baud]
+        self._version = version
+        self._max_payload = max_payload
+        self._block_size = block_size
+        self._channel = channel
+        self._frames: queue.Queue[Callable[[int], Iterator[ArrayLike]] | None] = queue.Queue()
+        self._closed = False
+        self._lock = threading.Lock()
+
+    def put(self, text: str) -> int:
+        """Queue a UTF-8 text message and return the number of frames it occupies."""
+        return self.put_bytes(text.encode("utf-8"))
+
+    def put_bytes(self, payload: bytes) -> int:
+        """Queue a raw payload and return the number of frames it occupies."""
+        fragments = framing.split_payload(payload, self._max_payload)
+        frames = []
+        for sequence, fragment in enumerate(fragments):
+            header = Header(
+                version=self._version,
+                rate_code=self._rate_code,
+                flags=framing.fragment_flags(sequence, more=sequence < len(fragments) - 1),
+                length=len(fragment),
+            )
+            frames.append(
+                _transmission_segments(fragment, header=header, channel=self._channel)
+            )
+        with self._lock:
+            if self._closed:
+                raise ValueError("Cannot queue messages after the queue is closed.")
+            for frame in frames:
+                self._frames.put(frame)
+        return len(frames)
+
+    def close(self) -> None:
+        """Mark the end of input; `blocks()` finishes once queued frames are rendered."""
+        with self._lock:
+            if not self._closed:
+                self._closed = True
+                self._frames.put(None)
+
+    def blocks(self) -> Iterator[ArrayLike]:
+        """
+        Yield the scaled transmission for every queued frame in `block_size` blocks.
+
+        When the queue runs dry before `close`, the partial block is flushed and the
+        generator waits for the next message.
+        """
+        for block in _rebatch(self._pieces(), self._block_size):
+            block *= _OUTPUT_LEVEL
+            yield block
+
+    def _pieces(self) -> Iterator[ArrayLike | None]:
+        while True:
+            try:
+                frame = self._frames.get_nowait()
+            except queue.Empty:
+                yield None
+                frame = self._frames.get()
+            if frame is None:
+                return
+            yield from frame(self._block_size)
+
+
+def _iter_sample_blocks(samples: Iterable[float], block_size: int) -> Iterator[ArrayLike]:
+    """
+    Normalise `samples` into a stream of one-dimensional float32 blocks.
+
+    Accepts a single array, an iterable of array blocks (e.g. from
+    `iter_transmission_blocks`), or an iterable of scalar samples.
+    """
+    if isinstance(samples, np.ndarray):
+        if samples.ndim != 1:
+            raise ValueError("Audio samples must be a one-dimensional sequence.")
+        waveform = samples.astype(np.float32, copy=False)
+        for start in range(0, waveform.size, block_size):
+            yield waveform[start : start + block_size]
+        return
+
+    iterator = iter(samples)
+    for first in iterator:
+        break
+    else:
+        return
+
+    if np.ndim(first) == 0:
+        scalars = itertools.chain((first,), iterator)
+        while True:
+            block = np.fromiter(
+                itertools.islice(scalars, block_size), dtype=np.float32, count=-1
+            )
+            if block.size == 0:
+                return
+            yield block
+
+    for block in itertools.chain((first,), iterator):
+        block = np.asarray(block, dtype=np.float32)
+        if block.ndim != 1:
+            raise ValueError("Audio samples must be a one-dimensional sequence.")
+        yield block
+
+
+def play_audio(
+    samples: Iterable[float],
+    *,
+    device: str | None = None,
+    block_size: int = TX_BLOCK_SIZE,
+) -> None:
+    """
+    Play audio samples using the default or provided audio device.
+
+    `samples` may be a single array, an iterable of scalar samples, or an iterable of sample
+    blocks such as `iter_transmission_blocks`. Blocks are handed to an `sd.OutputStream`
+    callback through a bounded queue, so synthesis runs ahead of playback by at most
+    a few blocks and long transmissions are never materialized in full.
     """
     if sd is None:
         raise RuntimeError(
             "sounddevice is not installed. Install the 'sounddevice' dependency to enable playback."
         )
-
-    waveform = np.asarray(list(samples) if not isinstance(samples, np.ndarray) else samples)
-    if waveform.ndim != 1:
-        raise ValueError("Audio samples must be a one-dimensional sequence.")
-
-    sd.play(
-        waveform.astype(np.float32, copy=False),
+    if block_size <= 0:
+        raise ValueError("block_size must be positive.")
+
+    pending: queue.Queue[ArrayLike | None] = queue.Queue(maxsize=_PLAYBACK_QUEUE_BLOCKS)
+    finished = threading.Event()
+    current = np.empty(0, dtype=np.float32)
+    position = 0
+
+    def callback(outdata: np.ndarray, frames: int, _time, _status) -> None:
+        nonlocal current, position
+        filled = 0
+        while filled < frames:
+            if position >= current.size:
+                try:
+                    block = pending.get_nowait()
+                except queue.Empty:
+                    # Underrun: emit silence and pick the stream back up on the next callback.
+                    outdata[filled:, 0] = 0.0
+                    return
+                if block is None:
+                    outdata[filled:, 0] = 0.0
+                    raise sd.CallbackStop
+                current, position = block, 0
+            take = min(frames - filled, current.size - position)
+            outdata[filled : filled + take, 0] = current[position : position + take]
+            filled += take
+            position += take
+
+    blocks = iter(_iter_sample_blocks(samples, block_size))
+    stream = sd.OutputStream(
         samplerate=config.SAMPLE_RATE,
+        blocksize=block_size,
         device=device,
+        channels=1,
+        dtype="float32",
+        callback=callback,
+        finished_callback=finished.set,
     )
-    sd.wait()
-
 
-def write_wav(samples: Iterable[float], destination: Path) -> None:
+    def enqueue(block: ArrayLike | None) -> bool:
+        # Block while the queue is full, but give up if the stream has stopped on its own.
+        while not finished.is_set():
+            try:
+                pending.put(block, timeout=0.1)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    # The stream is created stopped (entering it as a context manager would start it), and
+    # the queue is filled first so the opening callbacks do not underrun mid-frame.
+    try:
+        for block in blocks:
+            pending.put_nowait(block)
+            if pending.full():
+                break
+        stream.start()
+        for block in blocks:
+            if not enqueue(block):
+                return
+        enqueue(None)
+        finished.wait()
+    finally:
+        stream.close()
+
+
+def write_wav(
+    samples: Iterable[float],
+    destination: Path,
+    *,
+    block_size: int = TX_BLOCK_SIZE,
+) -> None:
     """
-    Write the given audio samples to a WAV file using the configured sample rate.
+    Write audio samples to a 32-bit float WAV file using the configured sample rate.
+
+    `samples` may be a single array, an iterable of scalar samples, or an iterable of sample
+    blocks such as `iter_transmission_blocks`. Blocks are written as they arrive and the
+    RIFF sizes are patched once the stream ends, so the waveform is never held in full.
+    The file is written next to `destination` and renamed into place on success, so an
+    error part-way through leaves no truncated WAV behind.
     """
-    waveform = np.asarray(list(samples) if not isinstance(samples, np.ndarray) else samples)
-    if waveform.ndim != 1:
-        raise ValueError("Audio samples must be a one-dimensional sequence.")
+    if block_size <= 0:
+        raise ValueError("block_size must be positive.")
+    blocks = _iter_sample_blocks(samples, block_size)
 
     destination = Path(destination)
     destination.parent.mkdir(parents=True, exist_ok=True)
 
+    partial = destination.with_name(destination.name + ".part")
     try:
-        from scipy.io import wavfile
-    except ImportError as exc:  # pragma: no cover - dependency should be available
-        raise RuntimeError(
-            "scipy is required to write WAV files. Install the 'scipy' dependency."
-        ) from exc
-
-    wavfile.write(destination, config.SAMPLE_RATE, waveform.astype(np.float32, copy=False))
-
-
+        with partial.open("wb") as handle:
+            handle.write(_wav_float32_header(0))
+            sample_count = 0
+            for block in blocks:
+                handle.write(block.astype("<f4", copy=False).tobytes())
+                sample_count += block.size
+                if sample_count * 4 > 0xFFFFFFFF - _WAV_HEADER_BYTES:
+                    raise ValueError("Transmission too long for a WAV file.")
+            handle.seek(0)
+            handle.write(_wav_float32_header(sample_count))
+        partial.replace(destination)
+    except BaseException:
+        partial.unlink(missing_ok=True)
+        raise
+
+
+def _wav_float32_header(sample_count: int) -> bytes:
+    """Return a mono IEEE-float WAV header (fmt, fact and data chunk headers)."""
+    data_bytes = sample_count * 4
+    fmt_chunk = struct.pack(
+        "<HHIIHHH",
+        3,  # WAVE_FORMAT_IEEE_FLOAT
+        1,
+        config.SAMPLE_RATE,
+        config.SAMPLE_RATE * 4,
+        4,
+        32,
+        0,
+    )
+    return b"".join(
+        (
+            b"RIFF",
+            struct.pack("<I", _WAV_HEADER_BYTES - 8 + data_bytes),
+            b"WAVE",
+            b"fmt ",
+            struct.pack("<I", len(fmt_chunk)),
+            fmt_chunk,
+            b"fact",
+            struct.pack("<II", 4, sample_count),
+            b"data",
+            struct.pack("<I", data_bytes),
+        )
+    )
@@ -9,26 +9,58 @@ from typing import Iterable, Iterator, Sequence
 import numpy as np
 
 
+def unpack_bits(data: bytes) -> np.ndarray:
+    """Expand a byte string to a uint8 array of bits (MSB first)."""
+    return np.unpackbits(np.frombuffer(bytes(data), dtype=np.uint8))
+
+
+def pack_bits(bits: np.ndarray) -> bytes:
+    """Pack an array of bits into bytes (MSB first); only the low bit of each entry counts."""
+    array = np.asarray(bits)
+    if array.ndim != 1:
+        raise ValueError("bits must be one-dimensional.")
+    if array.size % 8 != 0:
+        raise ValueError("Number of bits must be a multiple of 8.")
+    return np.packbits(array.astype(np.uint8, copy=False) & 0x01).tobytes()
+
+
+def find_sync_all(bits: np.ndarray, pattern: np.ndarray | Sequence[int]) -> np.ndarray:
+    """
+    Return the indices of every occurrence of `pattern` in `bits`, in ascending order.
+
+    Candidate positions are filtered one pattern bit at a time, so the work is roughly
+    twice the length of `bits` for random data regardless of the pattern length.
+    """
+    data = np.asarray(bits)
+    needle = np.asarray(pattern)
+    plen = needle.size
+    limit = data.size - plen + 1
+    if limit <= 0:
+        return np.zeros(0, dtype=np.int64)
+    if plen == 0:
+        return np.arange(limit, dtype=np.int64)
+    candidates = np.flatnonzero(data[:limit] == needle[0])
+    for offset in range(1, plen):
+        if candidates.size == 0:
+            break
+        candidates = candidates[data[candidates + offset] == needle[offset]]
+    return candidates.astype(np.int64, copy=False)
+
+
+def find_sync(bits: np.ndarray, pattern: np.ndarray | Sequence[int]) -> int:
+    """Return the index of the first occurrence of `pattern` in `bits`, or -1."""
+    hits = find_sync_all(bits, pattern)
+    return int(hits[0]) if hits.size else -1
+
+
 def bits_from_bytes(data: bytes) -> list[int]:
     """Expand a byte string to a list of bits (MSB first)."""
-    bits: list[int] = []
-    for byte in data:
-        bits.extend(((byte >> shift) & 0x01) for shift in reversed(range(8)))
-    return bits
+    return unpack_bits(data).tolist()
 
 
 def bytes_from_bits(bits: Sequence[int]) -> bytes:
     """Pack a sequence of bits into bytes (MSB first)."""
-    if len(bits) % 8 != 0:
-        raise ValueError("Number of bits must be a multiple of 8.")
-    output = bytearray()
-    for i in range(0, len(bits), 8):
-        chunk = bits[i : i + 8]
-        byte = 0
-        for bit in chunk:
-            byte = (byte << 1) | (bit & 0x01)
-        output.append(byte)
-    return bytes(output)
+    return pack_bits(np.asarray(bits, dtype=np.int64))
 
 
 def chunks(iterable: Iterable[int], size: int) -> Iterator[list[int]]:
@@ -67,3 +99,134 @@ def raised_cosine_window(length: int, *, ramp_fraction: float = 0.1) -> list[flo
     return window.tolist()
 
 
+class RingBuffer:
+    """
+    Fixed-capacity sample buffer with amortized O(chunk) appends and contiguous views.
+
+    Storage is preallocated at twice the capacity. Samples are appended after the live
+    region and the live region is moved back to the front only when the write position
+    reaches the end of storage, which happens at most once per `capacity` appended samples.
+    `view()` therefore always returns a zero-copy contiguous slice.
+    """
+
+    def __init__(self, capacity: int, *, dtype: np.dtype | type = np.float32) -> None:
+        if capacity <= 0:
+            raise ValueError("capacity must be positive.")
+        self._capacity = int(capacity)
+        self._storage = np.zeros(2 * self._capacity, dtype=dtype)
+        self._start = 0
+        self._end = 0
+
+    @property
+    def capacity(self) -> int:
+        """Maximum number of samples the buffer can retain."""
+        return self._capacity
+
+    @property
+    def nbytes(self) -> int:
+        """Bytes of preallocated storage; fixed for the lifetime of the buffer."""
+        return int(self._storage.nbytes)
+
+    @property
+    def free(self) -> int:
+        """Number of samples that can be appended before the buffer is full."""
+        return self._capacity - len(self)
+
+    def __len__(self) -> int:
+        return self._end - self._start
+
+    def append(self, samples: np.ndarray) -> None:
+        """Copy `samples` after the retained samples."""
+        count = int(samples.size)
+        if count == 0:
+            return
+        if count > self.free:
+            raise ValueError(
+                f"Cannot append {count} samples; only {self.free} of {self._capacity} free."
+            )
+        if self._end + count > self._storage.size:
+            live = len(self)
+            self._storage[:live] = self._storage[self._start : self._end]
+            self._start = 0
+            self._end = live
+        self._storage[self._end : self._end + count] = samples
+        self._end += count
+
+    def view(self) -> np.ndarray:
+        """Return a read-only contiguous view of the retained samples, oldest first."""
+        data = self._storage[self._start : self._end]
+        data.flags.writeable = False
+        return data
+
+    def consume(self, count: int) -> None:
+        """Drop the oldest `count` samples."""
+        if count <= 0:
+            return
+        self._start = min(self._start + count, self._end)
+        if self._start == self._end:
+            self._start = 0
+            self._end = 0
+
+    def clear(self) -> None:
+        """Drop every retained sample."""
+        self._start = 0
+        self._end = 0
+
+
+class SPSCRingBuffer:
+    """
+    Single-producer, single-consumer sample queue for handing audio between threads.
+
+    The producer only advances the write counter and the consumer only advances the read
+    counter; each side reads the other's counter but never writes it, so no lock is needed
+    while there is exactly one thread on each side. Storage is preallocated. A write that
+    does not fit is truncated and the accepted count returned, because a real-time audio
+    callback must never wait for the consumer.
+    """
+
+    def __init__(self, capacity: int, *, dtype: np.dtype | type = np.float32) -> None:
+        if capacity <= 0:
+            raise ValueError("capacity must be positive.")
+        self._capacity = int(capacity)
+        self._storage = np.zeros(self._capacity, dtype=dtype)
+        self._written = 0
+        self._read = 0
+
+    @property
+    def capacity(self) -> int:
+        """Maximum number of samples waiting between the producer and the consumer."""
+        return self._capacity
+
+    @property
+    def free(self) -> int:
+        """Number of samples the producer can write before the buffer is full."""
+        return self._capacity - len(self)
+
+    def __len__(self) -> int:
+        return self._written - self._read
+
+    def write(self, samples: np.ndarray) -> int:
+        """Copy as many of `samples` as fit and return how many were accepted (producer)."""
+        count = min(int(samples.size), self.free)
+        if count <= 0:
+            return 0
+        start = self._written % self._capacity
+        first = min(count, self._capacity - start)
+        self._storage[start : start + first] = samples[:first]
+        self._storage[: count - first] = samples[first:count]
+        # Publish only after the samples are in place.
+        self._written += count
+        return count
+
+    def read(self, max_count: int | None = None) -> np.ndarray:
+        """Remove and return up to `max_count` of the oldest samples (consumer)."""
+        count = len(self) if max_count is None else min(len(self), max_count)
+        out = np.empty(max(count, 0), dtype=self._storage.dtype)
+        if count <= 0:
+            return out
+        start = self._read % self._capacity
+        first = min(count, self._capacity - start)
+        out[:first] = self._storage[start : start + first]
+        out[first:] = self._storage[: count - first]
+        self._read += count
+        return out
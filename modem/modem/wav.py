@@ -0,0 +1,169 @@
+"""
+Memory-mapped WAV input for the audio modem.
+
+`WavReader` parses the RIFF header itself and maps the data chunk with `numpy.memmap`, so a
+recording of any length is converted to float32 one block at a time instead of being loaded
+in full. Only the first channel is used, matching the mono modem pipeline.
+"""
+
+from __future__ import annotations
+
+import struct
+from collections.abc import Iterator
+from pathlib import Path
+
+import numpy as np
+
+from .resample import resample_chunks
+
+# Samples per block handed to decoders when streaming a file.
+WAV_CHUNK_SAMPLES = 1 << 15
+
+_FORMAT_PCM = 0x0001
+_FORMAT_IEEE_FLOAT = 0x0003
+_FORMAT_EXTENSIBLE = 0xFFFE
+
+# 24-bit PCM has no NumPy dtype; it is mapped as raw bytes and assembled per block.
+_SAMPLE_DTYPES = {
+    (_FORMAT_PCM, 8): np.dtype("u1"),
+    (_FORMAT_PCM, 16): np.dtype("<i2"),
+    (_FORMAT_PCM, 24): np.dtype("u1"),
+    (_FORMAT_PCM, 32): np.dtype("<i4"),
+    (_FORMAT_IEEE_FLOAT, 32): np.dtype("<f4"),
+    (_FORMAT_IEEE_FLOAT, 64): np.dtype("<f8"),
+}
+
+
+class WavReader:
+    """
+    Random-access, block-wise reader for 8/16/24/32-bit PCM and IEEE-float WAV files.
+
+    Nothing but the header is read up front; `read` and `iter_chunks` touch only the mapped
+    pages they convert. Readers are cheap to open, so worker processes can each map the
+    same file.
+    """
+
+    def __init__(self, path: str | Path) -> None:
+        self.path = Path(path)
+        with self.path.open("rb") as handle:
+            riff = handle.read(12)
+            if len(riff) < 12 or riff[:4] != b"RIFF" or riff[8:12] != b"WAVE":
+                raise ValueError(f"{self.path} is not a RIFF/WAVE file.")
+            file_size = self.path.stat().st_size
+            fmt: tuple[int, int, int, int] | None = None
+            while True:
+                chunk_header = handle.read(8)
+                if len(chunk_header) < 8:
+                    raise ValueError(f"{self.path} has no data chunk.")
+                chunk_id = chunk_header[:4]
+                (chunk_size,) = struct.unpack("<I", chunk_header[4:])
+                if chunk_id == b"data":
+                    if fmt is None:
+                        raise ValueError(f"{self.path} has a data chunk before its fmt chunk.")
+                    data_offset = handle.tell()
+                    # Recorders that stopped early may leave a placeholder size.
+                    data_size = min(chunk_size, file_size - data_offset)
+                    break
+                if chunk_id == b"fmt ":
+                    fmt = self._parse_fmt(handle.read(chunk_size))
+                    handle.seek(chunk_size & 1, 1)
+                else:
+                    handle.seek(chunk_size + (chunk_size & 1), 1)
+
+        format_tag, channels, sample_rate, bits = fmt
+        dtype = _SAMPLE_DTYPES.get((format_tag, bits))
+        if dtype is None:
+            raise ValueError(
+                f"Unsupported WAV encoding (format 0x{format_tag:04X}, {bits} bits); "
+                "use 8/16/24/32-bit PCM or 32/64-bit float."
+            )
+        if channels <= 0 or sample_rate <= 0:
+            raise ValueError(f"{self.path} declares {channels} channels at {sample_rate} Hz.")
+        self.sample_rate = sample_rate
+        self.channels = channels
+        self._width = bits // 8
+        self.frames = data_size // (self._width * channels)
+        self._dtype = dtype
+        self._offset = data_offset
+        self._data: np.memmap | None = None
+
+    @staticmethod
+    def _parse_fmt(body: bytes) -> tuple[int, int, int, int]:
+        if len(body) < 16:
+            raise ValueError("WAV fmt chunk is truncated.")
+        format_tag, channels, sample_rate, _, _, bits = struct.unpack("<HHIIHH", body[:16])
+        if format_tag == _FORMAT_EXTENSIBLE and len(body) >= 26:
+            (format_tag,) = struct.unpack("<H", body[24:26])
+        return format_tag, channels, sample_rate, bits
+
+    @property
+    def duration(self) -> float:
+        """Length of the recording in seconds."""
+        return self.frames / self.sample_rate
+
+    def _mapped(self) -> np.ndarray:
+        if self._data is None:
+            # One column per sample of a frame, or per byte of a 24-bit frame.
+            columns = self.channels * (self._width // self._dtype.itemsize)
+            if self.frames == 0:
+                return np.zeros((0, columns), dtype=self._dtype)
+            self._data = np.memmap(
+                self.path,
+                dtype=self._dtype,
+                mode="r",
+                offset=self._offset,
+                shape=(self.frames, columns),
+            )
+        return self._data
+
+    def read(self, start: int, count: int) -> np.ndarray:
+        """Return up to `count` samples of the first channel from `start` as float32."""
+        if start < 0 or count < 0:
+            raise ValueError("start and count must be non-negative.")
+        if self._width == 3:
+            raw = self._mapped()[start : start + count, :3].astype(np.int32)
+            value = raw[:, 0] | (raw[:, 1] << 8) | (raw[:, 2] << 16)
+            # Sign-extend from bit 23.
+            value -= (value & 0x800000) << 1
+            return value.astype(np.float32) / float(1 << 23)
+        block = self._mapped()[start : start + count, 0]
+        if self._dtype.kind == "f":
+            return block.astype(np.float32)
+        if self._dtype.kind == "u":
+            # 8-bit PCM is unsigned with its midpoint at 128.
+            return (block.astype(np.float32) - 128.0) / 128.0
+        info = np.iinfo(self._dtype)
+        return block.astype(np.float32) / float(max(abs(info.min), abs(info.max)))
+
+    def iter_chunks(
+        self,
+        *,
+        chunk_samples: int = WAV_CHUNK_SAMPLES,
+        start: int = 0,
+        stop: int | None = None,
+        output_rate: int | None = None,
+    ) -> Iterator[np.ndarray]:
+        """
+        Yield float32 blocks covering `[start, stop)` of the file.
+
+        Blocks hold at most `chunk_samples` file samples. When `output_rate` differs from the
+        file's rate the blocks pass through a `resample.StreamingResampler`.
+        """
+        if chunk_samples <= 0:
+            raise ValueError("chunk_samples must be positive.")
+        end = self.frames if stop is None else min(stop, self.frames)
+        blocks = (
+            self.read(offset, min(chunk_samples, end - offset))
+            for offset in range(max(0, start), end, chunk_samples)
+        )
+        yield from resample_chunks(blocks, self.sample_rate, output_rate or self.sample_rate)
+
+    def close(self) -> None:
+        """Drop the memory map; later reads map the file again."""
+        self._data = None
+
+    def __enter__(self) -> WavReader:
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
@@ -0,0 +1,48 @@
+"""
+Shared fixtures for the modem test suite.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+
+import numpy as np
+import pytest
+
+from modem import config
+from modem.framing import Header
+from modem.tx import assemble_transmission
+
+
+def _text_header(message: str, baud: int = 200) -> Header:
+    return Header(
+        version=config.DEFAULT_VERSION,
+        rate_code=config.BAUD_TO_RATE_CODE[baud],
+        flags=config.DEFAULT_FLAGS,
+        length=len(message.encode("utf-8")),
+    )
+
+
+def _text_transmission(
+    message: str,
+    *,
+    baud: int = 200,
+    repeats: int = 1,
+    channel: config.ChannelPlan = config.DEFAULT_CHANNEL,
+) -> np.ndarray:
+    header = _text_header(message, baud)
+    return np.asarray(
+        assemble_transmission(message, header=header, repeats=repeats, channel=channel)
+    )
+
+
+@pytest.fixture
+def text_header() -> Callable[..., Header]:
+    """Build the single-frame header for a UTF-8 text message: `(message, baud=200)`."""
+    return _text_header
+
+
+@pytest.fixture
+def text_transmission() -> Callable[..., np.ndarray]:
+    """Synthesize a text message: `(message, *, baud=200, repeats=1, channel=...)`."""
+    return _text_transmission
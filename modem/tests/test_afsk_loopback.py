@@ -9,7 +9,18 @@ import pytest
 
 from modem import config
 from modem import utils
-from modem.afsk import demodulate_afsk, generate_afsk_waveform, goertzel_power
+from modem import afsk
+from modem.afsk import (
+    GoertzelBank,
+    MultiRateDemodulator,
+    demodulate_afsk,
+    demodulate_afsk_symbols,
+    generate_afsk_waveform,
+    goertzel_bank,
+    goertzel_power,
+    iter_afsk_waveform,
+    sliding_goertzel_power,
+)
 
 
 def test_goertzel_power_detects_mark_frequency() -> None:
@@ -25,6 +36,22 @@ def test_goertzel_power_detects_mark_frequency() -> None:
     assert mark_power > space_power * 20
 
 
+def test_sliding_goertzel_power_matches_single_window() -> None:
+    rng = np.random.default_rng(5)
+    samples = rng.normal(size=6000)
+    frequencies = (config.START_TONE_FREQUENCY, config.MARK_FREQUENCY, 1234.5)
+    offsets = np.array([0, 17, 480, 4000])
+
+    powers = sliding_goertzel_power(samples, frequencies, window_size=1920, offsets=offsets)
+
+    assert powers.shape == (len(frequencies), offsets.size)
+    for col, offset in enumerate(offsets):
+        window = samples[offset : offset + 1920]
+        for row, frequency in enumerate(frequencies):
+            expected = goertzel_power(window, frequency)
+            assert powers[row, col] == pytest.approx(expected, rel=1e-9, abs=1e-6)
+
+
 @pytest.mark.parametrize("baud", [50, 100, 200])
 def test_afsk_round_trip(baud: int) -> None:
     payload = b"Test frame!"
@@ -38,3 +65,117 @@ def test_afsk_round_trip(baud: int) -> None:
 
     demod_bits = demodulate_afsk(noisy_waveform, baud=baud)
     assert demod_bits == bits
+
+
+@pytest.mark.parametrize("sample_rate", [12_000, 8_000])
+def test_afsk_round_trip_at_processing_rate(sample_rate: int) -> None:
+    bits = utils.bits_from_bytes(b"low rate")
+    waveform = generate_afsk_waveform(bits, baud=200, sample_rate=sample_rate)
+    assert waveform.size == len(bits) * sample_rate // 200
+    assert demodulate_afsk(waveform, baud=200, sample_rate=sample_rate) == bits
+
+
+@pytest.mark.parametrize("baud", [50, 200])
+def test_symbol_timing_recovers_mid_symbol_start(baud: int) -> None:
+    bits = utils.bits_from_bytes(b"timing")
+    samples_per_symbol = config.SAMPLE_RATE // baud
+    lead = samples_per_symbol // 2
+    waveform = np.concatenate(
+        (np.zeros(lead), generate_afsk_waveform(bits, baud=baud, sample_rate=config.SAMPLE_RATE))
+    )
+    noisy = waveform + 0.1 * np.random.default_rng(9).normal(size=waveform.size)
+
+    symbols = demodulate_afsk_symbols(noisy, baud=baud)
+
+    assert abs(symbols.offset - lead) <= samples_per_symbol // 16
+    assert symbols.bits[: len(bits)].tolist() == bits
+    assert np.all((symbols.confidence >= 0.0) & (symbols.confidence <= 1.0))
+    assert symbols.confidence[: len(bits)].min() > 0.8
+    # Slicing from sample 0 straddles every transition.
+    assert demodulate_afsk(noisy, baud=baud)[1 : len(bits) + 1] != bits
+
+
+def test_multi_rate_demodulator_matches_single_rate() -> None:
+    bits = utils.bits_from_bytes(b"multi-rate")
+    waveform = generate_afsk_waveform(bits, baud=100, sample_rate=config.SAMPLE_RATE)
+    noisy = waveform + 0.05 * np.random.default_rng(8).normal(size=waveform.shape)
+
+    demodulator = MultiRateDemodulator(noisy)
+    for baud in config.BAUD_RATES:
+        assert demodulator.demodulate(baud) == demodulate_afsk(noisy, baud=baud)
+    assert demodulator.demodulate(100) == bits
+    assert demodulator.demodulate(100, max_symbols=16) == bits[:16]
+
+
+def test_generate_afsk_waveform_is_phase_continuous() -> None:
+    bits = np.random.default_rng(9).integers(0, 2, size=400)
+    baud = 200
+    samples_per_symbol = config.SAMPLE_RATE // baud
+    window = np.asarray(utils.raised_cosine_window(samples_per_symbol, ramp_fraction=0.05))
+
+    phase = 0.0
+    expected = []
+    for bit in bits:
+        frequency = config.MARK_FREQUENCY if bit else config.SPACE_FREQUENCY
+        increment = 2.0 * np.pi * frequency / config.SAMPLE_RATE
+        symbol_phase = phase + increment * np.arange(samples_per_symbol)
+        expected.append(np.sin(symbol_phase) * window)
+        phase = (symbol_phase[-1] + increment) % (2.0 * np.pi)
+
+    waveform = generate_afsk_waveform(bits, baud=baud)
+    assert waveform.dtype == np.float32
+    np.testing.assert_allclose(waveform, np.concatenate(expected), atol=1e-6)
+
+
+@pytest.mark.parametrize("block_size", [1000, 4096, 240])
+def test_iter_afsk_waveform_matches_full_waveform(block_size: int) -> None:
+    bits = utils.bits_from_bytes(b"streamed")
+    full = generate_afsk_waveform(bits, baud=100)
+    blocks = list(iter_afsk_waveform(bits, baud=100, block_size=block_size))
+
+    assert all(block.size == block_size for block in blocks[:-1])
+    np.testing.assert_array_equal(np.concatenate(blocks), full)
+
+
+def _goertzel_recursion(window: np.ndarray, frequency: float, sample_rate: int) -> float:
+    n = window.size
+    k = max(1, int(round(n * frequency / sample_rate)))
+    coeff = 2.0 * np.cos(2.0 * np.pi * k / n)
+    s1 = s2 = 0.0
+    for sample in window:
+        s1, s2 = sample + coeff * s1 - s2, s1
+    return s1 * s1 + s2 * s2 - coeff * s1 * s2
+
+
+@pytest.mark.parametrize("basis_limit", [1 << 16, 100])
+def test_goertzel_bank_matches_recursion(monkeypatch, basis_limit: int) -> None:
+    monkeypatch.setattr(afsk, "_GOERTZEL_BASIS_MAX_SAMPLES", basis_limit)
+    frequencies = (config.MARK_FREQUENCY, config.SPACE_FREQUENCY, config.START_TONE_FREQUENCY)
+    windows = np.random.default_rng(10).normal(size=(3, 480))
+    bank = GoertzelBank(480, frequencies, sample_rate=config.SAMPLE_RATE)
+
+    expected = np.array(
+        [
+            [_goertzel_recursion(window, frequency, config.SAMPLE_RATE) for window in windows]
+            for frequency in frequencies
+        ]
+    )
+    np.testing.assert_allclose(bank.power(windows), expected, rtol=1e-9, atol=1e-9)
+    np.testing.assert_allclose(bank.power(windows[1]), expected[:, 1], rtol=1e-9, atol=1e-9)
+
+    samples = windows.ravel()
+    offsets = np.array([0, 480, 960, 37])
+    stacked = np.stack([samples[o : o + 480] for o in offsets])
+    np.testing.assert_allclose(
+        bank.sliding_power(samples, offsets), bank.power(stacked), rtol=1e-8, atol=1e-8
+    )
+
+
+def test_goertzel_bank_is_cached_per_window_and_frequency_set() -> None:
+    frequencies = (config.MARK_FREQUENCY, config.SPACE_FREQUENCY)
+    bank = goertzel_bank(240, frequencies, config.SAMPLE_RATE)
+    assert goertzel_bank(240, frequencies, config.SAMPLE_RATE) is bank
+    assert goertzel_bank(480, frequencies, config.SAMPLE_RATE) is not bank
+    assert goertzel_power(iter(np.ones(240)), config.MARK_FREQUENCY) == pytest.approx(
+        _goertzel_recursion(np.ones(240), config.MARK_FREQUENCY, config.SAMPLE_RATE), abs=1e-9
+    )
@@ -0,0 +1,91 @@
+"""
+Tests for the asyncio receive API.
+"""
+
+from __future__ import annotations
+
+import asyncio
+
+import numpy as np
+
+from modem import config
+from modem.async_rx import AsyncFrameReceiver
+
+
+def _chunks(waveform: np.ndarray, size: int = 4_800) -> list[np.ndarray]:
+    return [waveform[start : start + size] for start in range(0, waveform.size, size)]
+
+
+def test_async_receiver_decodes_sync_source(text_transmission) -> None:
+    chunks = _chunks(text_transmission("async hello", repeats=2))
+
+    async def main() -> list[bytes]:
+        async with AsyncFrameReceiver(chunks) as receiver:
+            return [payload async for _, _, payload in receiver]
+
+    assert asyncio.run(main()) == [b"async hello", b"async hello"]
+
+
+def test_async_receiver_serves_concurrent_links(text_transmission) -> None:
+    messages = [f"link {index}" for index in range(4)]
+
+    async def source(message: str):
+        for chunk in _chunks(text_transmission(message)):
+            await asyncio.sleep(0)
+            yield chunk
+
+    async def receive(message: str) -> list[bytes]:
+        async with AsyncFrameReceiver(source(message)) as receiver:
+            return [payload async for _, _, payload in receiver]
+
+    async def main() -> list[list[bytes]]:
+        return await asyncio.gather(*(receive(message) for message in messages))
+
+    assert asyncio.run(main()) == [[message.encode("utf-8")] for message in messages]
+
+
+def test_async_receiver_applies_backpressure(text_transmission) -> None:
+    waveform = np.concatenate(
+        (text_transmission("pressure", repeats=3), np.zeros(config.SAMPLE_RATE, dtype=np.float32))
+    )
+    chunks = _chunks(waveform)
+    pulled = 0
+
+    def source():
+        nonlocal pulled
+        for chunk in chunks:
+            pulled += 1
+            yield chunk
+
+    async def main() -> None:
+        receiver = AsyncFrameReceiver(source(), max_pending_frames=1)
+        await anext(receiver)
+        await asyncio.sleep(0.5)
+        # One frame is queued and the pump is waiting to hand over the next.
+        assert receiver.pending_frames == 1
+        assert pulled < len(chunks)
+        await receiver.aclose()
+
+    asyncio.run(main())
+
+
+def test_async_receiver_cancels_blocked_source() -> None:
+    async def main() -> None:
+        source_closed = asyncio.Event()
+
+        async def silent_source():
+            try:
+                while True:
+                    await asyncio.sleep(3600)
+                    yield np.zeros(1, dtype=np.float32)
+            finally:
+                source_closed.set()
+
+        receiver = AsyncFrameReceiver(silent_source())
+        consumer = asyncio.create_task(anext(receiver, None))
+        await asyncio.sleep(0.01)
+        await asyncio.wait_for(receiver.aclose(), timeout=1.0)
+        assert source_closed.is_set()
+        assert await asyncio.wait_for(consumer, timeout=1.0) is None
+
+    asyncio.run(main())
@@ -0,0 +1,79 @@
+"""
+Tests for parallel offline decoding.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+
+import numpy as np
+
+from modem import config
+from modem.batch import decode_wav_parallel, plan_segments, segment_overlap
+from modem.rx import IncrementalFrameDecoder
+from modem.tx import write_wav
+
+_TONE_SAMPLES = int(config.SAMPLE_RATE * config.START_END_TONE_DURATION_MS / 1000)
+_SEARCH_STEP = _TONE_SAMPLES // 10
+
+
+def _recording(
+    text_transmission: Callable[..., np.ndarray], placements: list[tuple[int, str]], total: int
+) -> np.ndarray:
+    waveform = np.zeros(total, dtype=np.float32)
+    for offset, message in placements:
+        frame = text_transmission(message)
+        waveform[offset : offset + frame.size] += frame
+    return waveform
+
+
+def test_plan_segments_overlap_covers_longest_frame() -> None:
+    overlap = segment_overlap()
+    assert overlap > IncrementalFrameDecoder().max_frame_samples
+    segments = plan_segments(1_000, segment_samples=300, overlap=120)
+    assert [(s.start, s.core_stop, s.stop) for s in segments] == [
+        (0, 300, 420),
+        (300, 600, 720),
+        (600, 900, 1_000),
+        (900, 1_000, 1_000),
+    ]
+
+
+def test_incremental_decoder_reports_sample_offset(text_transmission) -> None:
+    offset = 50_000
+    waveform = _recording(text_transmission, [(offset, "where")], 200_000)
+    decoder = IncrementalFrameDecoder()
+    (metadata, _, _), = [
+        frame
+        for start in range(0, waveform.size, 7_000)
+        for frame in decoder.ingest(waveform[start : start + 7_000])
+    ]
+    # The start-tone window is found as soon as it overlaps the tone after silence.
+    assert -_TONE_SAMPLES <= metadata.sample_offset - offset <= _SEARCH_STEP
+
+
+def test_decode_wav_parallel_keeps_boundary_frames_once(tmp_path, text_transmission) -> None:
+    sr = config.SAMPLE_RATE
+    segment = 6 * sr
+    # Frames before, across and just after segment boundaries, plus a genuine repeat.
+    placements = [
+        (sr // 2, "alpha"),
+        (segment - sr // 2, "straddles first boundary"),
+        (2 * segment - 2_000, "starts inside a start tone"),
+        (2 * segment + 3 * sr, "repeat"),
+        (2 * segment + 5 * sr, "repeat"),
+        (3 * segment + sr, "omega"),
+    ]
+    path = tmp_path / "archive.wav"
+    write_wav(_recording(text_transmission, placements, 4 * segment), path)
+
+    serial = list(decode_wav_parallel(path, jobs=1, segment_samples=segment))
+    parallel = list(decode_wav_parallel(path, jobs=2, segment_samples=segment))
+
+    expected = [message.encode("utf-8") for _, message in placements]
+    assert [payload for _, _, payload in serial] == expected
+    assert [payload for _, _, payload in parallel] == expected
+    offsets = [metadata.sample_offset for metadata, _, _ in parallel]
+    assert offsets == sorted(offsets)
+    for (placed, _), offset in zip(placements, offsets):
+        assert -_TONE_SAMPLES <= offset - placed <= _SEARCH_STEP
@@ -1,15 +1,42 @@
 """
-Placeholder tests for the framing CRC helpers.
+Tests for the framing CRC helpers.
 """
 
 from __future__ import annotations
 
+import numpy as np
 import pytest
 
+from modem import framing
 
-@pytest.mark.skip(reason="CRC implementation not yet available.")
-def test_crc16_ccitt_placeholder() -> None:
-    """Stub test to be replaced with real CRC vector checks."""
-    raise NotImplementedError
 
+@pytest.mark.parametrize(
+    ("data", "expected"),
+    [(b"", 0xFFFF), (b"123456789", 0x29B1), (b"A", 0xB915)],
+)
+def test_crc16_ccitt_known_vectors(data: bytes, expected: int) -> None:
+    assert framing.crc16_ccitt(data) == expected
+    assert framing._crc16_ccitt_bitwise(data) == expected
 
+
+def test_crc16_ccitt_table_matches_bitwise_and_chains() -> None:
+    payload = np.random.default_rng(4).integers(0, 256, size=300, dtype=np.uint8).tobytes()
+    assert framing.crc16_ccitt(payload) == framing._crc16_ccitt_bitwise(payload)
+    head = framing.crc16_ccitt(payload[:100])
+    assert framing.crc16_ccitt(payload[100:], initial=head) == framing.crc16_ccitt(payload)
+
+
+def test_crc16_ccitt_batch_matches_scalar() -> None:
+    rows = np.random.default_rng(6).integers(0, 256, size=(12, 40), dtype=np.uint8)
+    lengths = np.array([0, 1, 5, 7, 12, 20, 25, 30, 33, 38, 39, 40])
+
+    full = framing.crc16_ccitt_batch(rows)
+    partial = framing.crc16_ccitt_batch(rows, lengths)
+
+    assert full.dtype == np.uint16
+    assert full.tolist() == [framing.crc16_ccitt(row.tobytes()) for row in rows]
+    assert partial.tolist() == [
+        framing.crc16_ccitt(row[:n].tobytes()) for row, n in zip(rows, lengths)
+    ]
+    with pytest.raises(ValueError):
+        framing.crc16_ccitt_batch(rows, np.full(12, 41))
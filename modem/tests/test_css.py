@@ -104,3 +104,187 @@ def test_css_loopback_awgn() -> None:
     assert decoded_payload == payload
 
 
+def test_fft_correlator_matches_template_correlator() -> None:
+    params = css.ChirpParams(sf=7, bw=1_000.0, fc=2_000.0)
+    rng = np.random.default_rng(5)
+    reference = css.generate_reference_chirp(params)
+    window = css._raised_cosine_window(params)
+    templates = css_rx._build_symbol_templates(reference, window, params)
+    template_energy = np.linalg.norm(templates, axis=1)
+
+    shifts = rng.integers(0, params.M, size=16)
+    symbols = np.stack(
+        [css._synthesize_symbol_waveform(int(s), reference, window, params) for s in shifts]
+    )
+    symbols += rng.normal(0.0, 2.0, size=symbols.shape).astype(np.float32)
+
+    expected = (symbols @ templates.T) / template_energy
+    correlations = css_rx.fft_symbol_correlator(params).correlations(symbols)
+    np.testing.assert_allclose(correlations, expected, rtol=1e-4, atol=1e-4)
+
+    for segment in symbols:
+        reference_decision = css_rx.demod_symbol(
+            segment, templates=templates, template_energy=template_energy
+        )
+        assert css_rx.demod_symbol_fft(segment, params).shift == reference_decision.shift
+
+
+def test_decode_css_waveform_demod_modes_agree() -> None:
+    params = _default_params()
+    message = "modes"
+    header = framing.Header(version=config.DEFAULT_VERSION, rate_code=0, flags=0, length=5)
+    waveform = css.assemble_css_transmission(message, header=header, params=params)
+
+    for demod in css_rx.DEMOD_MODES:
+        _, _, payload = css_rx.decode_css_waveform(waveform, params, demod=demod)
+        assert payload == b"modes"
+
+
+def test_demod_symbols_batch_matches_per_symbol_decisions() -> None:
+    params = css.ChirpParams(sf=7, bw=1_000.0, fc=2_000.0)
+    rng = np.random.default_rng(6)
+    shifts = rng.integers(0, params.M, size=70)
+    waveform = css.synthesize_symbols(
+        css.shifts_to_symbols(shifts, params).tolist(),
+        params,
+        include_preamble=False,
+        include_sync=False,
+    )
+    waveform = waveform + rng.normal(0.0, 0.3, size=waveform.shape).astype(np.float32)
+    symbols = waveform.reshape(-1, params.Ns)
+
+    for demod in css_rx.DEMOD_MODES:
+        decisions = css_rx.demod_symbols(symbols, params, demod=demod)
+        assert len(decisions) == shifts.size
+        np.testing.assert_array_equal(decisions.shifts, shifts)
+
+    batch = css_rx.demod_symbols(symbols, params)
+    for decision, segment in zip(batch, symbols):
+        single = css_rx.demod_symbol_fft(segment, params)
+        assert decision.shift == single.shift
+        assert np.isclose(decision.magnitude, single.magnitude)
+        assert np.isclose(decision.dominance, single.dominance)
+
+
+def _streaming_params(fc_offset: float = 0.0) -> css.ChirpParams:
+    return css.ChirpParams(sf=8, bw=2_000.0, fc=2_500.0 + fc_offset)
+
+
+def _css_frame(message: str, params: css.ChirpParams) -> np.ndarray:
+    payload = message.encode("utf-8")
+    header = framing.Header(
+        version=config.DEFAULT_VERSION, rate_code=0, flags=0, length=len(payload)
+    )
+    return css.assemble_css_transmission(message, header=header, params=params)
+
+
+def test_incremental_css_decoder_finds_frames_in_chunks() -> None:
+    params = _streaming_params()
+    rng = np.random.default_rng(7)
+    waveform = np.concatenate(
+        [
+            np.zeros(1_234, dtype=np.float32),
+            _css_frame("first", params),
+            np.zeros(777, dtype=np.float32),
+            _css_frame("second ✓", params),
+            np.zeros(2_000, dtype=np.float32),
+        ]
+    )
+    waveform += rng.normal(0.0, 0.3, size=waveform.shape).astype(np.float32)
+
+    decoder = css_rx.IncrementalCSSDecoder(params)
+    payloads = []
+    for start in range(0, waveform.size, 997):
+        for _, _, payload in decoder.ingest(waveform[start : start + 997]):
+            payloads.append(payload)
+        assert decoder.buffered_samples <= decoder.capacity
+
+    assert payloads == [b"first", "second ✓".encode("utf-8")]
+    assert decoder.capacity < 8 * params.Ns
+
+
+def test_incremental_css_decoder_estimates_frequency_offset() -> None:
+    params = _streaming_params()
+    rng = np.random.default_rng(8)
+    for offset_hz in (-9.0, 6.0):
+        waveform = np.concatenate(
+            [np.zeros(3_001, dtype=np.float32), _css_frame("cfo", _streaming_params(offset_hz))]
+        )
+        waveform += rng.normal(0.0, 0.2, size=waveform.shape).astype(np.float32)
+
+        frames = list(css_rx.stream_css_frames_from_chunks(np.array_split(waveform, 40), params))
+
+        assert len(frames) == 1
+        metadata, header, payload = frames[0]
+        assert payload == b"cfo"
+        assert header.length == 3
+        assert abs(metadata.cfo_hz - offset_hz) < 0.5
+
+
+def test_chirp_tables_match_direct_synthesis() -> None:
+    params = css.ChirpParams(sf=7, bw=1_000.0, fc=2_000.0)
+    reference = css.generate_reference_chirp(params)
+    window = css._raised_cosine_window(params)
+    expected = css_rx._build_symbol_templates(reference, window, params)
+
+    cached = css.chirp_tables(params)
+    sliced = css.ChirpTables(params, max_table_bytes=0)
+    assert cached.symbol_waveforms is not None
+    assert sliced.symbol_waveforms is None
+    shifts = np.array([0, 1, 77, params.M - 1])
+    for tables in (cached, sliced):
+        np.testing.assert_array_equal(tables.symbol_waveform_rows(shifts), expected[shifts])
+        np.testing.assert_array_equal(tables.symbol_waveform(77), expected[77])
+    assert css.chirp_tables(params) is cached
+    assert not cached.window.flags.writeable
+
+
+def test_chirp_table_cache_respects_byte_budget() -> None:
+    first = css.ChirpParams(sf=7, bw=1_000.0, fc=2_000.0)
+    second = css.ChirpParams(sf=7, bw=1_000.0, fc=2_500.0)
+    budget = css.ChirpTables(first).nbytes + 1
+    cache = css._ChirpTableCache(budget)
+
+    tables = cache.get(first)
+    assert cache.get(first) is tables
+    cache.get(second)
+    assert cache.nbytes <= budget
+    assert cache.get(first) is not tables
+
+
+def test_fec_frames_decode_aligned_and_streaming() -> None:
+    params = _streaming_params()
+    message = "coded ✓"
+    payload = message.encode("utf-8")
+    header = framing.Header(
+        version=config.DEFAULT_VERSION, rate_code=0, flags=0, length=len(payload)
+    )
+    waveform = css.assemble_css_transmission(
+        message, header=header, params=params, fec_enabled=True, interleave_depth=16
+    )
+    preamble = params.preamble_up + params.preamble_down + len(css.SYNC_PATTERN)
+    expected_symbols = css.fec_section_symbols(header.HEADER_LENGTH) + css.fec_section_symbols(
+        len(payload) + 2
+    )
+    assert waveform.size == (preamble + expected_symbols) * params.Ns
+
+    # Blank two data symbols: far too many bit errors for the plain frame, but the interleaved
+    # code sees them as short erasures.
+    damaged = waveform.copy()
+    for symbol in (preamble + 14, preamble + 22):
+        damaged[symbol * params.Ns : (symbol + 1) * params.Ns] = 0.0
+
+    _, decoded_header, decoded = css_rx.decode_css_waveform(
+        damaged, params, fec_enabled=True, interleave_depth=16
+    )
+    assert decoded == payload
+    assert decoded_header.flags & config.CSS_FLAG_FEC
+
+    silence = np.zeros(2_222, dtype=np.float32)
+    stream = np.concatenate([silence, damaged, silence])
+    frames = list(
+        css_rx.stream_css_frames_from_chunks(
+            np.array_split(stream, 25), params, fec_enabled=True, interleave_depth=16
+        )
+    )
+    assert [frame[2] for frame in frames] == [payload]
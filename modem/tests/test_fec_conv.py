@@ -0,0 +1,105 @@
+"""
+Tests for the convolutional encoder, interleaver and Viterbi decoders.
+"""
+
+from __future__ import annotations
+
+import numpy as np
+import pytest
+
+from modem import fec_conv
+
+
+@pytest.mark.parametrize("terminate", [True, False])
+@pytest.mark.parametrize("length", [0, 1, 6, 7, 100, 513])
+def test_viterbi_matches_reference_decoder(length: int, terminate: bool) -> None:
+    rng = np.random.default_rng(length)
+    bits = rng.integers(0, 2, size=length).tolist()
+    encoded = np.array(fec_conv.conv_encode(bits, terminate=terminate))
+    for flips in (0, 3, 25):
+        received = encoded.copy()
+        if received.size and flips:
+            received[rng.integers(0, received.size, size=flips)] ^= 1
+        expected = fec_conv._viterbi_decode_hard_reference(received.tolist(), terminate=terminate)
+        assert fec_conv.viterbi_decode_hard(received.tolist(), terminate=terminate) == expected
+        if flips == 0 and terminate:
+            assert expected == bits
+
+
+def test_viterbi_decode_soft_uses_confidence() -> None:
+    rng = np.random.default_rng(11)
+    bits = rng.integers(0, 2, size=200).tolist()
+    encoded = np.array(fec_conv.conv_encode(bits))
+    # A burst too dense for hard decisions, but flagged as unreliable.
+    received = encoded.copy()
+    received[100:112] ^= 1
+    confidence = np.ones(received.size)
+    confidence[100:112] = 0.1
+
+    assert fec_conv.viterbi_decode_hard(received.tolist()) != bits
+    assert fec_conv.viterbi_decode_soft(fec_conv.soft_bits(received, confidence)) == bits
+
+
+def test_viterbi_rejects_odd_length() -> None:
+    with pytest.raises(ValueError):
+        fec_conv.viterbi_decode_soft([0.0, 1.0, 0.5])
+
+
+def test_streaming_viterbi_matches_batch_decoder() -> None:
+    rng = np.random.default_rng(12)
+    bits = rng.integers(0, 2, size=301).tolist()
+    encoded = np.array(fec_conv.conv_encode(bits))
+    encoded[rng.integers(0, encoded.size, size=6)] ^= 1
+    received = fec_conv.soft_bits(encoded, rng.uniform(0.3, 1.0, size=encoded.size))
+
+    decoder = fec_conv.StreamingViterbiDecoder(traceback_depth=len(bits) + 16)
+    decoded: list[int] = []
+    for piece in np.array_split(received, 17):
+        decoded.extend(decoder.push(piece))
+    assert decoded == []
+    decoded.extend(decoder.flush())
+
+    assert decoded == fec_conv.viterbi_decode_soft(received)
+
+
+def test_streaming_viterbi_has_bounded_latency_and_memory() -> None:
+    rng = np.random.default_rng(13)
+    depth = 48
+    bits = rng.integers(0, 2, size=20_000).tolist()
+    encoded = np.array(fec_conv.conv_encode(bits))
+    # Sparse, well separated errors are corrected within the traceback depth.
+    encoded[np.arange(50, encoded.size, 400)] ^= 1
+
+    decoder = fec_conv.StreamingViterbiDecoder(traceback_depth=depth)
+    decoded: list[int] = []
+    for start in range(0, encoded.size, 333):
+        decoded.extend(decoder.push(encoded[start : start + 333]))
+        assert decoder.pending_steps <= 2 * depth + 2 * fec_conv._VITERBI_CHUNK_PAIRS
+        received_steps = min(start + 333, encoded.size) // 2
+        assert len(decoded) + decoder.pending_steps == received_steps
+    decoded.extend(decoder.flush())
+
+    assert decoded == bits
+    assert decoder.pending_steps == 0
+
+
+def test_table_encoder_matches_reference_encoder() -> None:
+    rng = np.random.default_rng(14)
+    for length in (0, 1, 9, 300):
+        bits = rng.integers(0, 2, size=length)
+        for terminate in (True, False):
+            expected = fec_conv._conv_encode_reference(bits.tolist(), terminate=terminate)
+            encoded = fec_conv.conv_encode_array(bits, terminate=terminate)
+            assert encoded.dtype == np.uint8
+            assert encoded.tolist() == expected
+            assert fec_conv.conv_encode(bits.tolist(), terminate=terminate) == expected
+
+
+@pytest.mark.parametrize("depth", [1, 3, 8])
+def test_interleave_round_trip_spreads_neighbours(depth: int) -> None:
+    values = np.arange(50)
+    interleaved = fec_conv.interleave(values, depth)
+    np.testing.assert_array_equal(fec_conv.deinterleave(interleaved, depth), values)
+    positions = np.argsort(interleaved)
+    if depth > 1:
+        assert np.all(np.abs(np.diff(positions[:16])) >= depth - 1)
@@ -0,0 +1,69 @@
+"""
+Tests for the streaming polyphase resampler.
+"""
+
+from __future__ import annotations
+
+import wave
+
+import numpy as np
+import pytest
+
+from modem import config
+from modem.resample import StreamingResampler, resample_chunks
+from modem.rx import IncrementalFrameDecoder
+from modem.wav import WavReader
+
+
+@pytest.mark.parametrize("rates", [(44_100, 48_000), (48_000, 12_000), (8_000, 48_000)])
+def test_chunked_resampling_matches_one_shot(rates: tuple[int, int]) -> None:
+    rng = np.random.default_rng(4)
+    samples = rng.normal(size=30_000)
+
+    whole = StreamingResampler(*rates)
+    expected = np.concatenate((whole.process(samples), whole.flush()))
+    assert expected.size == -(-samples.size * whole.up // whole.down)
+
+    chunks = np.split(samples, np.sort(rng.choice(samples.size, size=40, replace=False)))
+    streamed = np.concatenate(list(resample_chunks(chunks, *rates)))
+    np.testing.assert_array_equal(streamed, expected)
+
+
+def test_resampler_matches_scipy_resample_poly() -> None:
+    signal = pytest.importorskip("scipy.signal")
+    samples = np.random.default_rng(5).normal(size=10_000)
+    resampler = StreamingResampler(44_100, 48_000)
+    ours = np.concatenate((resampler.process(samples), resampler.flush()))
+    reference = signal.resample_poly(samples, resampler.up, resampler.down)
+    np.testing.assert_allclose(ours, reference, atol=1e-5)
+
+
+def test_resampler_preserves_tone_and_alignment() -> None:
+    t = np.arange(44_100) / 44_100
+    tone = np.sin(2 * np.pi * 1_200.0 * t)
+    resampler = StreamingResampler(44_100, 48_000)
+    out = np.concatenate((resampler.process(tone), resampler.flush()))
+    expected = np.sin(2 * np.pi * 1_200.0 * np.arange(out.size) / 48_000)
+    np.testing.assert_allclose(out[200:-200], expected[200:-200], atol=2e-3)
+
+
+def test_decoder_reads_44k1_wav_through_resampler(tmp_path, text_transmission) -> None:
+    message = "resampled"
+    waveform = text_transmission(message, baud=100)
+    resampler = StreamingResampler(config.SAMPLE_RATE, 44_100)
+    recorded = np.concatenate((resampler.process(waveform), resampler.flush()))
+    path = tmp_path / "cd_rate.wav"
+    with wave.open(str(path), "wb") as handle:
+        handle.setnchannels(1)
+        handle.setsampwidth(2)
+        handle.setframerate(44_100)
+        handle.writeframes((np.clip(recorded, -1.0, 1.0) * 32_767).astype("<i2").tobytes())
+
+    decoder = IncrementalFrameDecoder()
+    reader = WavReader(path)
+    payloads = [
+        payload
+        for chunk in reader.iter_chunks(chunk_samples=5_000, output_rate=config.SAMPLE_RATE)
+        for _, _, payload in decoder.ingest(chunk)
+    ]
+    assert payloads == [message.encode("utf-8")]
@@ -4,11 +4,21 @@ Tests for the receive-side helpers.
 
 from __future__ import annotations
 
+from types import SimpleNamespace
+
 import numpy as np
 
-from modem import config
+from modem import config, framing, utils
 from modem.framing import Header
-from modem.rx import decode_stream, detect_start_tone
+from modem.rx import (
+    END_TONE_DETECTOR,
+    START_TONE_DETECTOR,
+    CallbackCapture,
+    _find_tone_window,
+    _first_crc_valid_frame,
+    decode_stream,
+    detect_start_tone,
+)
 from modem.tx import assemble_transmission
 
 
@@ -67,3 +77,78 @@ def test_decode_stream_requires_start_tone() -> None:
 
     assert list(decode_stream(truncated)) == []
 
+
+def test_vectorized_tone_search_matches_reference() -> None:
+    rng = np.random.default_rng(11)
+    window_size = 960
+    noise = rng.normal(0.0, 0.01, size=3000).astype(np.float32)
+    start_tone = _make_tone(config.START_TONE_FREQUENCY, 60.0)
+    end_tone = _make_tone(config.END_TONE_FREQUENCY, 45.0)
+    waveform = np.concatenate((noise, start_tone, noise, end_tone, noise))
+
+    for detector, refine in ((START_TONE_DETECTOR, False), (END_TONE_DETECTOR, True)):
+        offsets = np.arange(0, waveform.size - window_size + 1, 37)
+        expected = [detector(waveform[o : o + window_size]) for o in offsets]
+        mask = detector.detect_windows(waveform, offsets, window_size=window_size)
+        assert mask.tolist() == expected
+
+        reference = _find_tone_window(
+            waveform,
+            detector,
+            window_size=window_size,
+            start_index=0,
+            refine_forward=refine,
+            vectorized=False,
+        )
+        vectorized = _find_tone_window(
+            waveform, detector, window_size=window_size, start_index=0, refine_forward=refine
+        )
+        assert reference >= 0
+        assert vectorized == reference
+
+
+def test_first_crc_valid_frame_skips_spurious_sync_hits() -> None:
+    baud = 200
+    payload = b"screened"
+    header = Header(
+        version=config.DEFAULT_VERSION,
+        rate_code=config.BAUD_TO_RATE_CODE[baud],
+        flags=config.DEFAULT_FLAGS,
+        length=len(payload),
+    )
+    sync = utils.unpack_bits(b"\xDD\xAA")
+    frame = utils.unpack_bits(framing.build_frame(header, payload))
+    # A sync word followed by a plausible header but corrupted payload precedes the frame.
+    corrupted = frame.copy()
+    corrupted[-20] ^= 1
+    noise = np.random.default_rng(2).integers(0, 2, size=37).astype(np.uint8)
+    bits = np.concatenate((noise, sync, corrupted, noise, sync, frame, noise))
+
+    starts = utils.find_sync_all(bits, sync) + sync.size
+    assert starts.size >= 2
+    expected = noise.size + sync.size + corrupted.size + noise.size + sync.size
+    assert _first_crc_valid_frame(bits, starts, baud=baud) == expected
+    assert _first_crc_valid_frame(bits, starts, baud=100) == -1
+
+
+def test_callback_capture_hands_blocks_to_consumer_and_counts_overflows() -> None:
+    capture = CallbackCapture(sample_rate=1000, blocksize=4, buffer_seconds=0.01)
+    blocks = [np.arange(i * 4, i * 4 + 4, dtype=np.float32)[:, None] for i in range(3)]
+    timing = SimpleNamespace(inputBufferAdcTime=1.0, currentTime=1.002)
+    capture._callback(blocks[0], 4, timing, SimpleNamespace(input_overflow=False))
+    capture._callback(blocks[1], 4, timing, SimpleNamespace(input_overflow=True))
+    # The ring holds 10 samples, so half of the third block is dropped.
+    capture._callback(blocks[2], 4, timing, SimpleNamespace(input_overflow=False))
+
+    metrics = capture.metrics
+    assert metrics.callbacks == 3
+    assert metrics.input_overflows == 1
+    assert metrics.captured_samples == 10
+    assert metrics.dropped_samples == 2
+    assert metrics.queue_depth == metrics.max_queue_depth == 10
+    assert metrics.max_callback_latency >= 0.002
+
+    # The stream is not running, so `chunks` drains the ring and stops.
+    received = np.concatenate(list(capture.chunks(max_samples=3)))
+    assert received.tolist() == list(range(10))
+    assert capture.metrics.queue_depth == 0
@@ -4,34 +4,31 @@ Tests for stream decoding of received audio frames.
 
 from __future__ import annotations
 
+from collections.abc import Callable
+
 import numpy as np
+import pytest
 
-from modem import config
-from modem.framing import Header
+from modem import config, rx
+from modem.framing import Header, fragment_flags, split_payload
 from modem.rx import (
+    FrameReassembler,
     IncrementalFrameDecoder,
+    MultiChannelFrameDecoder,
     decode_stream,
     stream_frames_from_chunks,
 )
-from modem.tx import assemble_transmission
-
-
-def _make_header(message: str, *, baud: int) -> Header:
-    payload_len = len(message.encode("utf-8"))
-    return Header(
-        version=config.DEFAULT_VERSION,
-        rate_code=config.BAUD_TO_RATE_CODE[baud],
-        flags=config.DEFAULT_FLAGS,
-        length=payload_len,
-    )
+from modem.tx import TransmitQueue, assemble_transmission
 
 
-def test_decode_stream_handles_repeated_frames() -> None:
+def test_decode_stream_handles_repeated_frames(text_header) -> None:
     message = "Stream test payload"
     baud = 200
-    header = _make_header(message, baud=baud)
+    header = text_header(message, baud)
 
-    waveform = np.asarray(assemble_transmission(message, header=header, repeats=3), dtype=np.float32)
+    waveform = np.asarray(
+        assemble_transmission(message, header=header, repeats=3), dtype=np.float32
+    )
     decoded = list(decode_stream(waveform))
 
     assert len(decoded) == 3
@@ -41,12 +38,14 @@ def test_decode_stream_handles_repeated_frames() -> None:
         assert metadata.detected_baud == baud
 
 
-def test_decode_stream_with_leading_noise() -> None:
+def test_decode_stream_with_leading_noise(text_header) -> None:
     message = "Noise guard"
     baud = 100
-    header = _make_header(message, baud=baud)
+    header = text_header(message, baud)
 
-    waveform = np.asarray(assemble_transmission(message, header=header, repeats=1), dtype=np.float32)
+    waveform = np.asarray(
+        assemble_transmission(message, header=header, repeats=1), dtype=np.float32
+    )
     rng = np.random.default_rng(7)
     noise = 0.02 * rng.normal(size=int(0.15 * config.SAMPLE_RATE))
     padded_waveform = np.concatenate((noise.astype(np.float32), waveform))
@@ -60,12 +59,14 @@ def test_decode_stream_with_leading_noise() -> None:
     assert metadata.detected_baud == baud
 
 
-def test_incremental_decoder_handles_split_frame() -> None:
+def test_incremental_decoder_handles_split_frame(text_header) -> None:
     message = "Incremental payload"
     baud = 200
-    header = _make_header(message, baud=baud)
+    header = text_header(message, baud)
 
-    waveform = np.asarray(assemble_transmission(message, header=header, repeats=1), dtype=np.float32)
+    waveform = np.asarray(
+        assemble_transmission(message, header=header, repeats=1), dtype=np.float32
+    )
     halfway = waveform.size // 2
 
     decoder = IncrementalFrameDecoder()
@@ -82,11 +83,11 @@ def test_incremental_decoder_handles_split_frame() -> None:
     assert metadata.detected_baud == baud
 
 
-def test_stream_frames_from_chunks_handles_multiple_frames() -> None:
+def test_stream_frames_from_chunks_handles_multiple_frames(text_header) -> None:
     message = "Chunked stream"
     repeats = 2
     baud = 100
-    header = _make_header(message, baud=baud)
+    header = text_header(message, baud)
     waveform = np.asarray(
         assemble_transmission(message, header=header, repeats=repeats),
         dtype=np.float32,
@@ -102,10 +103,10 @@ def test_stream_frames_from_chunks_handles_multiple_frames() -> None:
         assert metadata.detected_baud == baud
 
 
-def test_stream_frames_from_chunks_handles_low_baud_length() -> None:
+def test_stream_frames_from_chunks_handles_low_baud_length(text_header) -> None:
     message = "Slow channel payload with a reasonable length"
     baud = min(config.BAUD_RATES)
-    header = _make_header(message, baud=baud)
+    header = text_header(message, baud)
     waveform = np.asarray(
         assemble_transmission(message, header=header, repeats=1),
         dtype=np.float32,
@@ -120,3 +121,257 @@ def test_stream_frames_from_chunks_handles_low_baud_length() -> None:
     assert payload == message.encode("utf-8")
     assert metadata.detected_baud == baud
 
+
+def test_incremental_decoder_memory_stays_bounded(text_header) -> None:
+    message = "Bounded"
+    baud = 200
+    header = text_header(message, baud)
+    waveform = np.asarray(
+        assemble_transmission(message, header=header, repeats=1), dtype=np.float32
+    )
+
+    decoder = IncrementalFrameDecoder()
+    rng = np.random.default_rng(21)
+    block = config.SAMPLE_RATE
+    # More audio than the decoder may retain, followed by a frame split across blocks.
+    for _ in range(2 * decoder.capacity // block):
+        assert list(decoder.ingest(0.01 * rng.normal(size=block))) == []
+        assert decoder.buffered_samples <= decoder.capacity
+
+    decoded = [frame for chunk in np.array_split(waveform, 7) for frame in decoder.ingest(chunk)]
+    assert len(decoded) == 1
+    assert decoded[0][2] == message.encode("utf-8")
+    assert decoder.buffered_samples <= decoder.capacity
+
+
+def test_incremental_decoder_detector_work_is_linear(text_header) -> None:
+    baud = min(config.BAUD_RATES)
+    block = int(0.1 * config.SAMPLE_RATE)
+    step = max(1, int(round(config.START_END_TONE_DURATION_MS / 1000.0 * config.SAMPLE_RATE)) // 10)
+
+    evaluations_per_step: list[float] = []
+    for length in (20, 80):
+        message = "x" * length
+        header = text_header(message, baud)
+        waveform = np.asarray(assemble_transmission(message, header=header), dtype=np.float32)
+
+        decoder = IncrementalFrameDecoder()
+        decoded = [
+            frame
+            for chunk in np.array_split(waveform, waveform.size // block)
+            for frame in decoder.ingest(chunk)
+        ]
+        assert len(decoded) == 1
+        assert decoded[0][2] == message.encode("utf-8")
+        evaluations_per_step.append(decoder.detector_evaluations / (waveform.size / step))
+
+    # Rescanning the data region on every chunk would make this ratio grow with the frame.
+    assert evaluations_per_step[1] <= evaluations_per_step[0]
+    assert evaluations_per_step[1] < 2.0
+
+
+def test_transmit_queue_fragments_are_reassembled() -> None:
+    message = "Fragmented ✓ message"
+    tx_queue = TransmitQueue(baud=200, max_payload=8)
+    assert tx_queue.put(message) == 3
+    tx_queue.put("short")
+    tx_queue.close()
+
+    frames = list(stream_frames_from_chunks(tx_queue.blocks()))
+    assert [header.flags for _, header, _ in frames] == [
+        config.FLAG_MORE_FRAGMENTS | 0,
+        config.FLAG_MORE_FRAGMENTS | 1,
+        2,
+        config.DEFAULT_FLAGS,
+    ]
+    assert all(len(payload) <= 8 for _, _, payload in frames)
+
+    reassembler = FrameReassembler()
+    messages = [reassembler.push(header, payload) for _, header, payload in frames]
+    assert messages == [None, None, message.encode("utf-8"), b"short"]
+
+
+def test_messages_longer_than_the_sequence_space_are_rejected() -> None:
+    # Sequence numbers wrap after MAX_FRAGMENTS frames, and a wrapped sequence 0 would
+    # restart the receiver's message.
+    limit = config.MAX_FRAGMENTS * 4
+    payload = bytes(range(65, 91)) * 3
+    assert len(payload) > limit
+    with pytest.raises(ValueError):
+        split_payload(payload, 4)
+    with pytest.raises(ValueError):
+        TransmitQueue(baud=200, max_payload=4).put_bytes(payload)
+
+    fragments = split_payload(payload[:limit], 4)
+    assert len(fragments) == config.MAX_FRAGMENTS
+    reassembler = FrameReassembler()
+    messages = [
+        reassembler.push(
+            Header(
+                version=config.DEFAULT_VERSION,
+                rate_code=config.BAUD_TO_RATE_CODE[200],
+                flags=fragment_flags(sequence, more=sequence < len(fragments) - 1),
+                length=len(fragment),
+            ),
+            fragment,
+        )
+        for sequence, fragment in enumerate(fragments)
+    ]
+    assert messages == [None] * (len(fragments) - 1) + [payload[:limit]]
+
+
+def test_frame_reassembler_drops_message_with_missing_fragment() -> None:
+    def fragment(sequence: int, more: bool, payload: bytes) -> tuple[Header, bytes]:
+        flags = sequence | (config.FLAG_MORE_FRAGMENTS if more else 0)
+        header = Header(config.DEFAULT_VERSION, 0, flags, len(payload))
+        return header, payload
+
+    reassembler = FrameReassembler()
+    assert reassembler.push(*fragment(0, True, b"ab")) is None
+    assert reassembler.push(*fragment(2, False, b"ef")) is None
+    assert reassembler.pending_fragments == 0
+    assert reassembler.push(*fragment(0, True, b"ab")) is None
+    assert reassembler.push(*fragment(1, False, b"cd")) == b"abcd"
+
+
+def test_multichannel_decoder_separates_simultaneous_channels(text_header) -> None:
+    channels = config.channel_plans(3)
+    messages = ("first channel", "second channel", "third")
+    bauds = (200, 100, 200)
+    offsets = (0, 7_000, 30_000)
+    length = 0
+    waveforms = []
+    for channel, message, baud, offset in zip(channels, messages, bauds, offsets):
+        waveform = assemble_transmission(
+            message, header=text_header(message, baud), channel=channel
+        )
+        waveforms.append((offset, waveform))
+        length = max(length, offset + waveform.size)
+    mixed = np.zeros(length + 4_800, dtype=np.float32)
+    for offset, waveform in waveforms:
+        mixed[offset : offset + waveform.size] += waveform / len(channels)
+
+    decoder = MultiChannelFrameDecoder(channels)
+    decoded = []
+    for start in range(0, mixed.size, 9_000):
+        decoded.extend(decoder.ingest(mixed[start : start + 9_000]))
+        assert decoder.buffered_samples <= decoder.capacity
+
+    assert sorted((index, payload) for index, (_, _, payload) in decoded) == [
+        (index, message.encode("utf-8")) for index, message in enumerate(messages)
+    ]
+    for index, (metadata, header, _) in decoded:
+        assert metadata.detected_baud == bauds[index]
+        assert header.length == len(messages[index])
+
+
+def test_incremental_decoder_ignores_other_channels(text_header) -> None:
+    channels = config.channel_plans(2)
+    message = "off channel"
+    waveform = assemble_transmission(
+        message, header=text_header(message, 200), channel=channels[1]
+    )
+
+    assert list(IncrementalFrameDecoder().ingest(waveform)) == []
+    decoded = list(IncrementalFrameDecoder(channel=channels[1]).ingest(waveform))
+    assert [payload for _, _, payload in decoded] == [message.encode("utf-8")]
+
+
+def _rate_test_vectors(text_header: Callable[..., Header]) -> np.ndarray:
+    rng = np.random.default_rng(11)
+    parts = [0.02 * rng.normal(size=7_000)]
+    for baud in config.BAUD_RATES:
+        message = f"decimated {baud}"
+        parts.append(assemble_transmission(message, header=text_header(message, baud)))
+        parts.append(0.02 * rng.normal(size=5_000))
+    waveform = np.concatenate(parts)
+    return (waveform + 0.05 * rng.normal(size=waveform.size)).astype(np.float32)
+
+
+@pytest.mark.parametrize("processing_rate", [12_000, 8_000])
+def test_decimated_processing_rate_decodes_identical_frames(
+    processing_rate: int, text_header
+) -> None:
+    waveform = _rate_test_vectors(text_header)
+    reference = list(decode_stream(waveform))
+    assert len(reference) == len(config.BAUD_RATES)
+
+    decoded = list(decode_stream(waveform, processing_rate=processing_rate))
+
+    assert [(m.detected_baud, h, p) for m, h, p in decoded] == [
+        (m.detected_baud, h, p) for m, h, p in reference
+    ]
+    # Offsets stay in input samples, within one search step of the full-rate decoder.
+    step = config.SAMPLE_RATE * config.START_END_TONE_DURATION_MS // 10_000
+    for (metadata, _, _), (expected, _, _) in zip(decoded, reference):
+        assert abs(metadata.sample_offset - expected.sample_offset) <= step
+    decimated = IncrementalFrameDecoder(processing_rate=processing_rate)
+    assert decimated.capacity < IncrementalFrameDecoder().capacity
+    assert decimated.max_frame_samples >= IncrementalFrameDecoder().max_frame_samples
+
+
+def test_multichannel_decoder_at_processing_rate(text_header) -> None:
+    channels = config.channel_plans(2)
+    messages = ("low channel", "high channel")
+    waveforms = [
+        assemble_transmission(message, header=text_header(message, 200), channel=channel)
+        for channel, message in zip(channels, messages)
+    ]
+    mixed = np.zeros(max(waveform.size for waveform in waveforms), dtype=np.float32)
+    for waveform in waveforms:
+        mixed[: waveform.size] += waveform / len(channels)
+
+    decoder = MultiChannelFrameDecoder(channels, processing_rate=12_000)
+    decoded = list(decoder.ingest(mixed))
+    assert sorted((index, payload) for index, (_, _, payload) in decoded) == [
+        (index, message.encode("utf-8")) for index, message in enumerate(messages)
+    ]
+    # The third channel's 7 kHz space tone does not fit below 12 kHz.
+    with pytest.raises(ValueError):
+        MultiChannelFrameDecoder(config.channel_plans(3), processing_rate=12_000)
+
+
+@pytest.mark.parametrize("processing_rate", [None, 8_000])
+def test_timing_recovery_decodes_misaligned_frames_in_one_attempt(
+    processing_rate: int | None, text_header
+) -> None:
+    # With 10k-sample chunks the start tones are detected early by amounts that leave
+    # the data sections out of symbol alignment.
+    waveform = _rate_test_vectors(text_header)
+    decoder = IncrementalFrameDecoder(processing_rate=processing_rate)
+    decoded = [
+        frame
+        for start in range(0, waveform.size, 10_000)
+        for frame in decoder.ingest(waveform[start : start + 10_000])
+    ]
+
+    assert [metadata.detected_baud for metadata, _, _ in decoded] == list(config.BAUD_RATES)
+    assert [payload for _, _, payload in decoded] == [
+        f"decimated {baud}".encode("utf-8") for baud in config.BAUD_RATES
+    ]
+    assert decoder.parse_attempts == len(decoded)
+
+
+def test_microphone_stream_decodes_at_processing_rate(monkeypatch, text_transmission) -> None:
+    waveform = text_transmission("live low rate").astype(np.float32)
+    chunks = [waveform[start : start + 4_800] for start in range(0, waveform.size, 4_800)]
+    monkeypatch.setattr(rx, "read_from_microphone", lambda **_kwargs: iter(chunks))
+    created: list[int] = []
+    original_init = IncrementalFrameDecoder.__init__
+
+    def recording_init(self, **kwargs) -> None:
+        original_init(self, **kwargs)
+        created.append(self.processing_rate)
+
+    monkeypatch.setattr(IncrementalFrameDecoder, "__init__", recording_init)
+
+    frames = list(rx.stream_frames_from_microphone(processing_rate=8_000))
+
+    assert [payload for _, _, payload in frames] == [b"live low rate"]
+    assert created == [8_000]
+
+
+@pytest.mark.parametrize("processing_rate", [96_000, 11_025, 4_000])
+def test_processing_rate_is_validated(processing_rate: int) -> None:
+    with pytest.raises(ValueError):
+        IncrementalFrameDecoder(processing_rate=processing_rate)
@@ -4,15 +4,19 @@ Unit tests for the transmit helpers.
 
 from __future__ import annotations
 
+import threading
+from collections.abc import Iterator
+from functools import partial
 from pathlib import Path
+from types import SimpleNamespace
 
 import numpy as np
 import pytest
 from scipy.io import wavfile
 
-from modem import config
-from modem.framing import Header
-from modem.tx import assemble_transmission, write_wav
+from modem import config, tx
+from modem.framing import Header, split_payload
+from modem.tx import assemble_transmission, iter_transmission_blocks, play_audio, write_wav
 
 
 def _expected_frame_lengths(baud: int, payload_len: int) -> tuple[int, int, int]:
@@ -105,3 +109,117 @@ def test_write_wav_round_trip(tmp_path: Path) -> None:
     assert decoded.dtype == np.float32
     np.testing.assert_allclose(decoded, waveform, rtol=1e-6, atol=1e-6)
 
+
+def test_iter_transmission_blocks_matches_assembled_waveform(text_header) -> None:
+    header = text_header("Hello", 200)
+    waveform = assemble_transmission("Hello", header=header, repeats=3)
+
+    blocks = list(iter_transmission_blocks("Hello", header=header, repeats=3, block_size=5000))
+
+    assert all(block.shape == (5000,) for block in blocks[:-1])
+    assert all(block.dtype == np.float32 for block in blocks)
+    np.testing.assert_array_equal(np.concatenate(blocks), waveform)
+
+
+def test_write_wav_streams_blocks(tmp_path: Path, text_header) -> None:
+    header = text_header("Stream", 100)
+    waveform = assemble_transmission("Stream", header=header, repeats=2)
+    destination = tmp_path / "streamed.wav"
+
+    write_wav(iter_transmission_blocks("Stream", header=header, repeats=2), destination)
+
+    sample_rate, decoded = wavfile.read(destination)
+    assert sample_rate == config.SAMPLE_RATE
+    assert decoded.dtype == np.float32
+    np.testing.assert_array_equal(decoded, waveform)
+
+
+def test_write_wav_leaves_no_file_when_the_stream_fails(tmp_path: Path) -> None:
+    destination = tmp_path / "failed.wav"
+    destination.write_bytes(b"previous recording")
+
+    def failing_blocks() -> Iterator[np.ndarray]:
+        yield np.zeros(1024, dtype=np.float32)
+        raise RuntimeError("synthesis failed")
+
+    with pytest.raises(RuntimeError):
+        write_wav(failing_blocks(), destination)
+
+    assert destination.read_bytes() == b"previous recording"
+    assert [path.name for path in tmp_path.iterdir()] == ["failed.wav"]
+
+
+class _FakeOutputStream:
+    """Drives the playback callback from a worker thread, like a PortAudio stream."""
+
+    def __init__(
+        self, *, played: list[np.ndarray], blocksize: int, callback, finished_callback, **_kwargs
+    ) -> None:
+        self.played = played
+        self._blocksize = blocksize
+        self._callback = callback
+        self._finished_callback = finished_callback
+        self._thread = threading.Thread(target=self._run)
+
+    def _run(self) -> None:
+        while True:
+            outdata = np.full((self._blocksize, 1), np.nan, dtype=np.float32)
+            try:
+                self._callback(outdata, self._blocksize, None, None)
+            except _FakeCallbackStop:
+                self.played.append(outdata[:, 0].copy())
+                break
+            self.played.append(outdata[:, 0].copy())
+        self._finished_callback()
+
+    def start(self) -> None:
+        self._thread.start()
+
+    def close(self) -> None:
+        if self._thread.is_alive():
+            self._thread.join()
+
+    def __enter__(self) -> "_FakeOutputStream":
+        # Like sounddevice, entering the stream starts it.
+        self.start()
+        return self
+
+    def __exit__(self, *_exc) -> None:
+        self.close()
+
+
+class _FakeCallbackStop(Exception):
+    pass
+
+
+def test_play_audio_streams_blocks_through_output_callback(monkeypatch, text_header) -> None:
+    played: list[np.ndarray] = []
+    fake_sd = SimpleNamespace(
+        OutputStream=partial(_FakeOutputStream, played=played), CallbackStop=_FakeCallbackStop
+    )
+    monkeypatch.setattr(tx, "sd", fake_sd)
+
+    header = text_header("Hi", 200)
+    waveform = assemble_transmission("Hi", header=header)
+    block_size = 8192
+    play_audio(iter_transmission_blocks("Hi", header=header), block_size=block_size)
+
+    # The whole transmission fits in the playback queue, which is filled before the stream
+    # starts, so no callback before the end of the waveform underruns into silence.
+    full_blocks = waveform.size // block_size
+    assert full_blocks >= 1
+    assert all(np.any(block) for block in played[:full_blocks])
+    audio = np.concatenate(played)
+    np.testing.assert_array_equal(audio[: waveform.size], waveform)
+    assert not np.any(audio[waveform.size :])
+
+
+def test_split_payload_respects_utf8_boundaries() -> None:
+    payload = "aé✓b".encode("utf-8") * 5
+    fragments = split_payload(payload, 4)
+
+    assert b"".join(fragments) == payload
+    assert all(0 < len(fragment) <= 4 for fragment in fragments)
+    for fragment in fragments:
+        fragment.decode("utf-8")
+    assert split_payload(b"", 4) == [b""]
@@ -0,0 +1,110 @@
+"""
+Tests for the shared utility helpers.
+"""
+
+from __future__ import annotations
+
+import threading
+
+import numpy as np
+import pytest
+
+from modem import utils
+
+
+def test_bit_packing_round_trip() -> None:
+    payload = bytes(range(256))
+    bits = utils.unpack_bits(payload)
+    assert bits.dtype == np.uint8
+    assert bits[:16].tolist() == [0] * 15 + [1]
+    assert utils.pack_bits(bits) == payload
+    assert utils.bits_from_bytes(b"\xDD") == [1, 1, 0, 1, 1, 1, 0, 1]
+    assert utils.bytes_from_bits([1, 1, 0, 1, 1, 1, 0, 1]) == b"\xDD"
+    with pytest.raises(ValueError):
+        utils.pack_bits(np.ones(7, dtype=np.uint8))
+
+
+def test_find_sync_matches_naive_search() -> None:
+    rng = np.random.default_rng(9)
+    pattern = utils.unpack_bits(b"\xDD\xAA")
+    bits = rng.integers(0, 2, size=4000).astype(np.uint8)
+    bits[2500:2516] = pattern
+
+    naive = next(
+        idx
+        for idx in range(bits.size - pattern.size + 1)
+        if np.array_equal(bits[idx : idx + pattern.size], pattern)
+    )
+    assert utils.find_sync(bits, pattern) == naive
+    assert utils.find_sync(bits[:10], pattern) == -1
+    assert utils.find_sync(np.zeros(64, dtype=np.uint8), pattern) == -1
+
+
+def test_ring_buffer_append_consume_and_view() -> None:
+    ring = utils.RingBuffer(8)
+    ring.append(np.arange(5, dtype=np.float32))
+    ring.consume(3)
+    ring.append(np.arange(5, 11, dtype=np.float32))
+
+    view = ring.view()
+    assert view.tolist() == [3.0, 4.0, 5.0, 6.0, 7.0, 8.0, 9.0, 10.0]
+    assert view.flags.c_contiguous
+    assert not view.flags.writeable
+    assert ring.free == 0
+
+
+def test_ring_buffer_rejects_overflow() -> None:
+    ring = utils.RingBuffer(4)
+    ring.append(np.zeros(3, dtype=np.float32))
+    with pytest.raises(ValueError):
+        ring.append(np.zeros(2, dtype=np.float32))
+
+
+def test_ring_buffer_storage_is_fixed() -> None:
+    ring = utils.RingBuffer(1000)
+    nbytes = ring.nbytes
+    rng = np.random.default_rng(3)
+    expected = np.empty(0, dtype=np.float32)
+    for _ in range(200):
+        chunk = rng.normal(size=int(rng.integers(1, 300))).astype(np.float32)
+        overflow = len(ring) + chunk.size - ring.capacity
+        if overflow > 0:
+            ring.consume(overflow)
+            expected = expected[overflow:]
+        ring.append(chunk)
+        expected = np.concatenate((expected, chunk))
+        np.testing.assert_array_equal(ring.view(), expected)
+    assert ring.nbytes == nbytes
+
+
+def test_spsc_ring_buffer_wraps_and_truncates() -> None:
+    ring = utils.SPSCRingBuffer(6)
+    assert ring.write(np.arange(4, dtype=np.float32)) == 4
+    assert ring.read(3).tolist() == [0.0, 1.0, 2.0]
+    # Wraps around the end of storage and accepts only what fits.
+    assert ring.write(np.arange(4, 10, dtype=np.float32)) == 5
+    assert len(ring) == 6 and ring.free == 0
+    assert ring.read().tolist() == [3.0, 4.0, 5.0, 6.0, 7.0, 8.0]
+    assert ring.read().size == 0
+
+
+def test_spsc_ring_buffer_hands_off_between_threads() -> None:
+    ring = utils.SPSCRingBuffer(257)
+    total = 50_000
+    received: list[np.ndarray] = []
+
+    def produce() -> None:
+        sent = 0
+        while sent < total:
+            block = np.arange(sent, min(total, sent + 100), dtype=np.float64)
+            sent += ring.write(block)
+
+    producer = threading.Thread(target=produce)
+    producer.start()
+    count = 0
+    while count < total:
+        chunk = ring.read(64)
+        received.append(chunk)
+        count += chunk.size
+    producer.join()
+    np.testing.assert_array_equal(np.concatenate(received), np.arange(total))
@@ -0,0 +1,79 @@
+"""
+Tests for the memory-mapped WAV reader.
+"""
+
+from __future__ import annotations
+
+import wave
+
+import numpy as np
+import pytest
+
+from modem import config
+from modem.rx import IncrementalFrameDecoder
+from modem.tx import write_wav
+from modem.wav import WavReader
+
+
+def test_wav_reader_streams_float_wav_written_by_tx(tmp_path, text_transmission) -> None:
+    message = "mapped"
+    waveform = text_transmission(message, repeats=2)
+    path = tmp_path / "frames.wav"
+    write_wav(waveform, path)
+
+    with WavReader(path) as reader:
+        assert reader.sample_rate == config.SAMPLE_RATE
+        assert reader.frames == waveform.size
+        chunks = list(reader.iter_chunks(chunk_samples=10_000))
+        assert max(chunk.size for chunk in chunks) == 10_000
+        np.testing.assert_array_equal(np.concatenate(chunks), waveform)
+
+        decoder = IncrementalFrameDecoder()
+        payloads = [
+            payload
+            for chunk in reader.iter_chunks(chunk_samples=10_000)
+            for _, _, payload in decoder.ingest(chunk)
+        ]
+    assert payloads == [message.encode("utf-8")] * 2
+
+
+def test_wav_reader_converts_int16_and_uses_first_channel(tmp_path) -> None:
+    left = np.array([0, 16384, -32768, 32767, -16384], dtype="<i2")
+    right = np.full_like(left, 1000)
+    path = tmp_path / "stereo.wav"
+    with wave.open(str(path), "wb") as handle:
+        handle.setnchannels(2)
+        handle.setsampwidth(2)
+        handle.setframerate(8000)
+        handle.writeframes(np.column_stack((left, right)).tobytes())
+
+    reader = WavReader(path)
+    assert (reader.sample_rate, reader.channels, reader.frames) == (8000, 2, 5)
+    np.testing.assert_allclose(reader.read(0, 5), left / 32768.0)
+    np.testing.assert_allclose(reader.read(3, 10), left[3:] / 32768.0)
+    assert [chunk.size for chunk in reader.iter_chunks(chunk_samples=2, start=1)] == [2, 2]
+
+
+def test_wav_reader_converts_int24_and_uses_first_channel(tmp_path) -> None:
+    left = np.array([0, 1 << 22, -(1 << 23), (1 << 23) - 1, -1, 12345], dtype=np.int32)
+    right = np.full_like(left, -7)
+    frames = np.column_stack((left, right)).astype("<i4").view(np.uint8).reshape(-1, 4)
+    path = tmp_path / "recorder.wav"
+    with wave.open(str(path), "wb") as handle:
+        handle.setnchannels(2)
+        handle.setsampwidth(3)
+        handle.setframerate(48_000)
+        # Little-endian 24-bit samples are the low three bytes of each int32.
+        handle.writeframes(frames[:, :3].tobytes())
+
+    reader = WavReader(path)
+    assert (reader.sample_rate, reader.channels, reader.frames) == (48_000, 2, 6)
+    np.testing.assert_allclose(reader.read(0, 6), left / float(1 << 23))
+    np.testing.assert_allclose(reader.read(4, 10), left[4:] / float(1 << 23))
+
+
+def test_wav_reader_rejects_non_wav(tmp_path) -> None:
+    path = tmp_path / "bogus.wav"
+    path.write_bytes(b"not a wav file at all")
+    with pytest.raises(ValueError):
+        WavReader(path)